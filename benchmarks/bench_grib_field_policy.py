@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+
+# (C) Copyright 2020 ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+#
+
+"""Memory and time benchmark for the "grib-field-policy" config option.
+
+A GRIB file with many messages is created by repeating the messages of a
+small example file. For each field policy it measures the time and the
+peak Python memory to:
+
+- open the file and scan the messages
+- touch every field (``for f in fl``)
+- extract a few metadata keys from every field
+- extract the same keys again (cached columns with the "temporary" policy)
+
+Time and memory are measured in separate runs since tracing the memory
+slows down the code.
+
+Usage::
+
+    python benchmarks/bench_grib_field_policy.py --repeat 5000
+"""
+
+import argparse
+import gc
+import os
+import tempfile
+import time
+import tracemalloc
+
+KEYS = ["parameter.variable", "vertical.level", "time.valid_datetime"]
+
+
+def make_file(path, repeat):
+    from earthkit.data.utils.testing import earthkit_examples_file
+
+    with open(earthkit_examples_file("tuv_pl.grib"), "rb") as f:
+        data = f.read()
+
+    with open(path, "wb") as f:
+        for _ in range(repeat):
+            f.write(data)
+
+
+def measure(name, func):
+    gc.collect()
+    start_mem = 0
+    if tracemalloc.is_tracing():
+        tracemalloc.reset_peak()
+        start_mem = tracemalloc.get_traced_memory()[0]
+
+    start = time.perf_counter()
+    r = func()
+    elapsed = time.perf_counter() - start
+
+    msg = f"  {name:<12} time={elapsed:8.3f}s"
+    if tracemalloc.is_tracing():
+        current, peak = tracemalloc.get_traced_memory()
+        msg += f"  retained={(current - start_mem) / 2**20:9.2f}MB  peak={(peak - start_mem) / 2**20:9.2f}MB"
+    print(msg)
+    return r
+
+
+def run(path, policy):
+    import earthkit.data as ekd
+
+    print(f"grib-field-policy={policy}")
+    fl = measure("open", lambda: ekd.from_source("file", path, grib_field_policy=policy).to_fieldlist())
+    measure("len", lambda: len(fl))
+    measure("iterate", lambda: sum(1 for _ in fl))
+    measure("get_columns", lambda: fl.get_columns(KEYS))
+    measure("get_columns2", lambda: fl.get_columns(KEYS))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--repeat", type=int, default=1000, help="number of copies of the 18 message example file")
+    parser.add_argument("--policy", choices=["persistent", "temporary"], nargs="*", default=["persistent", "temporary"])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.grib")
+        make_file(path, args.repeat)
+        print(f"{args.repeat * 18} fields")
+
+        for memory in (False, True):
+            print("memory" if memory else "time")
+            if memory:
+                tracemalloc.start()
+            for policy in args.policy:
+                run(path, policy)
+                gc.collect()
+            if memory:
+                tracemalloc.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+
+# (C) Copyright 2020 ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+#
+
+"""Multi-threaded throughput benchmark of the GRIB handle creation.
+
+A GRIB file with many messages is created by repeating the messages of a
+small example file. The handles of all the messages are then created (and
+optionally the values decoded) by a thread pool, using either positional
+reads (``os.pread``, no locking) or the locked ``seek`` + ``codes_new_from_file``
+fallback.
+
+Usage::
+
+    python benchmarks/bench_message_reader_threads.py --repeat 2000 --threads 1 2 4 8
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+def make_file(path, repeat):
+    from earthkit.data.utils.testing import earthkit_examples_file
+
+    with open(earthkit_examples_file("tuv_pl.grib"), "rb") as f:
+        data = f.read()
+
+    with open(path, "wb") as f:
+        for _ in range(repeat):
+            f.write(data)
+
+
+def run(path, parts, threads, decode):
+    from earthkit.data.readers.grib.handle import GribCodesReader
+
+    reader = GribCodesReader(path)
+
+    def _create(part):
+        h = reader.at_offset(*part)
+        if decode:
+            h.get_values()
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as ex:
+        for _ in ex.map(_create, parts, chunksize=256):
+            pass
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--repeat", type=int, default=1000, help="number of copies of the 18 message example file")
+    parser.add_argument("--threads", type=int, nargs="*", default=[1, 2, 4, 8])
+    parser.add_argument("--decode", action="store_true", help="decode the values as well")
+    args = parser.parse_args()
+
+    import earthkit.data as ekd
+    from earthkit.data.utils import message
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.grib")
+        make_file(path, args.repeat)
+
+        ds = ekd.from_source("file", path).to_fieldlist()
+        parts = [(p.offset, p.length) for p in (ds.part(i) for i in range(len(ds)))]
+        print(f"{len(parts)} messages")
+
+        for pread in (False, True):
+            if pread and not hasattr(os, "pread"):
+                continue
+            message.HAS_PREAD = pread
+            for n in args.threads:
+                elapsed = run(path, parts, n, args.decode)
+                name = "pread" if pread else "locked"
+                print(f"  {name:<6} threads={n:<3} time={elapsed:8.3f}s  {len(parts) / elapsed:10.0f} messages/s")
+
+
+if __name__ == "__main__":
+    main()
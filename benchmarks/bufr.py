@@ -0,0 +1,39 @@
+# (C) Copyright 2020 ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+#
+
+"""Benchmarks of the BUFR reader."""
+
+from .synthetic import bufr_file
+
+
+class BUFRFeatureList:
+    params = [10, 100, 1000]
+    param_names = ["n_messages"]
+    timeout = 600
+
+    def setup_cache(self):
+        for n in self.params:
+            bufr_file(n)
+
+    def setup(self, n_messages):
+        from earthkit.data import from_source
+
+        self.path = bufr_file(n_messages)
+        self.ds = from_source("file", self.path)
+
+    def time_scan(self, n_messages):
+        from earthkit.data import from_source
+
+        len(from_source("file", self.path).to_featurelist())
+
+    def time_to_pandas(self, n_messages):
+        self.ds.to_pandas(columns=["latitude", "longitude", "pressure", "airTemperature"])
+
+    def peakmem_to_pandas(self, n_messages):
+        self.ds.to_pandas(columns=["latitude", "longitude", "pressure", "airTemperature"])
@@ -0,0 +1,54 @@
+# (C) Copyright 2020 ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+#
+
+"""Benchmarks of the cache file management."""
+
+import os
+import tempfile
+
+
+def _create(path, args):
+    with open(path, "w") as f:
+        f.write("x")
+
+
+class CacheFile:
+    params = ["user", "off"]
+    param_names = ["cache_policy"]
+
+    N = 100
+
+    def setup(self, cache_policy):
+        from earthkit.data import config
+
+        self.tmp = tempfile.TemporaryDirectory()
+        # the config is not saved
+        self.config = config.temporary({
+            "cache-policy": cache_policy,
+            "user-cache-directory": os.path.join(self.tmp.name, "cache"),
+        })
+        self.config.__enter__()
+        self.count = 0
+
+    def teardown(self, cache_policy):
+        self.config.__exit__(None, None, None)
+        self.tmp.cleanup()
+
+    def time_cache_file_hit(self, cache_policy):
+        from earthkit.data.core.caching import cache_file
+
+        for _ in range(self.N):
+            cache_file("benchmark", _create, ["hit"])
+
+    def time_cache_file_miss(self, cache_policy):
+        from earthkit.data.core.caching import cache_file
+
+        for _ in range(self.N):
+            self.count += 1
+            cache_file("benchmark", _create, ["miss", self.count])
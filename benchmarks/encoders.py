@@ -0,0 +1,51 @@
+# (C) Copyright 2020 ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+#
+
+"""Benchmarks of the GRIB encoder."""
+
+import os
+import tempfile
+
+from .synthetic import grib_file
+
+
+class GribEncoder:
+    params = ["10x10", "1x1", "0.25x0.25", "O1280"]
+    param_names = ["grid"]
+    timeout = 600
+
+    N_FIELDS = 4
+
+    def setup_cache(self):
+        for grid in self.params:
+            grib_file(self.N_FIELDS, grid)
+
+    def setup(self, grid):
+        from earthkit.data import from_source
+        from earthkit.data.encoders.grib import GribEncoder
+
+        self.fl = from_source("file", grib_file(self.N_FIELDS, grid)).to_fieldlist()
+        self.values = self.fl[0].values + 1
+        self.encoder = GribEncoder()
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def teardown(self, grid):
+        self.tmp.cleanup()
+
+    def time_encode_values(self, grid):
+        self.encoder.encode(self.fl[0], values=self.values).to_bytes()
+
+    def time_encode_metadata(self, grid):
+        self.encoder.encode(self.fl[0], metadata={"shortName": "2t"}).to_bytes()
+
+    def time_to_target_file(self, grid):
+        self.fl.to_target("file", os.path.join(self.tmp.name, "out.grib"))
+
+    def peakmem_encode_values(self, grid):
+        self.encoder.encode(self.fl[0], values=self.values).to_bytes()
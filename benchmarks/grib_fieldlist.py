@@ -0,0 +1,113 @@
+# (C) Copyright 2020 ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+#
+
+"""Benchmarks of GRIB fieldlists with data on disk (GribFieldListInFile)."""
+
+from .synthetic import grib_file
+
+KEYS = ["parameter.variable", "vertical.level", "time.step"]
+
+
+def _open(path, **kwargs):
+    from earthkit.data import from_source
+
+    return from_source("file", path, **kwargs).to_fieldlist()
+
+
+class GribFieldListInFile:
+    params = ([10, 1000, 10000], ["persistent", "temporary"])
+    param_names = ["n_fields", "field_policy"]
+    timeout = 600
+
+    def setup_cache(self):
+        for n in self.params[0]:
+            grib_file(n)
+
+    def setup(self, n_fields, field_policy):
+        self.path = grib_file(n_fields)
+        self.fl = _open(self.path, grib_field_policy=field_policy)
+        len(self.fl)
+
+    def time_scan(self, n_fields, field_policy):
+        len(_open(self.path, grib_field_policy=field_policy))
+
+    def time_iterate(self, n_fields, field_policy):
+        for _ in self.fl:
+            pass
+
+    def time_get(self, n_fields, field_policy):
+        self.fl.get(KEYS)
+
+    def time_get_columns(self, n_fields, field_policy):
+        self.fl.get_columns(KEYS)
+
+    def peakmem_get_columns(self, n_fields, field_policy):
+        self.fl.get_columns(KEYS)
+
+
+class LargeGribFile:
+    """Scanning and iterating a file with many fields, which is only affordable with the temporary policy."""
+
+    params = [100000]
+    param_names = ["n_fields"]
+    timeout = 600
+
+    def setup_cache(self):
+        for n in self.params:
+            grib_file(n)
+
+    def setup(self, n_fields):
+        self.path = grib_file(n_fields)
+        self.fl = _open(self.path, grib_field_policy="temporary")
+        len(self.fl)
+
+    def time_scan(self, n_fields):
+        len(_open(self.path, grib_field_policy="temporary"))
+
+    def time_iterate(self, n_fields):
+        for _ in self.fl:
+            pass
+
+    def peakmem_scan(self, n_fields):
+        len(_open(self.path, grib_field_policy="temporary"))
+
+
+class GribGrids:
+    params = ["10x10", "1x1", "0.25x0.25", "O1280"]
+    param_names = ["grid"]
+    timeout = 600
+
+    N_FIELDS = 4
+
+    def setup_cache(self):
+        for grid in self.params:
+            grib_file(self.N_FIELDS, grid)
+
+    def setup(self, grid):
+        self.fl = _open(grib_file(self.N_FIELDS, grid))
+        len(self.fl)
+
+    def time_values(self, grid):
+        self.fl[0].values
+
+    def time_latlon(self, grid):
+        self.fl[0].geography.latitudes()
+        self.fl[0].geography.longitudes()
+
+    def time_to_numpy(self, grid):
+        self.fl.to_numpy()
+
+    def time_to_numpy_float32(self, grid):
+        self.fl.to_numpy(dtype="float32")
+
+    def peakmem_to_numpy(self, grid):
+        self.fl.to_numpy()
+
+    def peakmem_to_numpy_float32(self, grid):
+        self.fl.to_numpy(dtype="float32")
@@ -0,0 +1,80 @@
+# (C) Copyright 2020 ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+#
+
+"""Benchmarks of the selection, ordering and array extraction on fieldlists."""
+
+from .synthetic import grib_file
+
+
+def _open(n_fields):
+    from earthkit.data import from_source
+
+    return from_source("file", grib_file(n_fields)).to_fieldlist()
+
+
+class Index:
+    params = [10, 1000, 10000]
+    param_names = ["n_fields"]
+    timeout = 600
+
+    def setup_cache(self):
+        for n in self.params:
+            grib_file(n)
+
+    def setup(self, n_fields):
+        self.fl = _open(n_fields)
+        len(self.fl)
+
+    def time_sel(self, n_fields):
+        len(self.fl.sel({"parameter.variable": "t", "vertical.level": [500, 850]}))
+
+    def time_sel_metadata(self, n_fields):
+        len(self.fl.sel({"metadata.shortName": "t", "metadata.level": 500}))
+
+    def time_order_by(self, n_fields):
+        len(self.fl.order_by(["vertical.level", "parameter.variable"]))
+
+    def time_chained(self, n_fields):
+        r = self.fl.sel({"parameter.variable": ["t", "u"]}).sel({"vertical.level": 500})
+        r = r.order_by(["time.step"])
+        for _ in r:
+            pass
+
+    def time_isel_slice(self, n_fields):
+        r = self.fl[1::2]
+        r[len(r) // 2]
+
+    def peakmem_order_by(self, n_fields):
+        self.fl.order_by(["vertical.level", "parameter.variable"])
+
+
+class AsArray:
+    params = [10, 1000, 10000]
+    param_names = ["n_fields"]
+    timeout = 600
+
+    def setup_cache(self):
+        for n in self.params:
+            grib_file(n)
+
+    def setup(self, n_fields):
+        self.fl = _open(n_fields)
+        self.subset = self.fl.sel({"parameter.variable": ["t", "u"]})
+
+    def time_to_numpy(self, n_fields):
+        self.fl.to_numpy()
+
+    def time_values(self, n_fields):
+        self.fl.values
+
+    def time_to_numpy_subset(self, n_fields):
+        self.subset.to_numpy()
+
+    def peakmem_to_numpy(self, n_fields):
+        self.fl.to_numpy()
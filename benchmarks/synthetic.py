@@ -0,0 +1,130 @@
+# (C) Copyright 2020 ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+#
+
+"""Synthetic input data for the benchmarks.
+
+The GRIB files are generated from the ecCodes samples and the BUFR files from
+the example files shipped with the repository, so nothing is downloaded. The
+files are written once into the directory given by the ``EARTHKIT_DATA_BENCH_DIR``
+environment variable (by default ``earthkit-data-bench`` in the temporary directory)
+and reused by later runs.
+"""
+
+import os
+import tempfile
+
+PARAMS = ["t", "u", "v", "q", "z"]
+LEVELS = [1000, 925, 850, 700, 500, 400, 300, 250, 200, 150, 100, 50]
+
+# grid name -> regular lat-lon increment in degrees or octahedral Gaussian N
+GRIDS = {
+    "10x10": 10.0,
+    "1x1": 1.0,
+    "0.25x0.25": 0.25,
+    "O1280": 1280,
+}
+
+
+def data_dir():
+    path = os.environ.get("EARTHKIT_DATA_BENCH_DIR", os.path.join(tempfile.gettempdir(), "earthkit-data-bench"))
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def field_metadata(i):
+    """Return the (shortName, level, step) of the i-th synthetic field."""
+    step = i // (len(PARAMS) * len(LEVELS))
+    return PARAMS[i % len(PARAMS)], LEVELS[(i // len(PARAMS)) % len(LEVELS)], step * 6
+
+
+def _template(grid):
+    """Return the ecCodes handle of the template message and the number of points of ``grid``."""
+    import eccodes
+
+    g = GRIDS[grid]
+    if grid.startswith("O"):
+        h = eccodes.codes_grib_new_from_samples(f"reduced_gg_pl_{g}_grib2")
+        pl = [20 + 4 * i for i in range(g)]
+        pl = pl + pl[::-1]
+        eccodes.codes_set_array(h, "pl", pl)
+        n = sum(pl)
+    else:
+        h = eccodes.codes_grib_new_from_samples("regular_ll_pl_grib2")
+        ni, nj = int(round(360 / g)), int(round(180 / g)) + 1
+        for k, v in [
+            ("Ni", ni),
+            ("Nj", nj),
+            ("latitudeOfFirstGridPointInDegrees", 90.0),
+            ("longitudeOfFirstGridPointInDegrees", 0.0),
+            ("latitudeOfLastGridPointInDegrees", -90.0),
+            ("longitudeOfLastGridPointInDegrees", 360.0 - g),
+            ("iDirectionIncrementInDegrees", g),
+            ("jDirectionIncrementInDegrees", g),
+        ]:
+            eccodes.codes_set(h, k, v)
+        n = ni * nj
+    eccodes.codes_set(h, "bitsPerValue", 16)
+    return h, n
+
+
+def grib_file(n_fields, grid="10x10"):
+    """Return the path to a GRIB file with ``n_fields`` pressure level fields on ``grid``.
+
+    The fields cycle through :data:`PARAMS`, then :data:`LEVELS` and then the steps.
+    """
+    path = os.path.join(data_dir(), f"fields-{n_fields}-{grid}.grib")
+    if os.path.exists(path):
+        return path
+
+    import eccodes
+    import numpy as np
+
+    rng = np.random.default_rng(0)
+    template, n = _template(grid)
+    # a few distinct value arrays are enough
+    values = [250 + 50 * rng.random(n) for _ in range(min(n_fields, 4))]
+
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        for i in range(n_fields):
+            h = eccodes.codes_clone(template)
+            try:
+                param, level, step = field_metadata(i)
+                eccodes.codes_set(h, "shortName", param)
+                eccodes.codes_set(h, "level", level)
+                eccodes.codes_set(h, "step", step)
+                eccodes.codes_set_values(h, values[i % len(values)])
+                f.write(eccodes.codes_get_message(h))
+            finally:
+                eccodes.codes_release(h)
+    eccodes.codes_release(template)
+    os.replace(tmp, path)
+    return path
+
+
+def bufr_file(n_messages):
+    """Return the path to a BUFR file with ``n_messages`` TEMP messages."""
+    path = os.path.join(data_dir(), f"temp-{n_messages}.bufr")
+    if os.path.exists(path):
+        return path
+
+    from earthkit.data.readers.bufr.scan import BufrCodesMessagePositionIndex
+
+    src = os.path.join(os.path.dirname(__file__), "..", "docs", "source", "tutorials", "temp_10.bufr")
+    pos = BufrCodesMessagePositionIndex(src)
+    with open(src, "rb") as f:
+        data = f.read()
+    messages = [data[o : o + n] for o, n in zip(pos.offsets, pos.lengths)]
+
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        for i in range(n_messages):
+            f.write(messages[i % len(messages)])
+    os.replace(tmp, path)
+    return path
@@ -0,0 +1,38 @@
+# (C) Copyright 2020 ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+#
+
+"""Benchmarks of the conversion of GRIB fieldlists into Xarray with the earthkit engine."""
+
+from .synthetic import grib_file
+
+
+class XarrayEngine:
+    params = ([60, 1200, 12000], ["10x10", "1x1"])
+    param_names = ["n_fields", "grid"]
+    timeout = 600
+
+    def setup_cache(self):
+        for n in self.params[0]:
+            for grid in self.params[1]:
+                grib_file(n, grid)
+
+    def setup(self, n_fields, grid):
+        from earthkit.data import from_source
+
+        self.fl = from_source("file", grib_file(n_fields, grid)).to_fieldlist()
+        len(self.fl)
+
+    def time_to_xarray(self, n_fields, grid):
+        self.fl.to_xarray()
+
+    def time_to_xarray_load(self, n_fields, grid):
+        self.fl.to_xarray().load()
+
+    def peakmem_to_xarray_load(self, n_fields, grid):
+        self.fl.to_xarray().load()
@@ -228,6 +228,7 @@ xref_links = {
         "https://pyodc.readthedocs.io/en/latest/content/api.html",
     ),
     "s3cmd": ("s3cmd", "https://s3tools.org/s3cmd"),
+    "scipy": ("scipy", "https://scipy.org/"),
 }
 
 
@@ -23,6 +23,7 @@ from earthkit.data.translators import transform
 from .arguments.transformers import ALL
 from .core.caching import CACHE as cache
 from .core.config import CONFIG as config
+from .core.diagnostics import diagnostics
 from .core.field import Field
 from .core.fieldlist import FieldList, create_fieldlist
 from .encoders import create_encoder
@@ -45,6 +46,7 @@ __all__ = [
     "create_encoder",
     "create_fieldlist",
     "create_target",
+    "diagnostics",
     "download_example_file",
     "Field",
     "FieldList",
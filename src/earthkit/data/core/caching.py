@@ -29,6 +29,7 @@ from copy import deepcopy
 from random import randrange
 
 from earthkit.data.core.config import CONFIG
+from earthkit.data.core.diagnostics import count, timed, timer
 from earthkit.data.core.temporary import temp_directory
 from earthkit.data.utils import humanize
 from earthkit.data.utils.html import css
@@ -973,6 +974,7 @@ class Cache:
 CACHE = Cache()
 
 
+@timed("cache.file")
 def cache_file(
     owner: str,
     create,
@@ -1056,12 +1058,14 @@ def cache_file(
                 record = CACHE._register_cache_file(path, owner, args)
 
         if not os.path.exists(path):
+            count("cache.file.miss")
             from filelock import FileLock
 
             lock = path + ".lock"
             with FileLock(lock):
                 if not os.path.exists(path):  # Check again, another thread/process may have created the file
-                    owner_data = create(path + ".tmp", args)
+                    with timer("cache.file.create"):
+                        owner_data = create(path + ".tmp", args)
                     os.rename(path + ".tmp", path)
                     CACHE._update_entry(path, owner_data)
                     CACHE.check_size()
@@ -1070,6 +1074,8 @@ def cache_file(
                 os.unlink(lock)
             except OSError:
                 pass
+        else:
+            count("cache.file.hit")
 
     else:
         # path can be a file or a directory. We have to make the name unique.
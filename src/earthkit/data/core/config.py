@@ -99,10 +99,12 @@ class ConfigOption:
         kind=None,
         docs_default=None,
         validator=None,
+        setter=None,
     ):
         self.default = default
         self.description = description
         self.getter = getter
+        self.setter = setter
         self.none_ok = none_ok
         self.kind = kind if kind is not None else type(default)
         self.docs_default = docs_default if docs_default is not None else self.default
@@ -166,6 +168,19 @@ CONFIG_AND_HELP = {
         """Number of threads used to download data.""",
         getter="_as_int",
     ),
+    "field-level-request-cache": _(
+        False,
+        """When True, the requests of the MARS and CDS sources are expanded
+        into fields and only the fields not yet stored in the local field store are retrieved.
+        See :ref:`field_level_cache` for more information.""",
+    ),
+    "field-level-request-cache-directory": _(
+        None,
+        """Directory of the field store used when ``field-level-request-cache`` is enabled.
+        When None, the ``fields`` subdirectory of the cache directory is used.""",
+        getter="_as_str",
+        none_ok=True,
+    ),
     "cache-policy": _(
         "off",
         """Caching policy. {validator}
@@ -220,12 +235,38 @@ CONFIG_AND_HELP = {
         getter="_as_int",
         validator=IntervalValidator(Interval(8, 4096)),
     ),
-    # "grib-field-policy": _(
-    #     "persistent",
-    #     """GRIB field management policy for fieldlists with data on disk.  {validator}
-    #     See :doc:`/guide/misc/grib_memory` for more information.""",
-    #     validator=ListValidator(["persistent", "temporary"]),
-    # ),
+    "default-array-dtype": _(
+        None,
+        """Default floating point dtype of the arrays returned by the field and fieldlist
+        methods (e.g. ``to_numpy``, ``to_array``, ``data``, latitudes/longitudes and the
+        Xarray engine) when no ``dtype`` is specified. When None, the type of the underlying
+        data accessor is used (for GRIB it is ``float64``). Any spelling of a floating point
+        dtype (e.g. "float32", "f4" or ``numpy.float32``) is accepted.""",
+        getter="_as_dtype",
+        setter="_as_dtype_name",
+        none_ok=True,
+    ),
+    "grib-field-policy": _(
+        "persistent",
+        """GRIB field management policy for fieldlists with data on disk.  {validator}
+        See :doc:`/guide/misc/grib_memory` for more information.""",
+        validator=ListValidator(["persistent", "temporary"]),
+    ),
+    "message-reader-cache-size": _(
+        32,
+        """Maximum number of GRIB/BUFR files kept open to read messages from.
+        The least recently used file is closed when the limit is exceeded.""",
+        getter="_as_int",
+        validator=IntervalValidator(Interval(1, 4096)),
+    ),
+    "virtual-field-cache-size": _(
+        512,
+        """Maximum number of retrieved fields kept in memory by lazily listed
+        fieldlists (e.g. the FDB source with ``lazy=True``). It is also the maximum
+        number of fields retrieved together when the values of many fields are accessed.""",
+        getter="_as_int",
+        validator=IntervalValidator(Interval(1, 1000000)),
+    ),
     "grib-handle-policy": _(
         "cache",
         """GRIB handle management policy for fieldlists with data on disk.  {validator}
@@ -240,17 +281,69 @@ CONFIG_AND_HELP = {
         getter="_as_int",
         none_ok=True,
     ),
+    "grib-handle-cache-max-bytes": _(
+        None,
+        """Maximum total size of the GRIB messages whose handles are cached in memory per
+        fieldlist with data on disk (e.g.: 500M or 2G). When exceeded, the least recently
+        used handles are evicted. Can be set to None. Used when ``grib-handle-policy`` is ``cache``.
+        See :doc:`/guide/misc/grib_memory` for more information.""",
+        getter="_as_bytes",
+        none_ok=True,
+    ),
+    "grib-component-build-policy": _(
+        "lazy",
+        """Policy for building the components (e.g. time, vertical) of GRIB fields. {validator}
+        With ``eager`` the whole component is built from the GRIB handle on the first access
+        to any of its keys. With ``lazy`` the most frequently used keys (e.g. ``time.step``)
+        are computed only from the GRIB keys they depend on until the component is built.""",
+        validator=ListValidator(["lazy", "eager"]),
+    ),
     "use-grib-metadata-cache": _(
         True,
         """Use in-memory cache kept in each field for GRIB metadata access in
         fieldlists with data on disk.
         See :doc:`/guide/misc/grib_memory` for more information.""",
     ),
+    "multi-file-warm-workers": _(
+        0,
+        """Number of threads used to scan the messages of the files in parallel when a
+        fieldlist is opened from multiple GRIB files. When 0 the files are scanned one
+        after the other. {validator}""",
+        getter="_as_int",
+        validator=IntervalValidator(Interval(0, 1024)),
+    ),
+    "multi-file-warm-keys": _(
+        None,
+        """List of metadata keys read from each field when the files of a multi-file
+        fieldlist are scanned in parallel. See ``multi-file-warm-workers``.""",
+        getter="_as_list",
+        none_ok=True,
+    ),
+    "fieldlist-compute-method": _(
+        "loop",
+        """Method used to compute arithmetic operations and ufuncs on fieldlists. {validator}
+        With ``loop`` the operations are computed field by field. With ``stacked`` the values
+        of all the fields are stacked into a single array and the operation is applied
+        only once. ``stacked`` is faster but ufuncs must be elementwise.""",
+        validator=ListValidator(["loop", "stacked"]),
+    ),
     "grib-file-serialisation-policy": _(
         "path",
         """GRIB file serialisation policy for fieldlists with data on disk. {validator}""",
         validator=ListValidator(["path", "memory"]),
     ),
+    "diagnostics": _(
+        False,
+        """When True, the number of calls and the elapsed times of the hot paths
+        (GRIB handle creation and decoding, metadata access, message scanning, caching,
+        downloads and Xarray chunk reads) are recorded. Use :func:`earthkit.data.diagnostics`
+        to retrieve them. There is no overhead when False.""",
+    ),
+    "diagnostics-tracing": _(
+        False,
+        """When True and ``diagnostics`` is enabled, the instrumented calls are also
+        recorded as OpenTelemetry spans. Requires the ``opentelemetry-api`` package.""",
+    ),
 }
 
 
@@ -456,6 +549,8 @@ class Config:
             value = args[0]
             # Check if value is properly formatted for getter
             getattr(self, getter)(name, value, none_ok)
+            if config_item.setter is not None:
+                value = getattr(self, config_item.setter)(name, value, none_ok)
         else:
             if not isinstance(value, klass):
                 raise TypeError("Config option '%s' must be of type '%s'" % (name, klass))
@@ -585,6 +680,33 @@ class Config:
             return None
         return str(value)
 
+    def _as_dtype(self, name, value, none_ok):
+        if value is None and none_ok:
+            return None
+
+        import numpy as np
+
+        try:
+            dtype = np.dtype(value)
+        except TypeError as e:
+            raise ValueError(f"Invalid value for config option '{name}': {value}") from e
+
+        if dtype.kind != "f":
+            raise ValueError(f"Config option '{name}' must be a floating point dtype, got {value}")
+        return dtype
+
+    def _as_dtype_name(self, name, value, none_ok):
+        # the name is stored so that the config can be saved to YAML
+        dtype = self._as_dtype(name, value, none_ok)
+        return dtype.name if dtype is not None else None
+
+    def _as_list(self, name, value, none_ok):
+        if value is None and none_ok:
+            return None
+        if isinstance(value, str):
+            return [value]
+        return list(value)
+
     def _as_int(self, name, value, none_ok):
         if value is None and none_ok:
             return None
@@ -0,0 +1,310 @@
+# (C) Copyright 2020 ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+#
+
+"""Low-overhead instrumentation of the hot paths.
+
+The instrumentation is controlled by the ``diagnostics`` config option. When it is
+off the instrumented methods are the original, unwrapped functions, so there is
+no overhead at all. When it is on they are replaced by wrappers recording the
+number of calls and a histogram of the elapsed times. When the ``diagnostics-tracing``
+config option is also on and the ``opentelemetry-api`` package is installed, each
+call is also recorded as an OpenTelemetry span.
+"""
+
+import contextlib
+import functools
+import logging
+import threading
+import time
+from collections import defaultdict
+
+from earthkit.data.core.config import CONFIG
+
+LOG = logging.getLogger(__name__)
+
+# upper bounds (in seconds) of the histogram buckets: 1us, 2us, 4us ... ~69min.
+# The last bucket collects all the larger values.
+BUCKETS = tuple(2**i * 1e-6 for i in range(32))
+
+ENABLED = False
+TRACER = None
+
+_PROBES = []
+_LOCK = threading.Lock()
+
+
+class _Timer:
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+        self.histogram = [0] * (len(BUCKETS) + 1)
+
+    def add(self, elapsed):
+        self.count += 1
+        self.total += elapsed
+        if self.min is None or elapsed < self.min:
+            self.min = elapsed
+        if self.max is None or elapsed > self.max:
+            self.max = elapsed
+        # the buckets are powers of two so the index is given by the exponent
+        idx = max(0, int(elapsed * 1e6)).bit_length()
+        self.histogram[min(idx, len(BUCKETS))] += 1
+
+    def quantile(self, q):
+        if self.count == 0:
+            return None
+        target = q * self.count
+        n = 0
+        for i, c in enumerate(self.histogram):
+            n += c
+            if n >= target:
+                return BUCKETS[i] if i < len(BUCKETS) else self.max
+        return self.max
+
+    def as_dict(self):
+        return dict(
+            count=self.count,
+            total=self.total,
+            mean=self.total / self.count if self.count else None,
+            min=self.min,
+            max=self.max,
+            p50=self.quantile(0.5),
+            p90=self.quantile(0.9),
+            p99=self.quantile(0.99),
+            histogram={b: c for b, c in zip(BUCKETS + (float("inf"),), self.histogram) if c},
+        )
+
+
+class Diagnostics:
+    """Container of the counters and timers recorded by the instrumentation."""
+
+    def __init__(self):
+        self._counters = defaultdict(int)
+        self._timers = defaultdict(_Timer)
+
+    def count(self, name, n=1):
+        with _LOCK:
+            self._counters[name] += n
+
+    def record(self, name, elapsed):
+        with _LOCK:
+            self._timers[name].add(elapsed)
+
+    def snapshot(self):
+        with _LOCK:
+            return DiagnosticsSnapshot(
+                dict(self._counters),
+                {k: v.as_dict() for k, v in self._timers.items()},
+            )
+
+    def reset(self):
+        with _LOCK:
+            self._counters.clear()
+            self._timers.clear()
+
+
+class DiagnosticsSnapshot:
+    """Copy of the diagnostics recorded at a given time.
+
+    Attributes
+    ----------
+    counters: dict
+        The value of each counter.
+    timers: dict
+        The statistics of each timer: number of calls, total, mean, minimum and maximum elapsed
+        times (in seconds), estimated quantiles and the histogram of the elapsed times
+        as a dict mapping the upper bound of each non-empty bucket to the number of calls.
+    """
+
+    def __init__(self, counters, timers):
+        self.counters = counters
+        self.timers = timers
+
+    def to_pandas(self):
+        """Return the diagnostics as a pandas DataFrame with one row per counter/timer."""
+        import pandas as pd
+
+        rows = [dict(name=k, kind="counter", count=v) for k, v in sorted(self.counters.items())]
+        for k, v in sorted(self.timers.items()):
+            v = {x: y for x, y in v.items() if x != "histogram"}
+            rows.append(dict(name=k, kind="timer", **v))
+
+        columns = ["name", "kind", "count", "total", "mean", "min", "max", "p50", "p90", "p99"]
+        return pd.DataFrame(rows, columns=columns)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(counters={self.counters}, timers={list(self.timers)})"
+
+
+DIAGNOSTICS = Diagnostics()
+
+
+class _Span:
+    __slots__ = ("name", "start", "span")
+
+    def __init__(self, name):
+        self.name = name
+        self.span = None
+
+    def __enter__(self):
+        if TRACER is not None:
+            self.span = TRACER.start_as_current_span(self.name)
+            self.span.__enter__()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *args):
+        DIAGNOSTICS.record(self.name, time.perf_counter() - self.start)
+        if self.span is not None:
+            self.span.__exit__(*args)
+
+
+_NULL_CONTEXT = contextlib.nullcontext()
+
+
+def timer(name):
+    """Context manager recording the elapsed time of a block of code as ``name``.
+
+    Returns a shared no-op context manager when the instrumentation is off.
+    """
+    if ENABLED:
+        return _Span(name)
+    return _NULL_CONTEXT
+
+
+def count(name, n=1):
+    """Increment the counter ``name`` by ``n`` when the instrumentation is on."""
+    if ENABLED:
+        DIAGNOSTICS.count(name, n)
+
+
+def _wrap(name, func):
+    @functools.wraps(func)
+    def wrapped(*args, **kwargs):
+        with _Span(name):
+            return func(*args, **kwargs)
+
+    return wrapped
+
+
+class _Probe:
+    def __init__(self, name, func):
+        self.name = name
+        self.func = func
+        self.wrapped = _wrap(name, func)
+
+    def __set_name__(self, owner, attr):
+        self.owner = owner
+        self.attr = attr
+        _PROBES.append(self)
+        self.install(ENABLED)
+
+    def install(self, on):
+        setattr(self.owner, self.attr, self.wrapped if on else self.func)
+
+
+def timed(name):
+    """Decorator to instrument a function as ``name``.
+
+    Unlike :func:`instrumented` the function is always wrapped, so when the
+    instrumentation is off each call still costs an extra function call. Use it
+    for module level functions not on the hot paths.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapped(*args, **kwargs):
+            if ENABLED:
+                with _Span(name):
+                    return func(*args, **kwargs)
+            return func(*args, **kwargs)
+
+        return wrapped
+
+    return decorator
+
+
+def instrumented(name):
+    """Decorator to instrument a method as ``name``.
+
+    It can only be used on methods defined in a class body. Depending on the
+    ``diagnostics`` config option the class attribute is either the original method
+    or a wrapper timing each call.
+    """
+
+    def decorator(func):
+        return _Probe(name, func)
+
+    return decorator
+
+
+def _make_tracer():
+    try:
+        from opentelemetry import trace
+    except ImportError:
+        LOG.warning("diagnostics-tracing requires the opentelemetry-api package")
+        return None
+    return trace.get_tracer("earthkit.data")
+
+
+def _config_changed():
+    global ENABLED, TRACER
+
+    on = bool(CONFIG.get("diagnostics"))
+    tracing = on and bool(CONFIG.get("diagnostics-tracing"))
+
+    if tracing and TRACER is None:
+        TRACER = _make_tracer()
+    elif not tracing:
+        TRACER = None
+
+    if on != ENABLED:
+        ENABLED = on
+        for p in _PROBES:
+            p.install(on)
+
+
+CONFIG.on_change(_config_changed)
+_config_changed()
+
+
+def diagnostics(reset=False):
+    """Return the diagnostics recorded by the instrumentation.
+
+    Recording is only active when the ``diagnostics`` config option is True.
+
+    Parameters
+    ----------
+    reset: bool
+        When True, the recorded counters and timers are cleared after taking the snapshot.
+
+    Returns
+    -------
+    DiagnosticsSnapshot
+        The counters and timers recorded so far. Use
+        :meth:`DiagnosticsSnapshot.to_pandas` to get them as a pandas DataFrame.
+
+    Examples
+    --------
+    >>> import earthkit.data as ekd
+    >>> ekd.config.set("diagnostics", True)
+    >>> ds = ekd.from_source("sample", "test.grib").to_fieldlist()
+    >>> v = ds.to_numpy()
+    >>> ekd.diagnostics(reset=True).to_pandas()[["name", "kind", "count"]]
+                      name   kind  count
+    0   grib.handle.create  timer      2
+    1  grib.values.decode  timer      2
+    ...
+    """
+    snapshot = DIAGNOSTICS.snapshot()
+    if reset:
+        DIAGNOSTICS.reset()
+    return snapshot
@@ -15,10 +15,17 @@ from earthkit.utils.array.convert import convert_dtype
 from earthkit.utils.decorators import thread_safe_cached_property
 
 from earthkit.data.core import Base
+from earthkit.data.core.diagnostics import instrumented
 from earthkit.data.core.order import Patch, Remapping, build_remapping
 from earthkit.data.decorators import normalise
 from earthkit.data.utils.args import metadata_argument_new
-from earthkit.data.utils.array import flatten_array, outer_indexing, reshape_array, target_shape
+from earthkit.data.utils.array import (
+    default_array_dtype,
+    flatten_array,
+    outer_indexing,
+    reshape_array,
+    target_shape,
+)
 from earthkit.data.utils.compute import wrap_maths
 
 _GRIB = "grib"
@@ -681,8 +688,9 @@ class Field(Base):
             When it is True a flat ndarray is returned. Otherwise an ndarray with the field's
             :obj:`shape` is returned.
         dtype: str, numpy.dtype or None
-            Typecode or data-type of the array. When it is :obj:`None` the default
-            type used by the underlying data accessor is used. For GRIB it is ``float64``.
+            Typecode or data-type of the array. When it is :obj:`None` the ``default-array-dtype``
+            config option is used. When that is also :obj:`None` the default type used by the
+            underlying data accessor is used. For GRIB it is ``float64``.
         copy: bool
             When it is True a copy of the data is returned. Otherwise a view is returned where possible.
         index: ndarray indexing object, optional
@@ -695,6 +703,7 @@ class Field(Base):
             Field values
 
         """
+        dtype = default_array_dtype(dtype)
         v = self._components[_DATA].get_values(dtype=dtype, copy=copy)
         v = convert_array(v, array_namespace="numpy")
         v = flatten_array(v) if flatten else reshape_array(v, self.shape)
@@ -721,8 +730,9 @@ class Field(Base):
             When it is True a flat array is returned. Otherwise an array with the field's
             :obj:`shape` is returned.
         dtype: str, array.dtype or None
-            Typecode or data-type of the array. When it is :obj:`None` the default
-            type used by the underlying data accessor is used. For GRIB it is ``float64``.
+            Typecode or data-type of the array. When it is :obj:`None` the ``default-array-dtype``
+            config option is used. When that is also :obj:`None` the default type used by the
+            underlying data accessor is used. For GRIB it is ``float64``.
         copy: bool
             When it is True a copy of the data is returned. Otherwise a view is returned where possible.
         array_namespace: str, array_namespace or None
@@ -740,6 +750,7 @@ class Field(Base):
             Field values.
 
         """
+        dtype = default_array_dtype(dtype)
         v = self._components[_DATA].get_values(dtype=dtype, copy=copy)
         if array_namespace is not None:
             v = convert_array(v, array_namespace=array_namespace, device=device)
@@ -762,8 +773,9 @@ class Field(Base):
             When it is True a flat array per key is returned. Otherwise an array with the field's
             :obj:`shape` is returned for each key.
         dtype: str, array.dtype or None
-            Typecode or data-type of the arrays. When it is :obj:`None` the default
-            type used by the underlying data accessor is used. For GRIB it is ``float64``.
+            Typecode or data-type of the arrays. When it is :obj:`None` the ``default-array-dtype``
+            config option is used. When that is also :obj:`None` the default type used by the
+            underlying data accessor is used. For GRIB it is ``float64``.
         index: array indexing object, optional
             The index of the values and or the latitudes/longitudes to be extracted. When it
             is None all the values and/or coordinates are extracted.
@@ -809,6 +821,7 @@ class Field(Base):
         0.0
 
         """
+        dtype = default_array_dtype(dtype)
         _keys = dict(
             lat=self.geography.latitudes,
             lon=self.geography.longitudes,
@@ -861,6 +874,43 @@ class Field(Base):
         else:
             return eku_array_namespace(r[0]).stack(r)
 
+    def crop(self, area):
+        r"""Create a field containing only the grid points inside an area.
+
+        No data is read by this method. The returned field is a view: its values
+        are read from the original field when accessed and only the values inside
+        the area are kept. The grid points inside the area are only computed once for
+        each grid and area and then cached.
+
+        Parameters
+        ----------
+        area: :class:`~earthkit.data.utils.bbox.BoundingBox`, list, tuple, dict or polygon
+            The area. It can be a bounding box given as a :class:`~earthkit.data.utils.bbox.BoundingBox`,
+            a dict with the "north", "west", "south" and "east" keys or a (north, west, south, east)
+            list/tuple. It can also be a polygon given as a list of (lat, lon) vertices or a
+            shapely-like polygon with (lon, lat) coordinates. The bounding box includes its edges.
+
+        Returns
+        -------
+        Field
+            The field with the grid points inside the area. Its geography is an unstructured
+            list of points so its shape is ``(number_of_points,)``.
+
+        Examples
+        --------
+        >>> import earthkit.data as ekd
+        >>> f = ekd.from_source("sample", "test.grib").to_fieldlist()[0]
+        >>> c = f.crop([60, -10, 40, 20])
+        >>> c.shape
+        (35,)
+        """
+        from earthkit.data.field.handler.data import SubsetDataFieldComponentHandler
+        from earthkit.data.utils.spatial import area_subset
+
+        subset = area_subset(self.geography, area)
+        data = SubsetDataFieldComponentHandler(self._components[_DATA], subset.index)
+        return self._from_set(data=data, geography=subset.geography)
+
     def _get_component(self, key):
         if "." in key:
             component_name, name = key.split(".", 1)
@@ -945,6 +995,7 @@ class Field(Base):
         if raise_on_missing:
             raise KeyError(f"Key {key} not found in field")
 
+    @instrumented("field.metadata.get")
     def _get_fast(
         self,
         keys=None,
@@ -420,6 +420,49 @@ class FieldList(Source, Encodable):
         """
         pass
 
+    @abstractmethod
+    def get_columns(self, keys, default=None, astype=None, raise_on_missing=False, workers=None):
+        r"""Return the values for the specified keys from all the fields as columns.
+
+        Each key is resolved only once and all the keys are read from a field before
+        moving on to the next one, so for GRIB data each message is only accessed once.
+
+        Parameters
+        ----------
+        keys: str, list, tuple
+            Specify the field metadata keys to extract. See :meth:`get` for details.
+        default: Any, None
+            Specify the default value(s) for ``keys``. See :meth:`get` for details.
+        astype: type as str, int or float
+            Return type for ``keys``. See :meth:`get` for details.
+        raise_on_missing: bool
+            When True, raises KeyError if any of ``keys`` is not found.
+        workers: int, None
+            When greater than 1, the fields are split into ``workers`` contiguous chunks
+            processed in parallel by a thread pool.
+
+        Returns
+        -------
+        dict
+            Dictionary mapping each key to a 1D numpy array with one value per field. Integer,
+            float and bool values are stored in a typed array when the values have the same type
+            and none of them is missing. Otherwise the array has an object dtype.
+
+        Raises
+        ------
+        KeyError
+            If ``raise_on_missing`` is True and any of ``keys`` is not found.
+
+        Examples
+        --------
+        >>> import earthkit.data as ekd
+        >>> fl = ekd.from_source("sample", "test.grib").to_fieldlist()
+        >>> fl.get_columns(["parameter.variable", "vertical.level"])
+        {'parameter.variable': array(['2t', 'msl'], dtype=object), 'vertical.level': array([0, 0])}
+
+        """
+        pass
+
     @abstractmethod
     def metadata(self, *args, **kwargs):
         r"""Return the raw metadata values for each field.
@@ -641,7 +684,7 @@ class FieldList(Source, Encodable):
         pass
 
     @abstractmethod
-    def sel(self, *args, remapping=None, **kwargs) -> "FieldList":
+    def sel(self, *args, remapping=None, area=None, **kwargs) -> "FieldList":
         """Select the fields matching the given metadata conditions.
 
         Parameters
@@ -692,6 +735,13 @@ class FieldList(Source, Encodable):
 
             See below for a more elaborate example.
 
+        area: :class:`~earthkit.data.utils.bbox.BoundingBox`, list, tuple, dict, polygon or None
+            When specified, the selected fields are cropped to the grid points inside this area
+            (see :meth:`~earthkit.data.core.field.Field.crop`). It can be a bounding box
+            (a :class:`~earthkit.data.utils.bbox.BoundingBox`, a dict or a (north, west, south, east)
+            list/tuple) or a polygon (a list of (lat, lon) vertices or a shapely-like polygon). The
+            grid points inside the area are computed only once per grid and cached, and the
+            values are only read when accessed.
         **kwargs: dict, optional
             Other keyword arguments specifying the filter conditions.
 
@@ -990,6 +1040,70 @@ class FieldList(Source, Encodable):
         """
         pass
 
+    @abstractmethod
+    def map_batches(self, func, batch_size=None, group_by=None, workers=None, shared_memory=True):
+        """Apply a function to batches of the fieldlist in a pool of processes.
+
+        The fieldlist is split into batches (see :meth:`batched` and :meth:`group_by`), which are
+        pickled and sent to the worker processes. Fields read from GRIB files are pickled as a
+        reference to the file path and message offset, so the workers reopen the messages
+        instead of receiving a copy of the data.
+
+        Parameters
+        ----------
+        func: callable
+            Function called with each batch (a fieldlist) as its single argument. It must be
+            picklable, e.g. a function defined at module level.
+        batch_size: int, None
+            Number of fields in a batch. When None, the fieldlist is split into ``workers``
+            batches of equal size. Ignored when ``group_by`` is specified.
+        group_by: str, list, tuple, None
+            Metadata keys defining the batches. See :meth:`group_by`.
+        workers: int, None
+            Number of worker processes. When None, the number of CPUs is used. When 1,
+            the batches are processed serially in the current process.
+        shared_memory: bool
+            When True, the numpy arrays returned by ``func`` (also when nested in a
+            list, tuple or dict) are sent back to the current process through shared
+            memory instead of being pickled.
+
+        Returns
+        -------
+        list
+            The results of ``func`` for each batch in the order of the batches.
+
+        Examples
+        --------
+        >>> import earthkit.data as ekd
+        >>> def mean(fl):
+        ...     return fl.to_numpy().mean(axis=1)
+        ...
+        >>> fl = ekd.from_source("sample", "tuv_pl.grib").to_fieldlist()
+        >>> r = fl.map_batches(mean, group_by="parameter.variable", workers=3)
+        >>> len(r)
+        3
+
+        """
+        pass
+
+    @abstractmethod
+    def lazy(self):
+        """Create a lazily evaluated arithmetic expression from the fieldlist.
+
+        Operators applied on the returned object only build an expression, which is
+        evaluated in a single pass on the stacked field values when ``compute()`` is called.
+        No intermediate fieldlists are created.
+
+        Returns
+        -------
+        :class:`~earthkit.data.utils.compute.Expression`
+
+        Examples
+        --------
+        >>> r = ((a.lazy() - b) * c).compute()
+        """
+        pass
+
     @abstractmethod
     def _unary_op(self, oper):
         pass
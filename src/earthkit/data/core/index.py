@@ -7,8 +7,11 @@
 # nor does it submit to any jurisdiction.
 #
 
+import bisect
 import functools
+import itertools
 import logging
+import os
 from abc import abstractmethod
 
 from earthkit.utils.decorators import thread_safe_cached_property
@@ -215,18 +218,23 @@ class Index(Source, Encodable):
         return self._getitem(n)
 
     def _from_slice(self, s):
-        indices = range(len(self))[s]
+        import numpy as np
+
+        indices = np.arange(*s.indices(len(self)), dtype=np.int64)
         return self.new_mask_index(self, indices)
 
     def _from_mask(self, lst):
-        indices = [i for i, x in enumerate(lst) if x]
-        return self.new_mask_index(self, indices)
+        import numpy as np
+
+        return self.new_mask_index(self, as_index_array(np.asarray(lst, dtype=bool)))
 
     def _from_sequence(self, s):
         return self.new_mask_index(self, s)
 
     def _from_ndarray(self, a):
-        return self._from_sequence(a.tolist())
+        if a.dtype == bool:
+            return self._from_mask(a)
+        return self._from_sequence(a)
 
     @abstractmethod
     def _getitem(self, n):
@@ -584,10 +592,67 @@ class Index(Source, Encodable):
         return group_by(self, *keys, sort=sort, mode="indexed")
 
 
+def warm_indexes(indexes, workers=None, keys=None):
+    """Build the indexes of ``indexes`` in parallel.
+
+    The length of each object is computed, which e.g. scans the messages of a GRIB
+    file. When ``keys`` is set the metadata ``keys`` of each element are read as well.
+    Returns ``indexes``.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(indexes))
+
+    def _warm(index):
+        if len(index) > 0 and keys:
+            index.get(keys)
+
+    if workers < 2:
+        for index in indexes:
+            _warm(index)
+    else:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(_warm, indexes))
+
+    return indexes
+
+
+def as_index_array(indices):
+    """Convert ``indices`` into a 1D numpy int64 array. A boolean sequence is used as a mask."""
+    import numpy as np
+
+    if isinstance(indices, range):
+        return np.arange(indices.start, indices.stop, indices.step, dtype=np.int64)
+
+    if not isinstance(indices, (np.ndarray, list, tuple)):
+        indices = list(indices)
+    a = np.asarray(indices)
+    if a.size == 0:
+        return np.empty(0, dtype=np.int64)
+    if a.dtype == bool:
+        return np.flatnonzero(a).astype(np.int64, copy=False)
+    if a.dtype.kind not in "iu":
+        raise TypeError(f"Indices must be integers, got dtype={a.dtype}")
+    return a.astype(np.int64, copy=False).reshape(-1)
+
+
 class MaskIndex(Index):
     def __init__(self, index, indices):
+        indices = as_index_array(indices)
+        if indices.size > 0 and indices.min() < 0:
+            indices = indices.copy()
+            indices[indices < 0] += len(index)
+
+        # compose nested masks eagerly so that the elements are always
+        # looked up with a single indirection into the root index
+        if isinstance(index, MaskIndex):
+            indices = index._indices[indices]
+            index = index._index
+
         self._index = index
-        self._indices = list(indices)
+        self._indices = indices
         # super().__init__(
         #     *self.index._init_args,
         #     order_by=self.index._init_order_by,
@@ -595,7 +660,7 @@ class MaskIndex(Index):
         # )
 
     def _getitem(self, n):
-        n = self._indices[n]
+        n = int(self._indices[n])
         return self._index[n]
 
     def __len__(self):
@@ -624,15 +689,46 @@ class MultiIndex(Index):
             return self
         return self.__class__(i.sel(*args, **kwargs) for i in self._indexes)
 
+    @thread_safe_cached_property
+    def _offsets(self):
+        # the cumulative lengths of the indexes, _offsets[-1] is the total length
+        return list(itertools.accumulate(len(i) for i in self._indexes))
+
+    def warm(self, workers=None, keys=None):
+        """Eagerly build the indexes of all the underlying objects in parallel.
+
+        Parameters
+        ----------
+        workers: int, None
+            The number of threads. When None the number of CPUs is used.
+        keys: str, list of str, None
+            Metadata keys to pre-read from each element. The values are only kept
+            when the elements cache their metadata.
+
+        Returns
+        -------
+        self
+        """
+        warm_indexes(self._indexes, workers=workers, keys=keys)
+        self._offsets
+        return self
+
     def _getitem(self, n):
-        k = 0
-        while n >= len(self._indexes[k]):
-            n -= len(self._indexes[k])
-            k += 1
+        offsets = self._offsets
+        total = offsets[-1] if offsets else 0
+        if n < 0:
+            n += total
+        if n < 0 or n >= total:
+            raise IndexError(f"Index {n} out of range for {total} elements")
+
+        k = bisect.bisect_right(offsets, n)
+        if k > 0:
+            n -= offsets[k - 1]
         return self._indexes[k][n]
 
     def __len__(self):
-        return sum(len(i) for i in self._indexes)
+        offsets = self._offsets
+        return offsets[-1] if offsets else 0
 
     def graph(self, depth=0):
         print(" " * depth, self.__class__.__name__)
@@ -0,0 +1,85 @@
+# (C) Copyright 2020 ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+#
+
+
+from .source import SourceData
+
+
+class CatalogueData(SourceData):
+    """Represent a GRIB catalogue.
+
+    This data is generated with the :ref:`data-sources-catalogue` source.
+
+    Catalogue data only allows conversion into a fieldlist with the following methods:
+
+    - :py:func:`to_fieldlist`
+    - :py:func:`sel`
+
+    """
+
+    _TYPE_NAME = "Catalogue"
+
+    @property
+    def available_types(self):
+        """list[str]: Return the list of available types that this data object can be converted to."""
+        return [self._FIELDLIST]
+
+    def describe(self):
+        """Provide a description of the catalogue data.
+
+        Returns
+        -------
+        :py:class:`earthkit.data.utils.summary.DataDescriber`
+            A DataDescriber object containing a description of the catalogue data.
+        """
+        from earthkit.data.utils.summary import DataDescriber
+
+        return DataDescriber(title="GRIB catalogue", types=self.available_types)
+
+    def __repr__(self) -> str:
+        return f"CatalogueData(path={self._source.path}, db={self._source.catalogue.db})"
+
+    def _repr_html_(self) -> str:
+        return self.describe()._repr_html_()
+
+    def to_fieldlist(self, *args, **kwargs):
+        """Convert into a FieldList.
+
+        First, the catalogue is brought up to date: the new and modified files are scanned
+        and the deleted files are dropped. This is only done once for each data object.
+        Next, the messages matching the filter conditions on the catalogue keys are looked
+        up in the catalogue and loaded into a FieldList, without opening the other files.
+        Finally, if there are other keys in the filter conditions, then
+        :py:func:`earthkit.data.core.fieldlist.FieldList.sel` is called on the FieldList
+        with these keys as filter conditions.
+
+        Parameters
+        ----------
+        *args: tuple
+            Positional arguments specifying the filter condition as dict.
+        **kwargs: dict, optional
+            Other keyword arguments specifying the filter conditions.
+
+        Returns
+        -------
+        :py:class:`earthkit.data.core.fieldlist.FieldList`
+            A FieldList matching the filter conditions.
+        """
+        return self._source.to_fieldlist(*args, **kwargs)
+
+    def sel(self, *args, **kwargs):
+        """Select the messages matching the filter conditions.
+
+        The same as :py:func:`to_fieldlist`.
+        """
+        return self.to_fieldlist(*args, **kwargs)
+
+    def update(self):
+        """Scan the new and modified files and drop the deleted ones from the catalogue."""
+        self._source.update()
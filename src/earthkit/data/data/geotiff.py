@@ -69,15 +69,30 @@ class GeoTIFFData(SourceData):
     def _repr_html_(self) -> str:
         return self.describe()._repr_html_()
 
-    def to_fieldlist(self):
+    def to_fieldlist(self, bbox=None, window=None, overview_level=None):
         """Convert into a FieldList.
 
+        Each band is a field. The values are only read from disk when accessed, and
+        when a subset is specified only the blocks of the file intersecting it are read.
+
+        Parameters
+        ----------
+        bbox: :class:`~earthkit.data.utils.bbox.BoundingBox`, list, tuple, None, optional
+            Only read the part of the raster inside this geographic bounding box. A list or tuple
+            is interpreted as (north, west, south, east) in degrees.
+        window: :class:`rasterio.windows.Window`, tuple, None, optional
+            Only read this pixel window of the raster. A tuple is interpreted as
+            ((row_start, row_stop), (col_start, col_stop)).
+        overview_level: int, None, optional
+            Read this overview (reduced resolution version) of the raster instead of the full
+            resolution one. The first overview is 0.
+
         Returns
         -------
         :py:class:`earthkit.data.readers.geotiff.fieldlist.GeoTIFFFieldList`
             A FieldList containing the GeoTIFF data.
         """
-        return self._reader.to_fieldlist()
+        return self._reader.to_fieldlist(bbox=bbox, window=window, overview_level=overview_level)
 
     def to_pandas(self, *args, **kwargs) -> "pandas.DataFrame":
         """Convert into a Pandas DataFrame.
@@ -89,7 +104,9 @@ class GeoTIFFData(SourceData):
         """
         return self._reader.to_pandas(**kwargs)
 
-    def to_xarray(self, rioxarray_open_rasterio_kwargs=None, **kwargs) -> "xarray.Dataset":
+    def to_xarray(
+        self, rioxarray_open_rasterio_kwargs=None, bbox=None, window=None, overview_level=None, **kwargs
+    ) -> "xarray.Dataset":
         """Convert into an Xarray dataset.
 
         The conversion is done by using ``rioxarray``.
@@ -108,6 +125,15 @@ class GeoTIFFData(SourceData):
                         "mask_and_scale": True,
                         "decode_times": True,
                     }
+        bbox: :class:`~earthkit.data.utils.bbox.BoundingBox`, list, tuple, None, optional
+            Only read the part of the raster inside this geographic bounding box. A list or tuple
+            is interpreted as (north, west, south, east) in degrees.
+        window: :class:`rasterio.windows.Window`, tuple, None, optional
+            Only read this pixel window of the raster. A tuple is interpreted as
+            ((row_start, row_stop), (col_start, col_stop)).
+        overview_level: int, None, optional
+            Read this overview (reduced resolution version) of the raster instead of the full
+            resolution one. The first overview is 0.
         **kwargs
             Keyword arguments passed to :func:`rioxarray.open_rasterio` if
             ``rioxarray_open_rasterio_kwargs`` is not specified, otherwise they are ignored.
@@ -117,4 +143,10 @@ class GeoTIFFData(SourceData):
         :py:class:`xarray.Dataset`
             An Xarray dataset containing the GeoTIFF data.
         """
-        return self._reader.to_xarray(rioxarray_open_rasterio_kwargs=rioxarray_open_rasterio_kwargs, **kwargs)
+        return self._reader.to_xarray(
+            rioxarray_open_rasterio_kwargs=rioxarray_open_rasterio_kwargs,
+            bbox=bbox,
+            window=window,
+            overview_level=overview_level,
+            **kwargs,
+        )
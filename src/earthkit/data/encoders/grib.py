@@ -743,8 +743,11 @@ class GribEncoder(Encoder):
         return GribEncodedData(new_handle, template_field=template_field)
 
     def _encode_fieldlist(self, fs, *, target=None, **kwargs):
-        for f in fs:
-            yield f._encode(self, target=target, **kwargs)
+        # targets with an encoding pipeline pack the messages in a worker pool
+        pipeline = getattr(target, "_pipeline", None)
+        if pipeline is not None:
+            return pipeline.map(lambda f: f._encode(self, target=target, **kwargs), fs)
+        return (f._encode(self, target=target, **kwargs) for f in fs)
 
     def _encode_xarray(self, data, *, target=None, **kwargs):
         accessor = data.earthkit
@@ -13,7 +13,7 @@ from typing import Optional
 
 import numpy as np
 
-from earthkit.data.utils.array import adjust_array
+from earthkit.data.utils.array import adjust_array, default_array_dtype
 from earthkit.data.utils.bbox import BoundingBox
 from earthkit.data.utils.grid import ECKIT_GRID_SUPPORT
 from earthkit.data.utils.projections import Projection
@@ -244,6 +244,9 @@ class GeographyBase(SimpleFieldComponent):
 
     """
 
+    # True when unique_grid_id() is derived from the grid definition, not only from its shape
+    HAS_UNIQUE_GRID_ID = False
+
     @mark_get_key
     @abstractmethod
     def latitudes(self, dtype=None) -> Optional[np.ndarray]:
@@ -527,9 +530,9 @@ class GeographyBase(SimpleFieldComponent):
             When it is True 1D arrays are returned. Otherwise arrays with the field's
             :obj:`shape` are returned.
         dtype: str, array.dtype or None
-            Typecode or data-type of the arrays. When it is :obj:`None` the default
-            type used by the underlying data accessor is used. For GRIB it is
-            ``float64``.
+            Typecode or data-type of the arrays. When it is :obj:`None` the ``default-array-dtype``
+            config option is used. When that is also :obj:`None` the default type used by the
+            underlying data accessor is used. For GRIB it is ``float64``.
 
 
         Returns
@@ -542,8 +545,9 @@ class GeographyBase(SimpleFieldComponent):
         to_points
 
         """
-        lat = self.latitudes()
-        lon = self.longitudes()
+        dtype = default_array_dtype(dtype)
+        lat = self.latitudes(dtype=dtype)
+        lon = self.longitudes(dtype=dtype)
         lat = adjust_array(lat, flatten=flatten, dtype=dtype)
         lon = adjust_array(lon, flatten=flatten, dtype=dtype)
 
@@ -558,9 +562,9 @@ class GeographyBase(SimpleFieldComponent):
             When it is True 1D arrays are returned. Otherwise arrays with the field's
             :obj:`shape` are returned.
         dtype: str, array.dtype or None
-            Typecode or data-type of the arrays. When it is :obj:`None` the default
-            type used by the underlying data accessor is used. For GRIB it is
-            ``float64``.
+            Typecode or data-type of the arrays. When it is :obj:`None` the ``default-array-dtype``
+            config option is used. When that is also :obj:`None` the default type used by the
+            underlying data accessor is used. For GRIB it is ``float64``.
 
         Returns
         -------
@@ -572,6 +576,7 @@ class GeographyBase(SimpleFieldComponent):
         to_points
 
         """
+        dtype = default_array_dtype(dtype)
         x = self.x(dtype=dtype)
         y = self.y(dtype=dtype)
 
@@ -827,6 +832,8 @@ class MeshedLatLonGeography(LatLonGeography):
 
 
 class GridsSpecBasedGeography(GeographyBase):
+    HAS_UNIQUE_GRID_ID = True
+
     def __init__(self, grid_or_grid_spec) -> None:
         from eckit.geo import Grid
 
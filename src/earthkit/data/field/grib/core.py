@@ -12,12 +12,63 @@ import logging
 
 from earthkit.utils.decorators import thread_safe_cached_property
 
+from earthkit.data.core.config import CONFIG
 from earthkit.data.field.handler.core import LazyFieldComponentHandler
 
 LOG = logging.getLogger(__name__)
 
 
+class _LazyKeyHandle:
+    """Give access to the declared GRIB keys of a handle only."""
+
+    __slots__ = ("handle", "keys")
+
+    def __init__(self, handle, keys):
+        self.handle = handle
+        self.keys = keys
+
+    def _check(self, key):
+        if key not in self.keys:
+            raise KeyError(f"GRIB key={key} is not a declared dependency")
+
+    def get(self, key, *args, **kwargs):
+        self._check(key)
+        return self.handle.get(key, *args, **kwargs)
+
+    def is_defined(self, key):
+        self._check(key)
+        return self.handle.is_defined(key)
+
+
+class GribLazyKey:
+    """A key of a GRIB field component computed without building the whole component.
+
+    Parameters
+    ----------
+    grib_keys: tuple of str
+        The GRIB keys the value depends on. Only these keys can be read from the handle.
+    func: callable
+        Compute the value from a handle giving access to ``grib_keys``. Must return the same
+        value as the corresponding method of the component built by the eager builder.
+    """
+
+    def __init__(self, grib_keys, func):
+        self.grib_keys = frozenset(grib_keys)
+        self.func = func
+
+    def __call__(self, handle):
+        return self.func(_LazyKeyHandle(handle, self.grib_keys))
+
+
 class GribFieldComponentHandler(LazyFieldComponentHandler):
+    """Field component handler built from a GRIB handle.
+
+    The component is built by ``BUILDER.build()`` on the first access. When
+    ``grib-component-build-policy`` is ``lazy``, the keys in ``BUILDER.LAZY_KEYS`` are
+    computed directly from their GRIB dependencies until the component is built, so
+    e.g. ``time.step`` does not read the date and time keys.
+    """
+
     BUILDER = None
     COLLECTOR = None
 
@@ -28,6 +79,26 @@ class GribFieldComponentHandler(LazyFieldComponentHandler):
     def from_handle(cls, handle):
         return cls(handle)
 
+    def get(self, key, default=None, *, astype=None, raise_on_missing=False):
+        # "_c__handler" is where thread_safe_cached_property stores the built handler
+        if self._exception is None and "_c__handler" not in self.__dict__:
+            lazy = getattr(self.BUILDER, "LAZY_KEYS", {}).get(key)
+            if lazy is not None and CONFIG.get("grib-component-build-policy") == "lazy":
+                try:
+                    v = lazy(self.handle)
+                except Exception:
+                    # the eager build reports or handles the error
+                    LOG.debug(f"Cannot compute key={key} lazily, building the component", exc_info=True)
+                else:
+                    if astype and v is not None and callable(astype):
+                        try:
+                            return astype(v)
+                        except Exception:
+                            return default
+                    return v
+
+        return self._handler.get(key, default=default, astype=astype, raise_on_missing=raise_on_missing)
+
     @thread_safe_cached_property
     def _handler(self):
         try:
@@ -8,6 +8,7 @@
 #
 
 
+from earthkit.data.core.diagnostics import instrumented
 from earthkit.data.field.handler.data import DataFieldComponentHandler
 
 from .collector import GribContextCollector
@@ -29,15 +30,23 @@ COLLECTOR = GribDataContextCollector()
 
 class GribData(DataFieldComponentHandler):
     COLLECTOR = COLLECTOR
+    SUPPORTS_INDEX = True
 
     def __init__(self, handle):
         self.handle = handle
 
+    @instrumented("grib.values.decode")
     def get_values(self, dtype=None, copy=True, index=None):
-        """Get the values stored in the field as an array."""
+        """Get the values stored in the field as an array.
+
+        When ``index`` is specified only the values at these indices of the flat array
+        of values are returned.
+        """
         # the code below relies on the fact that get_values() of
         # the GRIB handle always returns a new array (i.e. a copy of the data)
         v = self.handle.get_values(dtype=dtype)
+        if index is not None:
+            v = v[index]
         if dtype is not None:
             from earthkit.utils.array import array_namespace
 
@@ -9,10 +9,32 @@
 
 
 from .collector import GribContextCollector
-from .core import GribFieldComponentHandler
+from .core import GribFieldComponentHandler, GribLazyKey
+
+
+def _member(handle):
+    v = handle.get("number", default=None)
+    if v is None:
+        v = handle.get("perturbationNumber", default=None)
+    return v
+
+
+def _lazy_member(handle):
+    v = _member(handle)
+    return str(v) if isinstance(v, int) else v
+
+
+_MEMBER_KEY = GribLazyKey(("number", "perturbationNumber"), _lazy_member)
 
 
 class GribEnsembleBuilder:
+    # the keys computed without building the component, with their GRIB dependencies
+    LAZY_KEYS = {
+        "member": _MEMBER_KEY,
+        "realisation": _MEMBER_KEY,
+        "realization": _MEMBER_KEY,
+    }
+
     @staticmethod
     def build(handle):
         from earthkit.data.field.component.ensemble import Ensemble
@@ -25,15 +47,8 @@ class GribEnsembleBuilder:
 
     @staticmethod
     def _build_dict(handle):
-        def _get(key, default=None):
-            return handle.get(key, default=default)
-
-        v = _get("number")
-        if v is None:
-            v = _get("perturbationNumber")
-
         return dict(
-            member=v,
+            member=_member(handle),
         )
 
 
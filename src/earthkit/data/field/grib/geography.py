@@ -14,6 +14,7 @@ from earthkit.utils.decorators import thread_safe_cached_property
 
 from earthkit.data.field.component.component import _normalise_set_kwargs
 from earthkit.data.field.component.geography import GeographyBase, _create_geography_from_dict
+from earthkit.data.utils.array import default_array_dtype
 from earthkit.data.utils.grid import ECKIT_GRID_SUPPORT
 
 from .collector import GribContextCollector
@@ -29,13 +30,17 @@ def missing_is_none(x):
 class GribGeography(GeographyBase):
     # If this class is used, it means that eckit-geo does not support the grid
     # so we need to fallback to the legacy grid handling in ecCodes
+    HAS_UNIQUE_GRID_ID = True
+
     def __init__(self, handle):
         self.handle = handle
 
     def latitudes(self, dtype=None):
+        dtype = default_array_dtype(dtype)
         return self.handle.get_latitudes(dtype=dtype).reshape(self.shape())
 
     def longitudes(self, dtype=None):
+        dtype = default_array_dtype(dtype)
         return self.handle.get_longitudes(dtype=dtype).reshape(self.shape())
 
     def distinct_latitudes(self, dtype=None):
@@ -11,7 +11,19 @@ from earthkit.data.field.component.parameter import create_parameter
 from earthkit.data.field.handler.parameter import ParameterFieldComponentHandler
 
 from .collector import GribContextCollector
-from .core import GribFieldComponentHandler
+from .core import GribFieldComponentHandler, GribLazyKey
+
+
+def _variable(handle):
+    v = handle.get("shortName", default=None)
+    if v == "~":
+        v = handle.get("paramId", ktype=str, default=None)
+    if v is None:
+        v = handle.get("param", default=None)
+    return v
+
+
+_VARIABLE_KEY = GribLazyKey(("shortName", "paramId", "param"), _variable)
 
 
 class GribParameterBuilder:
@@ -26,6 +38,12 @@ class GribParameterBuilder:
     metadata contents.
     """
 
+    # the keys computed without building the component, with their GRIB dependencies
+    LAZY_KEYS = {
+        "variable": _VARIABLE_KEY,
+        "param": _VARIABLE_KEY,
+    }
+
     @staticmethod
     def build(handle):
         d = GribParameterBuilder._build_dict(handle)
@@ -39,12 +57,7 @@ class GribParameterBuilder:
             return handle.get(key, default=default)
 
         # Core metadata keys for identifying the parameter
-        v = _get("shortName", None)
-        if v == "~":
-            v = handle.get("paramId", ktype=str, default=None)
-        if v is None:
-            v = _get("param", None)
-        variable = v
+        variable = _variable(handle)
         standard_name = _get("cfName", None)
 
         if standard_name == "unknown":
@@ -7,15 +7,58 @@
 # nor does it submit to any jurisdiction.
 #
 
-from earthkit.data.utils.dates import datetime_from_grib, datetime_to_grib, step_to_grib, to_timedelta
+from earthkit.data.utils.dates import datetime_from_grib, datetime_to_grib, step_to_grib, to_datetime, to_timedelta
 
 from .collector import GribContextCollector
-from .core import GribFieldComponentHandler
+from .core import GribFieldComponentHandler, GribLazyKey
 
 ZERO_TIMEDELTA = to_timedelta(0)
 
 
+def _datetime(handle, date_key, time_key):
+    date = handle.get(date_key, default=None)
+    if date is not None:
+        time = handle.get(time_key, default=None)
+        if time is not None:
+            return datetime_from_grib(date, time)
+    return None
+
+
+def _base_datetime(handle):
+    v = _datetime(handle, "dataDate", "dataTime")
+    return to_datetime(v) if v is not None else None
+
+
+def _step(handle):
+    end = handle.get("endStep", default=None)
+    if end is None:
+        end = handle.get("step", default=None)
+
+    if end is None:
+        return ZERO_TIMEDELTA
+    return to_timedelta(end)
+
+
+def _valid_datetime(handle):
+    return _base_datetime(handle) + _step(handle)
+
+
+_BASE_KEYS = ("dataDate", "dataTime")
+_STEP_KEYS = ("endStep", "step")
+
+
 class GribTimeBuilder:
+    # the keys computed without building the component, with their GRIB dependencies
+    LAZY_KEYS = {
+        "base_datetime": GribLazyKey(_BASE_KEYS, _base_datetime),
+        "forecast_reference_time": GribLazyKey(_BASE_KEYS, _base_datetime),
+        "base_date": GribLazyKey(_BASE_KEYS, lambda h: _base_datetime(h).date()),
+        "base_time": GribLazyKey(_BASE_KEYS, lambda h: _base_datetime(h).time()),
+        "step": GribLazyKey(_STEP_KEYS, _step),
+        "forecast_period": GribLazyKey(_STEP_KEYS, _step),
+        "valid_datetime": GribLazyKey(_BASE_KEYS + _STEP_KEYS, _valid_datetime),
+    }
+
     @staticmethod
     def build(handle):
         from earthkit.data.field.handler.time import TimeFieldComponentHandler
@@ -26,41 +69,16 @@ class GribTimeBuilder:
 
     @staticmethod
     def _build_dict(handle):
-        def _get(key, default=None):
-            return handle.get(key, default=default)
-
-        def _datetime(date_key, time_key):
-            date = _get(date_key, None)
-            if date is not None:
-                time = _get(time_key, None)
-                if time is not None:
-                    return datetime_from_grib(date, time)
-            return None
-
-        base = _datetime("dataDate", "dataTime")
-
-        end = _get("endStep")
-        if end is None:
-            end = _get("step")
-
-        if end is None:
-            end = ZERO_TIMEDELTA
-        else:
-            end = to_timedelta(end)
-
         r = dict(
-            base_datetime=base,
-            step=end,
+            base_datetime=_datetime(handle, "dataDate", "dataTime"),
+            step=_step(handle),
         )
 
-        fc_month = None
-        indexing = None
         if handle.is_defined("forecastMonth"):
-            fc_month = _get("forecastMonth")
+            fc_month = handle.get("forecastMonth", default=None)
             if fc_month is not None:
-                indexing = _datetime("indexingDate", "indexingTime")
                 r["forecast_month"] = fc_month
-                r["indexing_datetime"] = indexing
+                r["indexing_datetime"] = _datetime(handle, "indexingDate", "indexingTime")
 
         return r
 
@@ -20,7 +20,7 @@ from earthkit.data.field.component.level_type import (
 )
 
 from .collector import GribContextCollector
-from .core import GribFieldComponentHandler
+from .core import GribFieldComponentHandler, GribLazyKey
 
 
 class GribHybridLevelParameters(HybridLevelParametersBase):
@@ -343,7 +343,35 @@ def register_grib_level_type(
     return grib_level_type
 
 
+def _grib_level_type(handle):
+    level_type = handle.get("typeOfLevel", default=None)
+    t = _GRIB_TYPES.get(level_type)
+    if t is None:
+        from earthkit.data.field.component.level_type import get_level_type
+
+        # level, layer = from_grib(handle)
+        component = get_level_type(level_type)
+        t = register_grib_level_type(
+            key=level_type,
+            component_type=component,
+        )
+
+    if t is None:
+        raise ValueError(f"Unsupported level type: {level_type}")
+
+    return t
+
+
 class GribVerticalBuilder:
+    # the keys computed without building the component, with their GRIB dependencies
+    LAZY_KEYS = {
+        "level": GribLazyKey(
+            ("typeOfLevel", "level", "topLevel", "bottomLevel"),
+            lambda h: _grib_level_type(h).from_grib(h)["level"],
+        ),
+        "level_type": GribLazyKey(("typeOfLevel",), lambda h: _grib_level_type(h).component_type.name),
+    }
+
     @staticmethod
     def build(handle):
         from earthkit.data.field.component.vertical import Vertical
@@ -356,21 +384,7 @@ class GribVerticalBuilder:
 
     @staticmethod
     def _build_dict(handle):
-        level_type = handle.get("typeOfLevel", default=None)
-        t = _GRIB_TYPES.get(level_type)
-        if t is None:
-            from earthkit.data.field.component.level_type import get_level_type
-
-            # level, layer = from_grib(handle)
-            component = get_level_type(level_type)
-            t = register_grib_level_type(
-                key=level_type,
-                component_type=component,
-            )
-
-        if t is None:
-            raise ValueError(f"Unsupported level type: {level_type}")
-
+        t = _grib_level_type(handle)
         r = t.from_grib(handle)
         return r
 
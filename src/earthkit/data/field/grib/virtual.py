@@ -7,7 +7,10 @@
 # nor does it submit to any jurisdiction.
 #
 
+import itertools
 import logging
+import threading
+from collections import OrderedDict
 
 from earthkit.utils.decorators import thread_safe_cached_property
 
@@ -17,6 +20,162 @@ from earthkit.data.indexing.indexed import IndexFieldListBase
 LOG = logging.getLogger(__name__)
 
 
+def request_key(request):
+    """Return a hashable key of a field request in which the equal values compare equal."""
+    from earthkit.data.utils.field_store import normalise_field_value
+
+    return tuple(sorted((k, normalise_field_value(k, v)) for k, v in request.items()))
+
+
+class FieldLRUCache:
+    """Bounded store of the retrieved fields keyed by their request.
+
+    The least recently used field is evicted when the size given by the
+    ``virtual-field-cache-size`` config option (or by ``size``) is exceeded.
+    """
+
+    def __init__(self, size=None):
+        self._size = size
+        self.fields = OrderedDict()
+        self.lock = threading.Lock()
+
+    @property
+    def size(self):
+        if self._size is not None:
+            return self._size
+        from earthkit.data.core.config import CONFIG
+
+        return CONFIG.get("virtual-field-cache-size")
+
+    def get(self, key):
+        with self.lock:
+            field = self.fields.get(key)
+            if field is not None:
+                self.fields.move_to_end(key)
+            return field
+
+    def put(self, key, field):
+        with self.lock:
+            self.fields[key] = field
+            self.fields.move_to_end(key)
+            while len(self.fields) > self.size:
+                self.fields.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.fields.clear()
+
+    def __len__(self):
+        return len(self.fields)
+
+
+class RetrievalCoalescer:
+    """Retrieve the fields of many requests with a few multi-field retrievals.
+
+    The requests not in the cache are factorised into compact sub-requests, which are
+    retrieved concurrently with ``retriever``. The returned messages are matched to
+    the requests by using their metadata. The requests that cannot be matched
+    are retrieved one by one.
+
+    Parameters
+    ----------
+    retriever: object
+        Object with a ``get(request)`` method returning the fields of ``request``.
+    cache: :class:`FieldLRUCache`, optional
+        The store of the retrieved fields. When None a new one is created.
+    """
+
+    def __init__(self, retriever, cache=None):
+        self.retriever = retriever
+        self.cache = cache if cache is not None else FieldLRUCache()
+
+    def get(self, requests):
+        """Return the fields of ``requests`` as a list in the order of ``requests``."""
+        keys = [request_key(r) for r in requests]
+        result = {}
+        missing = {}
+        for k, r in zip(keys, requests):
+            field = self.cache.get(k)
+            if field is not None:
+                result[k] = field
+            else:
+                missing.setdefault(k, r)
+
+        if missing:
+            result.update(self._retrieve(missing))
+        return [result[k] for k in keys]
+
+    def _retrieve(self, missing):
+        from earthkit.data.core.config import CONFIG
+        from earthkit.data.core.thread import SoftThreadPool
+        from earthkit.data.utils.factorise import factorise
+
+        subrequests = list(factorise(list(missing.values())).iterate())
+        LOG.debug(f"Retrieving {len(missing)} fields with {len(subrequests)} requests")
+
+        nthreads = min(CONFIG.get("number-of-download-threads"), len(subrequests))
+        if nthreads < 2:
+            found = [self._retrieve_one(r) for r in subrequests]
+        else:
+            with SoftThreadPool(nthreads=nthreads) as pool:
+                futures = [pool.submit(self._retrieve_one, r) for r in subrequests]
+                found = [f.result() for f in futures]
+
+        result = {}
+        for r in found:
+            result.update(r)
+
+        for k, r in missing.items():
+            if k not in result:
+                LOG.debug(f"Retrieving unmatched field {r}")
+                result[k] = self.retriever.get(r)[0]
+            self.cache.put(k, result[k])
+
+        return {k: result[k] for k in missing}
+
+    def _retrieve_one(self, subrequest):
+        """Retrieve ``subrequest`` and match the messages to its fields.
+
+        Returns a dict mapping the request keys to the matched fields.
+        """
+        fields = self.retriever.get({k: list(v) for k, v in subrequest.items()})
+
+        names = list(subrequest.keys())
+        expanded = [dict(zip(names, x)) for x in itertools.product(*subrequest.values())]
+        if len(fields) != len(expanded):
+            LOG.debug(f"Expected {len(expanded)} fields, got {len(fields)} for {subrequest}")
+            return {}
+
+        if len(expanded) == 1:
+            return {request_key(expanded[0]): fields[0]}
+
+        from earthkit.data.utils.field_store import GRIB_ALIASES, normalise_field_value
+
+        varying = {k: v for k, v in subrequest.items() if len(v) > 1}
+        metadata_keys = sorted({f"metadata.{a}" for k in varying for a in GRIB_ALIASES.get(k, (k,))})
+
+        result = {}
+        for f in fields:
+            md = f.get(metadata_keys, output=dict)
+            field = {k: v[0] for k, v in subrequest.items()}
+            for k, values in varying.items():
+                candidates = {normalise_field_value(k, md[f"metadata.{a}"]) for a in GRIB_ALIASES.get(k, (k,))}
+                match = [v for v in values if normalise_field_value(k, v) in candidates]
+                if len(match) != 1:
+                    break
+                field[k] = match[0]
+            else:
+                result[request_key(field)] = f
+
+        return result
+
+    def __getstate__(self):
+        return {"retriever": self.retriever}
+
+    def __setstate__(self, state):
+        self.__init__(state["retriever"])
+
+
 class VirtualData(DataFieldComponentHandler):
     def __init__(self, owner, request):
         self.owner = owner
@@ -28,7 +187,7 @@ class VirtualData(DataFieldComponentHandler):
 
     @property
     def _field(self):
-        return self.owner.retriever.get(self.request)[0]
+        return self.owner.coalescer.get([self.request])[0]
 
     def __getstate__(self):
         state = {}
@@ -58,6 +217,7 @@ class VirtualGribFieldList(IndexFieldListBase):
     def __init__(self, request_mapper, retriever):
         self.request_mapper = request_mapper
         self.retriever = retriever
+        self.coalescer = RetrievalCoalescer(retriever)
 
         self._reference_cache = {}
 
@@ -69,7 +229,7 @@ class VirtualGribFieldList(IndexFieldListBase):
 
     @thread_safe_cached_property
     def reference(self):
-        return self.retriever.get(self.request_mapper.request_at(0))[0]
+        return self.coalescer.get([self.request_mapper.request_at(0)])[0]
 
     def _getitem(self, n):
         if isinstance(n, int):
@@ -83,6 +243,34 @@ class VirtualGribFieldList(IndexFieldListBase):
             else:
                 return make_virtual_grib_field(self, self.request_mapper.request_at(n))
 
+    def _bulk_array(self, accessor, indices=None, **kwargs):
+        """Read the values of the fields at ``indices`` with coalesced retrievals.
+
+        The fields are retrieved in batches of at most ``virtual-field-cache-size`` fields.
+        """
+        if accessor not in ("values", "to_numpy", "to_array") or len(self) == 0:
+            return None
+
+        if indices is None:
+            indices = range(len(self))
+
+        def _vals(f):
+            return f.values if accessor == "values" else getattr(f, accessor)(**kwargs)
+
+        from earthkit.utils.array import array_namespace as eku_array_namespace
+
+        r = None
+        for start in range(0, len(indices), self.coalescer.cache.size):
+            batch = indices[start : start + self.coalescer.cache.size]
+            fields = self.coalescer.get([self.request_mapper.request_at(i) for i in batch])
+            for i, f in enumerate(fields, start=start):
+                vals = _vals(f)
+                if r is None:
+                    xp = eku_array_namespace(vals)
+                    r = xp.empty((len(indices), *vals.shape), dtype=vals.dtype, device=xp.device(vals))
+                r[i] = vals
+        return r
+
     def _get_reference(self, param):
         if param in self._reference_cache:
             return self._reference_cache[param]
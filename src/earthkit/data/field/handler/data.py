@@ -32,6 +32,8 @@ class BaseDataFieldComponentHandler(FieldComponentHandler):
     # ALL_KEYS = ("values",)
     # SET_KEYS = ("values",)
     NAME = "data"
+    # True when get_values() accepts the "index" argument
+    SUPPORTS_INDEX = False
 
     @property
     def component(self):
@@ -336,6 +338,43 @@ class ArrayDataFieldComponentHandler(DataFieldComponentHandler):
         self.__init__(state["_values"])
 
 
+class SubsetDataFieldComponentHandler(DataFieldComponentHandler):
+    """Data component of a field holding a subset of the values of another data component.
+
+    The values are only read when accessed. When the other data component supports
+    the ``index`` argument in ``get_values()`` it is passed on, otherwise the values
+    are read in full and indexed afterwards.
+
+    Parameters
+    ----------
+    data: DataFieldComponentHandler
+        The data component holding all the values.
+    index: array-like
+        The indices of the values in the flattened array of all the values.
+    """
+
+    def __init__(self, data, index):
+        self.data = data
+        self.index = index
+
+    def get_values(self, dtype=None, copy=True):
+        if getattr(self.data, "SUPPORTS_INDEX", False):
+            return self.data.get_values(dtype=dtype, copy=False, index=self.index)
+
+        # indexing with an integer array always creates a copy
+        v = flatten_array(self.data.get_values(dtype=dtype, copy=False))
+        return v[self.index]
+
+    def __getstate__(self):
+        state = {}
+        state["data"] = self.data
+        state["index"] = self.index
+        return state
+
+    def __setstate__(self, state):
+        self.__init__(state["data"], state["index"])
+
+
 class OffLoader:
     def __init__(self, field):
         self.field = field
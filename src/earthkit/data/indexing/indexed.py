@@ -13,8 +13,9 @@ from earthkit.utils.array import array_namespace as eku_array_namespace
 from earthkit.utils.decorators import thread_safe_cached_property
 
 from earthkit.data.core.fieldlist import FieldList
-from earthkit.data.core.index import Index, MaskIndex, MultiIndex
+from earthkit.data.core.index import Index, MaskIndex, MultiIndex, as_index_array
 from earthkit.data.core.order import build_remapping
+from earthkit.data.utils.array import default_array_dtype
 from earthkit.data.utils.compute import wrap_maths
 
 from .pandas import PandasMixIn
@@ -85,7 +86,7 @@ class IndexForFieldList(Index):
             progress_bar=progress_bar,
         )
 
-    def sel(self, *args, remapping=None, **kwargs) -> "FieldList":
+    def sel(self, *args, remapping=None, area=None, **kwargs) -> "FieldList":
         """Select the fields matching the given metadata conditions.
 
         Parameters
@@ -136,6 +137,13 @@ class IndexForFieldList(Index):
 
             See below for a more elaborate example.
 
+        area: :class:`~earthkit.data.utils.bbox.BoundingBox`, list, tuple, dict, polygon or None
+            When specified, the selected fields are cropped to the grid points inside this area
+            (see :meth:`~earthkit.data.core.field.Field.crop`). It can be a bounding box
+            (a :class:`~earthkit.data.utils.bbox.BoundingBox`, a dict or a (north, west, south, east)
+            list/tuple) or a polygon (a list of (lat, lon) vertices or a shapely-like polygon). The
+            grid points inside the area are computed only once per grid and cached, and the
+            values are only read when accessed.
         **kwargs: dict, optional
             Other keyword arguments specifying the filter conditions.
 
@@ -201,7 +209,13 @@ class IndexForFieldList(Index):
         Field(u,1000,20180801,1200,0,0)
         Field(t,850,20180801,1200,0,0)
         """
-        return super().sel(*args, remapping=remapping, **kwargs)
+        r = super().sel(*args, remapping=remapping, **kwargs)
+        if area is not None:
+            r = r._crop(area)
+        return r
+
+    def _crop(self, area):
+        return self.from_fields([f.crop(area) for f in self])
 
     def order_by(self, *args, remapping=None, patch=None, **kwargs):
         """Change the order of the fields in a fieldlist.
@@ -354,6 +368,71 @@ class IndexForFieldList(Index):
         return super().group_by(*keys, sort=sort)
 
 
+# number of fields whose metadata is held in memory at once by ls() and describe()
+SUMMARY_CHUNK_SIZE = 10000
+
+_COLUMN_DTYPES = {bool: "bool", int: "int64", float: "float64"}
+
+
+def _column_getter(key, default, astype, raise_on_missing):
+    """Return a function extracting ``key`` from a field.
+
+    The key is split into its component and name only once. Keys without a component,
+    and keys of the raw "metadata" component, go through the generic field access.
+    """
+    component_name, _, name = key.partition(".")
+    if name and component_name != "metadata":
+
+        def _get(f):
+            component = f._components.get(component_name)
+            if component is not None:
+                return component.get(name, default=default, astype=astype, raise_on_missing=raise_on_missing)
+            return f._get_single(key, default=default, astype=astype, raise_on_missing=raise_on_missing)
+
+        return _get
+
+    def _get(f):
+        return f._get_single(key, default=default, astype=astype, raise_on_missing=raise_on_missing)
+
+    return _get
+
+
+def _collect_columns(fields, getters):
+    """Read all the keys from one field before moving to the next one."""
+    columns = [[] for _ in getters]
+    for f in fields:
+        for g, c in zip(getters, columns):
+            c.append(g(f))
+    return columns
+
+
+def _to_column(values, astype=None):
+    """Convert a list of values into a 1D numpy array.
+
+    Numeric and bool values are stored in a typed array when all the values have
+    the same type and none of them is missing. All other values are stored in an
+    array of objects.
+    """
+    import numpy as np
+
+    dtype = _COLUMN_DTYPES.get(astype)
+    if dtype is None:
+        types = set(map(type, values))
+        if len(types) == 1:
+            dtype = _COLUMN_DTYPES.get(types.pop())
+
+    if dtype is not None and not any(v is None for v in values):
+        try:
+            return np.array(values, dtype=dtype)
+        except (TypeError, ValueError, OverflowError):
+            pass
+
+    column = np.empty(len(values), dtype=object)
+    for i, v in enumerate(values):
+        column[i] = v
+    return column
+
+
 @wrap_maths
 class IndexFieldListBase(XarrayMixIn, PandasMixIn, IndexForFieldList, FieldList):
     @property
@@ -361,14 +440,19 @@ class IndexFieldListBase(XarrayMixIn, PandasMixIn, IndexForFieldList, FieldList)
         return self._as_array("values")
 
     def to_numpy(self, **kwargs):
+        kwargs["dtype"] = default_array_dtype(kwargs.get("dtype"))
         return self._as_array("to_numpy", empty_array_namespace="numpy", **kwargs)
 
     def to_array(self, **kwargs):
+        kwargs["dtype"] = default_array_dtype(kwargs.get("dtype"))
         ns = kwargs.get("array_namespace", None)
         return self._as_array("to_array", empty_array_namespace=ns, **kwargs)
 
     def _as_array(self, accessor, empty_array_namespace=None, **kwargs):
         """Helper to use pre-allocated target array to store the field values."""
+        r = self._bulk_array(accessor, **kwargs)
+        if r is not None:
+            return r
 
         def _vals(f):
             return getattr(f, accessor)(**kwargs) if not is_property else getattr(f, accessor)
@@ -393,6 +477,15 @@ class IndexFieldListBase(XarrayMixIn, PandasMixIn, IndexForFieldList, FieldList)
 
         return r
 
+    def _bulk_array(self, accessor, indices=None, **kwargs):
+        """Return the values of the fields at ``indices`` (all the fields when None)
+        stacked into a single array.
+
+        Subclasses able to read the values of multiple fields at once can override it.
+        Returns None when no such fast path is available.
+        """
+        return None
+
     def data(self, keys=("lat", "lon", "value"), flatten=False, dtype=None, index=None):
         if isinstance(keys, str):
             keys = [keys]
@@ -400,6 +493,8 @@ class IndexFieldListBase(XarrayMixIn, PandasMixIn, IndexForFieldList, FieldList)
         if any(k not in ("lat", "lon", "value") for k in keys):
             raise ValueError(f"data: invalid argument: {keys}")
 
+        dtype = default_array_dtype(dtype)
+
         if self._has_shared_geography:
             if "lat" in keys or "lon" in keys:
                 lat, lon = self[0].geography.latlons(flatten=flatten, dtype=dtype)
@@ -503,6 +598,43 @@ class IndexFieldListBase(XarrayMixIn, PandasMixIn, IndexForFieldList, FieldList)
                 vals = [f._get_fast(keys, output=list, **_kwargs) for f in self]
                 return [[x[i] for x in vals] for i in range(len(keys))]
 
+    def get_columns(self, keys, default=None, astype=None, raise_on_missing=False, workers=None):
+        from earthkit.data.utils.args import metadata_argument_new
+
+        if isinstance(keys, str):
+            keys = [keys]
+        keys, astype, default, _ = metadata_argument_new(keys, astype=astype, default=default)
+        if keys is None:
+            raise TypeError(f"get_columns: keys must be a str, list or tuple, got {type(keys)}")
+
+        getters = [_column_getter(k, d, t, raise_on_missing) for k, d, t in zip(keys, default, astype)]
+
+        num = len(self)
+        if workers is not None and workers > 1 and num > 1:
+            from concurrent.futures import ThreadPoolExecutor
+
+            chunk = -(-num // workers)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(_collect_columns, (self[i] for i in range(start, min(start + chunk, num))), getters)
+                    for start in range(0, num, chunk)
+                ]
+                columns = [[] for _ in keys]
+                for future in futures:
+                    for c, part in zip(columns, future.result()):
+                        c.extend(part)
+        else:
+            columns = _collect_columns(self, getters)
+
+        return {k: _to_column(c, t) for k, c, t in zip(keys, columns, astype)}
+
+    def map_batches(self, func, batch_size=None, group_by=None, workers=None, shared_memory=True):
+        from earthkit.data.utils.parallel import map_batches
+
+        return map_batches(
+            self, func, batch_size=batch_size, group_by=group_by, workers=workers, shared_memory=shared_memory
+        )
+
     def metadata(self, keys, **kwargs):
         if isinstance(keys, str):
             keys = "metadata." + keys
@@ -534,7 +666,19 @@ class IndexFieldListBase(XarrayMixIn, PandasMixIn, IndexForFieldList, FieldList)
             return self[0].default_ls_keys
         return []
 
+    def _iter_columns(self, keys, pos_range=None):
+        """Generate the columns for ``keys`` in chunks of at most SUMMARY_CHUNK_SIZE fields."""
+        if pos_range is None:
+            pos_range = range(len(self))
+
+        chunk_size = SUMMARY_CHUNK_SIZE
+        for start in range(pos_range.start, pos_range.stop, chunk_size):
+            stop = min(start + chunk_size, pos_range.stop)
+            fields = self if start == 0 and stop == len(self) else self[start:stop]
+            yield fields.get_columns(keys)
+
     def ls(self, n=None, keys="default", extra_keys=None, collections=None):
+        from earthkit.data.utils.summary import concat_columns
         from earthkit.data.utils.summary import ls as summary_ls
 
         def _proc(n: int, keys: str | list | tuple = None, collections: str | list | tuple = None):
@@ -545,6 +689,12 @@ class IndexFieldListBase(XarrayMixIn, PandasMixIn, IndexForFieldList, FieldList)
                 pos = slice(0, min(num, n)) if n > 0 else slice(num - min(num, -n), num)
             pos_range = range(pos.start, pos.stop)
 
+            if keys and not collections:
+                return concat_columns(self._iter_columns(keys, pos_range))
+
+            return _rows(pos_range, keys, collections)
+
+        def _rows(pos_range, keys, collections):
             default = None
             astype = None
             if keys and len(pos_range) > 0:
@@ -589,12 +739,13 @@ class IndexFieldListBase(XarrayMixIn, PandasMixIn, IndexForFieldList, FieldList)
         r"""Generate a summary of the fieldlist."""
         from earthkit.data.utils.summary import format_describe
 
-        def _proc():
-            for f in self:
-                # PW: TODO: `default` and `astype` kwargs of `f._get_fast()` might need to be aligned with `keys`
-                yield (f._get_fast(self._describe_keys, output=dict))
+        keys = self._describe_keys
+        if isinstance(keys, dict):
+            chunks = ({keys[k]: v for k, v in c.items()} for c in self._iter_columns(list(keys)))
+        else:
+            chunks = self._iter_columns(keys)
 
-        return format_describe(_proc(), *args, **kwargs)
+        return format_describe(chunks, *args, **kwargs)
 
     def to_fieldlist(self, array_namespace=None, device=None, flatten=False, dtype=None):
         return self.from_fields([
@@ -617,17 +768,23 @@ class IndexFieldListBase(XarrayMixIn, PandasMixIn, IndexForFieldList, FieldList)
 
         return Field._normalise_key_values(**kwargs)
 
+    def lazy(self):
+        from earthkit.data.utils.compute import Expression
+
+        return Expression(None, self)
+
     def _unary_op(self, oper):
         from earthkit.data.utils.compute import get_method
 
-        method = "loop"
-        return get_method(method).unary_op(oper, self)
+        return get_method().unary_op(oper, self)
 
     def _binary_op(self, oper, y):
-        from earthkit.data.utils.compute import get_method
+        from earthkit.data.utils.compute import Expression, get_method
 
-        method = "loop"
-        r = get_method(method).binary_op(oper, self, y)
+        if isinstance(y, Expression):
+            return self.lazy()._binary_op(oper, y)
+
+        r = get_method().binary_op(oper, self, y)
         return r
 
     def to_target(self, target, *args, **kwargs):
@@ -667,6 +824,15 @@ class MaskFieldList(IndexFieldListBase, MaskIndex):
     def __init__(self, *args, **kwargs):
         MaskIndex.__init__(self, *args, **kwargs)
 
+    def _bulk_array(self, accessor, indices=None, **kwargs):
+        if not hasattr(self._index, "_bulk_array") or len(self) == 0:
+            return None
+        if indices is None:
+            indices = self._indices
+        else:
+            indices = self._indices[as_index_array(indices)]
+        return self._index._bulk_array(accessor, indices, **kwargs)
+
 
 class MultiFieldList(IndexFieldListBase, MultiIndex):
     def __init__(self, *args, **kwargs):
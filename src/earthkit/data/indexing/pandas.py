@@ -12,32 +12,166 @@ import logging
 LOG = logging.getLogger(__name__)
 
 
+class _Selection:
+    """Grid points selected from a single grid."""
+
+    def __init__(self, lat, lon, index=None, point=None, distance=None):
+        self.index = index
+        self.lat = lat if index is None else lat[index]
+        self.lon = lon if index is None else lon[index]
+        self.point = point
+        self.distance = distance
+
+    def __len__(self):
+        return len(self.lat)
+
+
 class PandasMixIn:
-    def to_pandas(self, latitude=None, longitude=None, **kwargs):
+    def to_pandas(self, latitude=None, longitude=None, nearest=None, radius=None, layout="tidy", **kwargs):
+        """Convert the FieldList into a Pandas DataFrame.
+
+        The coordinates are only computed once for each distinct grid and the values of all
+        the fields are written into a single preallocated columnar block.
+
+        Parameters
+        ----------
+        latitude: number, array-like, None
+            Latitude(s) of the point(s) to extract (in degrees). When None, all the grid
+            points are extracted.
+        longitude: number, array-like, None
+            Longitude(s) of the point(s) to extract (in degrees). Must have the same number
+            of elements as ``latitude``.
+        nearest: int, None
+            When specified, the ``nearest`` grid points to each of the ``latitude`` and
+            ``longitude`` points are extracted. When neither ``nearest`` nor ``radius`` are
+            specified only the grid points exactly matching the ``latitude`` and
+            ``longitude`` are extracted.
+        radius: float, None
+            When specified, the grid points within this great-circle distance (in km) from
+            each of the ``latitude`` and ``longitude`` points are extracted. Can be combined
+            with ``nearest``.
+        layout: str
+            The layout of the generated DataFrame. The possible values are:
+
+            - "tidy": one row per field and grid point with the "lat", "lon", "value" and
+              "datetime" columns. When ``nearest`` or ``radius`` is specified the "point"
+              (the index of the query point) and "distance" (in km) columns are also added.
+            - "wide": one row per field indexed by "datetime" and one column per grid point,
+              labelled by ("lat", "lon"). All the fields must be on the same grid.
+
+        Returns
+        -------
+        pandas.DataFrame
+
+        Notes
+        -----
+        The spatial index used by ``nearest`` and ``radius`` is built on the ECEF coordinates of
+        the grid points and cached for each grid. It uses :xref:`scipy` when available. The grids
+        are identified by their unique grid id when it is derived from the grid definition (e.g.
+        GRIB), otherwise by a digest of their coordinates.
+        """
         import numpy as np
         import pandas as pd
 
-        def ident(x):
-            return x
-
-        filter = ident
-
-        def select_point(d):
-            idx = np.where((d["lat"] == latitude) & (d["lon"] == longitude))
-            return dict(lat=d["lat"][idx], lon=d["lon"][idx], value=d["value"][idx])
-
-        if latitude is not None or longitude is not None:
-            filter = select_point
-
-        frames = []
-        for s in self:
-            lat, lon = s.geography.latlons(flatten=True)
-            d = {
-                "lat": lat,
-                "lon": lon,
-                "value": s.values.flatten(),
-            }
-            df = pd.DataFrame.from_dict(filter(d))
-            df["datetime"] = s.time.valid_datetime()
-            frames.append(df)
-        return pd.concat(frames)
+        if layout not in ("tidy", "wide"):
+            raise ValueError(f"Invalid layout={layout}, must be 'tidy' or 'wide'")
+
+        if (latitude is None) != (longitude is None):
+            raise ValueError("latitude and longitude must be specified together")
+
+        if latitude is None and (nearest is not None or radius is not None):
+            raise ValueError("nearest and radius require latitude and longitude")
+
+        if latitude is not None:
+            latitude = np.atleast_1d(np.asarray(latitude, dtype=np.float64)).ravel()
+            longitude = np.atleast_1d(np.asarray(longitude, dtype=np.float64)).ravel()
+            if latitude.shape != longitude.shape:
+                raise ValueError("latitude and longitude must have the same number of elements")
+
+        spatial = nearest is not None or radius is not None
+
+        def _select(geography, lat, lon):
+            if latitude is None:
+                return _Selection(lat, lon)
+            if not spatial:
+                match = np.zeros(lat.shape, dtype=bool)
+                for a, b in zip(latitude, longitude):
+                    match |= (lat == a) & (lon == b)
+                return _Selection(lat, lon, index=np.flatnonzero(match))
+
+            tree = spatial_index(geography, lat, lon)
+            if nearest is not None:
+                point, index, distance = tree.nearest(latitude, longitude, n=nearest, radius=radius)
+            else:
+                point, index, distance = tree.within(latitude, longitude, radius)
+            return _Selection(lat, lon, index=index, point=point, distance=distance)
+
+        from earthkit.data.utils.spatial import grid_key, spatial_index
+
+        # compute the selection once per grid
+        selections = {}
+        field_selections = []
+        for f in self:
+            lat = lon = None
+            if not f.geography.HAS_UNIQUE_GRID_ID:
+                lat, lon = f.geography.latlons(flatten=True)
+            key = grid_key(f.geography, lat, lon)
+            sel = selections.get(key)
+            if sel is None:
+                if lat is None:
+                    lat, lon = f.geography.latlons(flatten=True)
+                sel = selections[key] = _select(f.geography, lat, lon)
+            field_selections.append(sel)
+
+        shared = len(set(map(id, field_selections))) == 1
+        if layout == "wide" and not shared:
+            raise ValueError("layout='wide' requires all the fields to be on the same grid")
+
+        if len(field_selections) == 0:
+            columns = ["lat", "lon", "value", "datetime"] + (["point", "distance"] if spatial else [])
+            return pd.DataFrame(columns=columns)
+
+        counts = np.array([len(s) for s in field_selections], dtype=np.intp)
+        offsets = np.concatenate(([0], np.cumsum(counts)))
+        total = int(offsets[-1])
+
+        datetimes = pd.DatetimeIndex([f.time.valid_datetime() for f in self])
+
+        values = np.empty(total, dtype=np.float64)
+        if shared and len(field_selections[0]) > 0 and field_selections[0].index is None:
+            # shared grid without point selection: read all the values in one go
+            values[:] = self.to_numpy(flatten=True).ravel()
+        else:
+            for i, (f, sel) in enumerate(zip(self, field_selections)):
+                if counts[i] > 0:
+                    v = f.to_numpy(flatten=True)
+                    values[offsets[i] : offsets[i + 1]] = v if sel.index is None else v[sel.index]
+
+        if layout == "wide":
+            sel = field_selections[0]
+            columns = pd.MultiIndex.from_arrays([sel.lat, sel.lon], names=["lat", "lon"])
+            return pd.DataFrame(
+                values.reshape(len(counts), len(sel)),
+                index=pd.Index(datetimes, name="datetime"),
+                columns=columns,
+            )
+
+        def _column(name):
+            if shared:
+                return np.tile(getattr(field_selections[0], name), len(counts))
+            r = np.empty(total, dtype=getattr(field_selections[0], name).dtype)
+            for i, sel in enumerate(field_selections):
+                r[offsets[i] : offsets[i + 1]] = getattr(sel, name)
+            return r
+
+        data = {
+            "lat": _column("lat"),
+            "lon": _column("lon"),
+            "value": values,
+            "datetime": datetimes.repeat(counts),
+        }
+        if spatial:
+            data["point"] = _column("point")
+            data["distance"] = _column("distance")
+
+        return pd.DataFrame(data)
@@ -38,7 +38,33 @@ class StreamFieldList(IndexFieldListBase, Source):
     def __getstate__(self):
         raise NotImplementedError("StreamFieldList cannot be pickled")
 
-    def to_xarray(self, **kwargs):
+    def to_xarray(self, streaming=False, batch_size=100, coords=None, store=None, **kwargs):
+        """Convert the stream into an Xarray dataset.
+
+        Parameters
+        ----------
+        streaming: bool
+            When False, all the fields are first collected from the stream and then converted
+            in one go. When True, the layout of the dataset is created from the first batch
+            of fields and the values of each incoming batch are copied into preallocated
+            arrays, so the fields are released as soon as they are processed.
+            See :class:`~earthkit.data.xr_engine.stream.StreamDatasetBuilder`.
+        batch_size: int
+            The number of fields converted at once in streaming mode.
+        coords: dict, None
+            The coordinate values of the dimensions in streaming mode. Must be specified for
+            the dimensions whose values are not all present in the first batch.
+        store: str, None
+            In streaming mode, the directory where the data arrays are stored as memory-mapped
+            files. When None, the arrays are allocated in memory.
+        **kwargs: dict, optional
+            Keyword arguments passed to :meth:`FieldList.to_xarray`.
+        """
+        if streaming:
+            from earthkit.data.xr_engine.stream import StreamDatasetBuilder
+
+            return StreamDatasetBuilder(batch_size=batch_size, coords=coords, store=store, **kwargs).build(self)
+
         from .simple import SimpleFieldList
 
         fields = [f for f in self]
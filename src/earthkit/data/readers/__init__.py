@@ -108,6 +108,11 @@ class Reader(Loader, Encodable, os.PathLike):
         return None
 
     def _path_info(self):
+        # the file cannot be used as a whole when only parts of it are read
+        source = self.source
+        if source is not self and getattr(source, "parts", None):
+            return None
+
         if self.path and os.path.exists(self.path):
             from earthkit.data.utils.path_info import LoaderPathInfo
 
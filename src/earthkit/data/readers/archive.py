@@ -10,15 +10,23 @@
 import logging
 import os
 
+from earthkit.data.core.config import CONFIG
+
 from . import Reader
 from . import reader as find_reader
 
 LOG = logging.getLogger(__name__)
 
+# Formats that can be read directly from the archive file using parts
+IN_PLACE_MAGICS = (b"GRIB", b"BUFR")
+
 
 class ArchiveReader(Reader):
     def __init__(self, source, path):
         super().__init__(source, path)
+        # members read in place: (name, part, magic) and extracted members: (name, path)
+        self._in_place = None
+        self._extracted = None
 
     def check(self, member):
         # A bit of paranoia
@@ -52,7 +60,69 @@ class ArchiveReader(Reader):
 
         return self
 
-    def expand(self, archive, members, **kwargs):
+    def member_info(self, member):
+        """Return an object with the ``TarInfo`` interface for the member."""
+        return member
+
+    def member_part(self, archive, member):
+        """Return the location of the member data in the archive file as a
+        ``SimplePart`` or None if the member cannot be read in place.
+        """
+        return None
+
+    def expand(self, archive, members, in_place=False, **kwargs):
+        """Make the archive members available for reading.
+
+        When ``in_place`` is True, the GRIB and BUFR members whose data is stored
+        uncompressed are read directly from the archive file using parts, and only
+        the rest of the members are extracted into the cache. Otherwise, all the
+        members are extracted.
+        """
+        if in_place and not self.stream and self._index(archive, members, **kwargs):
+            return
+
+        self.path = self._extract(archive, members, **kwargs)
+
+    def _index(self, archive, members, **kwargs):
+        from .directory import make_file_filter
+
+        filter = make_file_filter(self.filter, self.path)
+        n_bytes = CONFIG.get("reader-type-check-bytes")
+
+        in_place = []
+        rest = []
+        with open(self.path, "rb") as f:
+            for member in members:
+                info = self.member_info(member)
+                if not self.check(member) or not info.isfile():
+                    continue
+
+                name = info.name
+                if not filter(os.path.join(self.path, name)):
+                    continue
+
+                part = self.member_part(archive, member)
+                if part is not None and part.length > 0:
+                    f.seek(part.offset)
+                    magic = f.read(min(n_bytes, part.length))
+                    if magic[:4] in IN_PLACE_MAGICS:
+                        in_place.append((name, part, magic))
+                        continue
+                rest.append(member)
+
+        if not in_place:
+            return False
+
+        LOG.debug("Reading %s members in place from %s", len(in_place), self.path)
+
+        self._in_place = in_place
+        self._extracted = []
+        if rest:
+            target = self._extract(archive, rest, **kwargs)
+            self._extracted = [(self.member_info(m).name, os.path.join(target, self.member_info(m).name)) for m in rest]
+        return True
+
+    def _extract(self, archive, members, **kwargs):
         def unpack(target, args):
             try:
                 os.mkdir(target)
@@ -73,12 +143,50 @@ class ArchiveReader(Reader):
             fsize = 0
             mtime = 0
 
-        self.path = self._cache_file(
+        args = [self.path, fsize, mtime]
+        if self._in_place is not None:
+            # only some of the members are extracted
+            args.append(sorted(self.member_info(m).name for m in members))
+
+        return self._cache_file(
             unpack,
-            [self.path, fsize, mtime],
+            args,
             extension=".d",
             replace=self.path,
         )
 
+    def mutate_source(self):
+        if self._in_place is None:
+            return None
+
+        from earthkit.data.sources import _from_source_internal
+        from earthkit.data.sources.file import FileSource
+
+        from . import _find_reader
+
+        def _member_reader(magic):
+            def _reader(source, path):
+                return _find_reader("reader", source, path, magic=magic)
+
+            return _reader
+
+        kwargs = dict(filter=self.filter, merger=self.merger, **self.source._kwargs)
+
+        sources = []
+        for name, part, magic in self._in_place:
+            s = FileSource(self.path, parts=[part], **kwargs)
+            # the reader is determined from the member and not from the archive
+            s.reader = _member_reader(magic)
+            sources.append((name, s))
+
+        for name, path in self._extracted:
+            sources.append((name, _from_source_internal("file", path=path, **kwargs)))
+
+        sources = [s for _, s in sorted(sources, key=lambda x: x[0])]
+        if len(sources) == 1:
+            return sources[0]
+
+        return _from_source_internal("multi", sources, filter=self.filter, merger=self.merger)
+
     def _encode_default(self, encoder, **kwargs):
         return None
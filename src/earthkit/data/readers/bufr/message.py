@@ -40,7 +40,7 @@ class BUFRMessage(Base):
         r""":class:`CodesHandle`: Gets an object providing access to the low level BUFR message structure."""
         if self.__handle is None:
             assert self._offset is not None
-            self.__handle = BUFRCodesReader.from_cache(self.path).at_offset(self._offset)
+            self.__handle = BUFRCodesReader.from_cache(self.path).at_offset(self._offset, self._length)
         return self.__handle
 
     def __repr__(self):
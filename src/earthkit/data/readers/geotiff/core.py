@@ -23,3 +23,78 @@ class GeoTIFFReaderBase(Reader):
     _format = "geotiff"
     _binary = True
     _appendable = True
+
+
+def _as_window(window):
+    from rasterio.windows import Window
+
+    if isinstance(window, Window):
+        return window
+    # ((row_start, row_stop), (col_start, col_stop)) as in rasterio
+    return Window.from_slices(*window)
+
+
+def _as_bounds(bbox):
+    from earthkit.data.utils.bbox import BoundingBox
+
+    if not isinstance(bbox, BoundingBox):
+        north, west, south, east = bbox
+        bbox = BoundingBox(north=north, west=west, south=south, east=east)
+    return bbox.west, bbox.south, bbox.east, bbox.north
+
+
+def rioxarray_open(path, bbox=None, window=None, overview_level=None, **kwargs):
+    """Open a GeoTIFF file with rioxarray, optionally restricted to a subset of the raster.
+
+    The data is not read when opening the file. When a subset is specified, only the
+    blocks (tiles or strips) of the file intersecting it are read from disk when the
+    values are accessed. If dask is installed, the subset is chunked along the blocks,
+    so they are read in parallel.
+
+    Parameters
+    ----------
+    path: str
+        The path to the GeoTIFF file.
+    bbox: :class:`~earthkit.data.utils.bbox.BoundingBox` or list/tuple, None
+        The geographic bounding box to read. When a list or tuple, it is interpreted
+        as (north, west, south, east) in degrees.
+    window: :class:`rasterio.windows.Window` or tuple, None
+        The pixel window to read. When a tuple, it is interpreted as
+        ((row_start, row_stop), (col_start, col_stop)). Applied before ``bbox``.
+    overview_level: int, None
+        The overview (reduced resolution version) of the raster to read. The first
+        overview is 0. When None, the full resolution raster is read. ``window`` is
+        interpreted in the pixels of the overview.
+    **kwargs: dict, optional
+        Other keyword arguments passed to :func:`rioxarray.open_rasterio`.
+    """
+    try:
+        import rioxarray
+    except ImportError:
+        raise ImportError("geotiff handling requires 'rioxarray' to be installed")
+
+    options = dict(DEFAULT_XARRAY_KWARGS)
+    options.update(kwargs)
+    if overview_level is not None:
+        options["overview_level"] = overview_level
+
+    subset = bbox is not None or window is not None or overview_level is not None
+    if subset and "chunks" not in options:
+        try:
+            import dask  # noqa: F401
+
+            # chunks aligned with the blocks of the file, read without a global lock
+            options["chunks"] = True
+            options.setdefault("lock", False)
+        except ImportError:
+            pass
+
+    ds = rioxarray.open_rasterio(path, **options)
+
+    if window is not None:
+        ds = ds.rio.isel_window(_as_window(window))
+
+    if bbox is not None:
+        ds = ds.rio.clip_box(*_as_bounds(bbox), crs="EPSG:4326")
+
+    return ds
@@ -12,28 +12,21 @@ from earthkit.utils.decorators import thread_safe_cached_property
 
 from earthkit.data.indexing.simple import SimpleFieldListBase
 
-from .core import DEFAULT_XARRAY_KWARGS
+from .core import rioxarray_open
 from .reader import GeoTIFFReaderBase
 
 
 class GeoTIFFFieldList(SimpleFieldListBase, GeoTIFFReaderBase):
     """A list of GeoTIFF bands."""
 
-    def __init__(self, path, **kwargs):
+    def __init__(self, path, bbox=None, window=None, overview_level=None, **kwargs):
         GeoTIFFReaderBase.__init__(self, self, path)
-        self._ds = self._rioxarray_read()
+        self._ds = self._rioxarray_read(bbox=bbox, window=window, overview_level=overview_level, **kwargs)
 
-    def _rioxarray_read(self, **kwargs):
-        try:
-            import rioxarray
-        except ImportError:
-            raise ImportError("geotiff handling requires 'rioxarray' to be installed")
-
-        options = dict(**DEFAULT_XARRAY_KWARGS)
+    def _rioxarray_read(self, bbox=None, window=None, overview_level=None, **kwargs):
         # Read options from dedicated kwarg if exists, otherwise use all kwargs
-        options.update(kwargs.get("rioxarray_open_rasterio_kwargs", kwargs))
-
-        return rioxarray.open_rasterio(self.path, **options)
+        options = kwargs.get("rioxarray_open_rasterio_kwargs", kwargs)
+        return rioxarray_open(self.path, bbox=bbox, window=window, overview_level=overview_level, **options)
 
     # def to_xarray(self, **kwargs):
     #     return self._rioxarray_read(**kwargs)
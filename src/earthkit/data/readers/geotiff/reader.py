@@ -10,7 +10,7 @@
 
 from earthkit.data.sources import Source
 
-from .core import DEFAULT_XARRAY_KWARGS, GeoTIFFReaderBase
+from .core import GeoTIFFReaderBase, rioxarray_open
 
 
 class GeoTIFFReader(Source, GeoTIFFReaderBase):
@@ -20,20 +20,16 @@ class GeoTIFFReader(Source, GeoTIFFReaderBase):
     def __repr__(self):
         return f"GeoTIFFReader({self.path})"
 
-    def rioxarray_read(self, rioxarray_open_rasterio_kwargs=None, **kwargs):
-        try:
-            import rioxarray
-        except ImportError:
-            raise ImportError("geotiff handling requires 'rioxarray' to be installed")
-
-        options = dict(DEFAULT_XARRAY_KWARGS)
-
+    def rioxarray_read(
+        self, rioxarray_open_rasterio_kwargs=None, bbox=None, window=None, overview_level=None, **kwargs
+    ):
         # Read options from dedicated kwarg if exists, otherwise use all kwargs
         if rioxarray_open_rasterio_kwargs is None:
             rioxarray_open_rasterio_kwargs = kwargs.copy()
-        options.update(rioxarray_open_rasterio_kwargs)
 
-        return rioxarray.open_rasterio(self.path, **options)
+        return rioxarray_open(
+            self.path, bbox=bbox, window=window, overview_level=overview_level, **rioxarray_open_rasterio_kwargs
+        )
 
     def to_xarray(self, **kwargs):
         return self.rioxarray_read(**kwargs)
@@ -26,9 +26,9 @@ def _is_default(magic, content_type):
 
 
 def is_grib_file(path):
-    from earthkit.data.core.settings import SETTINGS
+    from earthkit.data.core.config import CONFIG
 
-    n_bytes = SETTINGS.get("reader-type-check-bytes")
+    n_bytes = CONFIG.get("reader-type-check-bytes")
     magic = None
     with open(path, "rb") as f:
         magic = f.read(n_bytes)
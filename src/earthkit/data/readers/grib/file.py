@@ -7,6 +7,7 @@
 # nor does it submit to any jurisdiction.
 #
 
+import numpy as np
 from earthkit.utils.decorators import thread_safe_cached_property
 
 from earthkit.data.indexing.simple import SimpleFieldListBase
@@ -30,6 +31,20 @@ def first_field_from_grib_file(path, parts=None):
         return next(reader, None)
 
 
+class MessagePositions:
+    """Offsets and lengths of the messages in a file stored in numpy arrays."""
+
+    def __init__(self, offsets, lengths):
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.lengths = np.asarray(lengths, dtype=np.int64)
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def subset(self, indices):
+        return MessagePositions(self.offsets[indices], self.lengths[indices])
+
+
 class GribFieldListInFile(SimpleFieldListBase, GRIBReaderBase):
     handle_cache = None
 
@@ -38,6 +53,7 @@ class GribFieldListInFile(SimpleFieldListBase, GRIBReaderBase):
         path,
         parts=None,
         positions=None,
+        grib_field_policy=None,
         grib_handle_policy=None,
         grib_handle_cache_size=None,
         use_grib_metadata_cache=None,
@@ -53,19 +69,92 @@ class GribFieldListInFile(SimpleFieldListBase, GRIBReaderBase):
         def _get_opt(v, name):
             return v if v is not None else CONFIG.get(name)
 
+        self.field_policy = _get_opt(grib_field_policy, "grib-field-policy")
         self.handle_policy = _get_opt(grib_handle_policy, "grib-handle-policy")
         self.handle_cache_size = _get_opt(grib_handle_cache_size, "grib-handle-cache-size")
         self.use_metadata_cache = _get_opt(use_grib_metadata_cache, "use-grib-metadata-cache")
 
+        # With the "temporary" field policy the columns computed by get_columns() are cached.
+        # A subset refers to the cache of the fieldlist it was created from.
+        self._column_cache = {}
+        self._column_source = None
+
     @thread_safe_cached_property
-    def _fields(self):
-        handle_cache = None
+    def _handle_cache(self):
         if self.handle_policy == "cache":
             from .handle import GribHandleCache
 
-            handle_cache = GribHandleCache(cache_size=self.handle_cache_size)
+            return GribHandleCache(cache_size=self.handle_cache_size)
+
+    @thread_safe_cached_property
+    def _fields(self):
+        return [self._create_field(i, self._handle_cache) for i in range(self.number_of_parts())]
+
+    def _getitem(self, n):
+        if isinstance(n, int):
+            if self.field_policy == "temporary":
+                return self._create_field(n, self._handle_cache)
+            return self._fields[n]
+
+    def __len__(self):
+        return self.number_of_parts()
+
+    @classmethod
+    def new_mask_index(cls, *args, **kwargs):
+        assert len(args) == 2
+        fs = args[0]
+        if isinstance(fs, GribFieldListInFile) and fs.field_policy == "temporary":
+            from earthkit.data.core.index import as_index_array
+
+            return fs._subset(as_index_array(args[1]))
+        return super().new_mask_index(*args, **kwargs)
+
+    def _subset(self, indices):
+        r = GribFieldListInFile(
+            self.path,
+            positions=self._positions.subset(indices),
+            grib_field_policy=self.field_policy,
+            grib_handle_policy=self.handle_policy,
+            grib_handle_cache_size=self.handle_cache_size,
+            use_grib_metadata_cache=self.use_metadata_cache,
+        )
+        # the handle cache is keyed by path and offset so it can be shared
+        r.__dict__["_handle_cache"] = self._handle_cache
+        if self._column_source is None:
+            r._column_source = (self._column_cache, indices)
+        else:
+            cache, parent_indices = self._column_source
+            r._column_source = (cache, parent_indices[indices])
+        return r
 
-        return [self._create_field(i, handle_cache) for i in range(self.number_of_parts())]
+    def _cached_column(self, key):
+        if self._column_source is None:
+            return self._column_cache.get(key)
+
+        cache, indices = self._column_source
+        column = cache.get(key)
+        if column is not None:
+            return column[indices]
+
+    def get_columns(self, keys, default=None, astype=None, raise_on_missing=False, workers=None):
+        if self.field_policy != "temporary" or default is not None or astype is not None:
+            return super().get_columns(
+                keys, default=default, astype=astype, raise_on_missing=raise_on_missing, workers=workers
+            )
+
+        if isinstance(keys, str):
+            keys = [keys]
+
+        result = {k: self._cached_column(k) for k in keys}
+        missing = [k for k, v in result.items() if v is None]
+        if missing:
+            columns = super().get_columns(missing, raise_on_missing=raise_on_missing, workers=workers)
+            for k, v in columns.items():
+                v.flags.writeable = False
+                if self._column_source is None:
+                    self._column_cache[k] = v
+                result[k] = v
+        return result
 
     def _create_field(self, n, handle_cache):
         from earthkit.data.field.grib.create import create_grib_field
@@ -81,12 +170,15 @@ class GribFieldListInFile(SimpleFieldListBase, GRIBReaderBase):
     def _positions(self):
         # TODO: thread safety
         if self.__positions is None:
-            self.__positions = GribCodesMessagePositionIndex(self.path, self._file_parts)
+            pos = GribCodesMessagePositionIndex(self.path, self._file_parts)
+            if self.field_policy == "temporary":
+                pos = MessagePositions(pos.offsets, pos.lengths)
+            self.__positions = pos
         return self.__positions
 
     def part(self, n):
         pos = self._positions
-        return Part(self.path, pos.offsets[n], pos.lengths[n])
+        return Part(self.path, int(pos.offsets[n]), int(pos.lengths[n]))
 
     def number_of_parts(self):
         return len(self._positions)
@@ -98,6 +190,7 @@ class GribFieldListInFile(SimpleFieldListBase, GRIBReaderBase):
         # state = {"serialisation_policy": policy, "kwargs": self._source_kwargs}
         state = {"serialisation_policy": policy}
 
+        state["field_policy"] = self.field_policy
         state["handle_policy"] = self.handle_policy
         state["handle_cache_size"] = self.handle_cache_size
         state["use_metadata_cache"] = self.use_metadata_cache
@@ -127,6 +220,7 @@ class GribFieldListInFile(SimpleFieldListBase, GRIBReaderBase):
             self.__init__(
                 path,
                 positions=positions,
+                grib_field_policy=state.get("field_policy"),
                 grib_handle_policy=handle_policy,
                 grib_handle_cache_size=handle_cache_size,
                 use_grib_metadata_cache=use_metadata_cache,
@@ -151,11 +245,18 @@ class GribFieldListInFile(SimpleFieldListBase, GRIBReaderBase):
             ds = _from_source_internal(
                 "file",
                 path,
+                grib_field_policy=state.get("field_policy"),
+                grib_handle_policy=handle_policy,
+                grib_handle_cache_size=handle_cache_size,
+                use_grib_metadata_cache=use_metadata_cache,
+            )
+            self.__init__(
+                ds.path,
+                grib_field_policy=state.get("field_policy"),
                 grib_handle_policy=handle_policy,
                 grib_handle_cache_size=handle_cache_size,
                 use_grib_metadata_cache=use_metadata_cache,
             )
-            self.__init__(ds.path)
         else:
             raise ValueError(f"Unknown serialisation policy {policy}")
 
@@ -164,9 +265,10 @@ class GribFieldListInFile(SimpleFieldListBase, GRIBReaderBase):
         from collections import defaultdict
 
         r = defaultdict(int)
+        r["grib_field_policy"] = self.field_policy
         r["grib_handle_policy"] = self.handle_policy
 
-        handle = self._fields[0]._get_grib().handle
+        handle = self[0]._get_grib().handle
         if hasattr(handle, "manager"):
             manager = handle.manager
             if manager is not None:
@@ -175,7 +277,7 @@ class GribFieldListInFile(SimpleFieldListBase, GRIBReaderBase):
         if self.use_metadata_cache:
             from earthkit.data.utils.diag import metadata_cache_diag
 
-            r.update(metadata_cache_diag(self._fields))
+            r.update(metadata_cache_diag(self))
         return r
 
 
@@ -185,6 +287,7 @@ class GRIBReader(Source, GRIBReaderBase):
         self._kwargs = {"parts": parts, "positions": positions}
 
         for k in [
+            "grib_field_policy",
             "grib_handle_policy",
             "grib_handle_cache_size",
             "use_grib_metadata_cache",
@@ -252,9 +355,21 @@ class MultiGRIBReader(Source, GRIBReaderBase):
                 yield s
 
     def to_fieldlist(self):
+        from earthkit.data.core.config import CONFIG
         from earthkit.data.mergers import make_merger
 
-        merged = make_merger(None, self.sources).to_fieldlist()
+        workers = CONFIG.get("multi-file-warm-workers")
+        if workers > 0:
+            from earthkit.data.core.index import warm_indexes
+            from earthkit.data.mergers import merge_by_class
+
+            fs = warm_indexes(
+                [s.to_fieldlist() for s in self.sources], workers=workers, keys=CONFIG.get("multi-file-warm-keys")
+            )
+            merged = merge_by_class(fs)
+        else:
+            merged = make_merger(None, self.sources).to_fieldlist()
+
         if merged is not None:
             return merged.mutate()
 
@@ -10,15 +10,60 @@
 import logging
 import threading
 from abc import ABCMeta, abstractmethod
+from collections import OrderedDict
 
 import eccodes
 import numpy as np
 
+from earthkit.data.core.diagnostics import instrumented
 from earthkit.data.utils.message import CodesHandle, CodesReader
 
 LOG = logging.getLogger(__name__)
 
 
+def _is_float32(dtype):
+    if dtype is None:
+        return False
+    try:
+        return np.dtype(dtype) == np.float32
+    except TypeError:
+        return False
+
+
+def _regular_grid_axes(handle):
+    """Return the distinct latitudes and longitudes of a regular grid in scanning order.
+
+    Returns None when the grid is not regular or the scanning mode is not supported.
+    """
+    try:
+        if eccodes.codes_get(handle, "gridType") not in ("regular_ll", "regular_gg"):
+            return None
+        if eccodes.codes_get(handle, "jPointsAreConsecutive") or eccodes.codes_get(handle, "alternativeRowScanning"):
+            return None
+
+        lat = np.sort(eccodes.codes_get_array(handle, "distinctLatitudes"))
+        lon = np.sort(eccodes.codes_get_array(handle, "distinctLongitudes"))
+        if not eccodes.codes_get(handle, "jScansPositively"):
+            lat = lat[::-1]
+        if eccodes.codes_get(handle, "iScansNegatively"):
+            lon = lon[::-1]
+
+        if len(lat) != eccodes.codes_get(handle, "Nj") or len(lon) != eccodes.codes_get(handle, "Ni"):
+            return None
+
+        # the first gridpoint must match, e.g. longitudes crossing the
+        # date line would be reordered by the sorting
+        if (
+            abs(lat[0] - eccodes.codes_get(handle, "latitudeOfFirstGridPointInDegrees")) > 1e-3
+            or abs(lon[0] - eccodes.codes_get(handle, "longitudeOfFirstGridPointInDegrees")) > 1e-3
+        ):
+            return None
+    except Exception:
+        return None
+
+    return lat, lon
+
+
 class GribCodesFloatArrayAccessor:
     HAS_FLOAT_SUPPORT = None
     KEY = None
@@ -30,7 +75,7 @@ class GribCodesFloatArrayAccessor:
     def get(self, handle, dtype=None):
         v = eccodes.codes_get_array(handle, self.KEY)
         if dtype is not None:
-            return v.astype(dtype)
+            return v.astype(dtype, copy=False)
         else:
             return v
 
@@ -42,25 +87,44 @@ class GribCodesValueAccessor(GribCodesFloatArrayAccessor):
         super().__init__()
 
     def get(self, handle, dtype=None):
-        if dtype is np.float32 and self.HAS_FLOAT_SUPPORT:
-            return eccodes.codes_get_array(handle, self.KEY, ktype=dtype)
+        if self.HAS_FLOAT_SUPPORT and _is_float32(dtype):
+            return eccodes.codes_get_array(handle, self.KEY, ktype=np.float32)
         else:
             return super().get(handle, dtype=dtype)
 
 
-class GribCodesLatitudeAccessor(GribCodesFloatArrayAccessor):
+class GribCodesLatLonAccessor(GribCodesFloatArrayAccessor):
+    def get(self, handle, dtype=None):
+        # ecCodes cannot decode the coordinates as float32, so for regular grids
+        # they are built from the distinct values to avoid a float64 intermediate
+        if _is_float32(dtype):
+            axes = _regular_grid_axes(handle)
+            if axes is not None:
+                return self._from_axes(*axes, dtype=np.float32)
+        return super().get(handle, dtype=dtype)
+
+
+class GribCodesLatitudeAccessor(GribCodesLatLonAccessor):
     KEY = "latitudes"
 
     def __init__(self):
         super().__init__()
 
+    @staticmethod
+    def _from_axes(lat, lon, dtype):
+        return np.repeat(lat.astype(dtype), len(lon))
 
-class GribCodesLongitudeAccessor(GribCodesFloatArrayAccessor):
+
+class GribCodesLongitudeAccessor(GribCodesLatLonAccessor):
     KEY = "longitudes"
 
     def __init__(self):
         super().__init__()
 
+    @staticmethod
+    def _from_axes(lat, lon, dtype):
+        return np.tile(lon.astype(dtype), len(lat))
+
 
 VALUE_ACCESSOR = GribCodesValueAccessor()
 LATITUDE_ACCESSOR = GribCodesLatitudeAccessor()
@@ -178,6 +242,8 @@ class GribCodesReader(CodesReader):
 
 
 class GribHandle(metaclass=ABCMeta):
+    __slots__ = ()
+
     @property
     @abstractmethod
     def handle(self):
@@ -200,12 +266,14 @@ class GribHandle(metaclass=ABCMeta):
 
 
 class FileGribHandle(GribHandle):
-    _handle = None
+    # there is one file handle per field, so no instance dict is created
+    __slots__ = ("path", "offset", "length", "_handle")
 
     def __init__(self, path, offset, length):
         self.path = path
         self.offset = offset
         self.length = length
+        self._handle = None
 
     @property
     def handle(self):
@@ -213,8 +281,9 @@ class FileGribHandle(GribHandle):
             self._handle = self._create_handle()
         return self._handle
 
+    @instrumented("grib.handle.create")
     def _create_handle(self):
-        return GribCodesReader.from_cache(self.path).at_offset(self.offset)
+        return GribCodesReader.from_cache(self.path).at_offset(self.offset, self.length)
 
     def release(self):
         self._handle = None
@@ -245,6 +314,7 @@ class FileGribHandle(GribHandle):
         self.path = state["path"]
         self.offset = state["offset"]
         self.length = state["length"]
+        self._handle = None
         # self._use_metadata_cache = state["use_metadata_cache"]
         # self._handle_manager = None
 
@@ -252,6 +322,8 @@ class FileGribHandle(GribHandle):
 class ManagedGribHandle(FileGribHandle):
     """A GribHandle that is managed by a handle manager."""
 
+    __slots__ = ("manager",)
+
     def __init__(self, path, offset, length, manager):
         super().__init__(path, offset, length)
         self.manager = manager
@@ -287,6 +359,8 @@ class ManagedGribHandle(FileGribHandle):
 
 
 class TemporaryGribHandle(FileGribHandle):
+    __slots__ = ()
+
     @property
     def handle(self):
         return self._create_handle()
@@ -360,51 +434,160 @@ class DeflatedGribHandle(MemoryGribHandle):
         return self
 
 
+class _InFlight:
+    """A handle being created by one thread that other threads can wait for."""
+
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class _HandleCacheShard:
+    """LRU store of a subset of the handles of a :class:`GribHandleCache`.
+
+    Must only be accessed while holding ``lock``.
+    """
+
+    def __init__(self, max_count, max_bytes):
+        self.max_count = max_count
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()
+        self.inflight = {}
+        self.nbytes = 0
+        self.hit_count = 0
+        self.create_count = 0
+        self.eviction_count = 0
+        self.wait_count = 0
+
+    def add(self, key, raw, nbytes):
+        old = self.entries.pop(key, None)
+        if old is not None:
+            self.nbytes -= old[1]
+        self.entries[key] = (raw, nbytes)
+        self.nbytes += nbytes
+        self.create_count += 1
+
+        # the new handle is always kept even if it alone exceeds the byte budget
+        while len(self.entries) > 1 and (
+            len(self.entries) > self.max_count or (self.max_bytes is not None and self.nbytes > self.max_bytes)
+        ):
+            _, (_, n) = self.entries.popitem(last=False)
+            self.nbytes -= n
+            self.eviction_count += 1
+
+    def remove(self, key):
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.nbytes -= entry[1]
+
+
 class GribHandleCache:
-    def __init__(self, cache_size=None):
+    """LRU cache of the GRIB handles of a fieldlist with data on disk.
+
+    The cache is split into shards, each with its own lock, so threads accessing
+    different handles do not block each other. Handles are created outside the locks
+    and when several threads request the same missing handle only one of them creates
+    it, the others wait for the result.
+
+    Parameters
+    ----------
+    cache_size: int
+        The maximum number of cached handles.
+    max_bytes: int, None
+        The maximum total size of the GRIB messages of the cached handles. When None,
+        the ``grib-handle-cache-max-bytes`` config option is used.
+    """
+
+    # the minimum number of handles per shard
+    SHARD_MIN_SIZE = 64
+    MAX_SHARDS = 16
+
+    def __init__(self, cache_size=None, max_bytes=None):
         self.cache_size = cache_size
         if cache_size is None or self.cache_size <= 0:
             raise ValueError('grib_handle_cache_size must be greater than 0 when grib_handle_policy="cache"')
 
-        from lru import LRU
+        if max_bytes is None:
+            from earthkit.data.core.config import CONFIG
 
-        self.cache = LRU(self.cache_size)
-        self.lock = threading.Lock()
-        self._handle_create_count = 0
+            max_bytes = CONFIG.get("grib-handle-cache-max-bytes")
+        self.max_bytes = max_bytes
+
+        # small caches use a single shard to keep an exact LRU order
+        n = max(1, min(self.MAX_SHARDS, self.cache_size // self.SHARD_MIN_SIZE))
+        self.shards = [
+            _HandleCacheShard(
+                self.cache_size // n + (i < self.cache_size % n),
+                None if max_bytes is None else max(1, max_bytes // n),
+            )
+            for i in range(n)
+        ]
+
+    def _shard(self, key):
+        return self.shards[hash(key) % len(self.shards)]
 
     def get(self, handle, create):
         key = (handle.path, handle.offset)
-        with self.lock:
-            if key in self.cache:
-                return self.cache[key]
+        shard = self._shard(key)
+        with shard.lock:
+            entry = shard.entries.get(key)
+            if entry is not None:
+                shard.entries.move_to_end(key)
+                shard.hit_count += 1
+                return entry[0]
+
+            flight = shard.inflight.get(key)
+            owner = flight is None
+            if owner:
+                flight = _InFlight()
+                shard.inflight[key] = flight
             else:
-                # print("Creating new handle for", key)
-                # import traceback
+                shard.wait_count += 1
+
+        if not owner:
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
 
-                # traceback.print_stack()
-                raw = create()
-                self.cache[key] = raw
-                self._handle_created()
-                return raw
+        try:
+            raw = create()
+        except BaseException as e:
+            flight.error = e
+            with shard.lock:
+                shard.inflight.pop(key, None)
+            flight.event.set()
+            raise
+
+        with shard.lock:
+            shard.inflight.pop(key, None)
+            shard.add(key, raw, handle.length or 0)
+
+        flight.result = raw
+        flight.event.set()
+        return raw
 
     def remove(self, handle):
         key = (handle.path, handle.offset)
-        with self.lock:
-            self.cache.pop(key, None)
+        shard = self._shard(key)
+        with shard.lock:
+            shard.remove(key)
 
-    def _handle_created(self):
-        self._handle_create_count += 1
+    def __len__(self):
+        return sum(len(s.entries) for s in self.shards)
 
     def __getstate__(self):
-        # print("GribHandleCache getstate")
         state = {}
         state["cache_size"] = self.cache_size
+        state["max_bytes"] = self.max_bytes
         return state
 
     def __setstate__(self, state):
-        # print("GribHandleCache setstate")
-        cache_size = state["cache_size"]
-        self.__init__(cache_size)
+        self.__init__(state["cache_size"], max_bytes=state.get("max_bytes"))
 
     def _diag(self):
         """Return diagnostic information about the cache."""
@@ -412,10 +595,15 @@ class GribHandleCache:
 
         r = defaultdict(int)
         r["grib_handle_cache_size"] = self.cache_size
-        if self.cache is not None:
-            r["handle_cache_size"] = len(self.cache)
-
-        r["handle_create_count"] = self._handle_create_count
+        r["grib_handle_cache_max_bytes"] = self.max_bytes
+        r["handle_cache_size"] = len(self)
+        r["handle_cache_shards"] = len(self.shards)
+        for s in self.shards:
+            r["handle_cache_bytes"] += s.nbytes
+            r["handle_cache_hits"] += s.hit_count
+            r["handle_create_count"] += s.create_count
+            r["handle_eviction_count"] += s.eviction_count
+            r["handle_inflight_waits"] += s.wait_count
         return r
 
 
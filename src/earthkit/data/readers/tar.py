@@ -11,6 +11,8 @@ import logging
 import mimetypes
 import tarfile
 
+from earthkit.data.utils.parts import SimplePart
+
 from .archive import ArchiveReader
 
 LOG = logging.getLogger(__name__)
@@ -20,13 +22,26 @@ class TarReader(ArchiveReader):
     def __init__(self, source, path, compression=None):
         super().__init__(source, path)
 
-        with tarfile.open(path) as tar:
+        # the members of an uncompressed tar can be read in place
+        try:
+            tar = tarfile.open(path, "r:")
+            in_place = True
+        except tarfile.ReadError:
+            tar = tarfile.open(path)
+            in_place = False
+
+        with tar:
             self.expand(
                 tar,
                 tar.getmembers(),
+                in_place=in_place,
                 set_attrs=False,
             )
 
+    def member_part(self, archive, member):
+        if member.isfile() and not member.issparse():
+            return SimplePart(member.offset_data, member.size)
+
 
 def reader(source, path, *, magic=None, deeper_check=False, **kwargs):
     # We don't use tarfile.is_tarfile() because is
@@ -11,6 +11,7 @@ import json
 import logging
 from typing import Any, Dict, List, Optional, Union
 
+import numpy as np
 import xarray as xr
 import yaml
 
@@ -113,6 +114,61 @@ class XArrayFieldList(IndexFieldListBase):
 
         raise IndexError(k)
 
+    def _bulk_array(self, accessor, indices=None, **kwargs):
+        """Read the values of the fields at ``indices`` with one backend read per variable.
+
+        Returns None when the fast path cannot be used.
+        """
+        if accessor not in ("values", "to_numpy", "to_array") or kwargs.get("index") is not None:
+            return None
+
+        if not all(isinstance(v, Variable) for v in self.variables):
+            return None
+
+        flatten = kwargs.get("flatten", False) if accessor != "values" else True
+        dtype = kwargs.get("dtype")
+        array_namespace = "numpy" if accessor == "to_numpy" else kwargs.get("array_namespace")
+
+        if indices is None:
+            indices = range(self.total_length)
+
+        # group the fields by variable
+        offsets = np.cumsum([0] + [v.length for v in self.variables])
+        groups = {}
+        for pos, i in enumerate(indices):
+            if i < 0:
+                i += self.total_length
+            if i < 0 or i >= self.total_length:
+                raise IndexError(i)
+            k = int(np.searchsorted(offsets, i, side="right")) - 1
+            groups.setdefault(k, ([], []))
+            groups[k][0].append(i - offsets[k])
+            groups[k][1].append(pos)
+
+        if not groups:
+            return None
+
+        r = None
+        for k, (local, pos) in groups.items():
+            v = self.variables[k]
+            values = v.read(local)
+            if flatten:
+                values = values.reshape(len(local), -1)
+            else:
+                # the shape is taken from the field metadata
+                values = values.reshape(len(local), *v[local[0]].shape)
+
+            if r is None:
+                r = np.empty((len(indices), *values.shape[1:]), dtype=dtype if dtype is not None else values.dtype)
+            r[pos] = values
+
+        if array_namespace is not None:
+            from earthkit.utils.array import convert as convert_array
+
+            r = convert_array(r, array_namespace=array_namespace, device=kwargs.get("device"))
+
+        return r
+
     @classmethod
     def from_xarray(
         cls,
@@ -267,6 +323,10 @@ class XArrayFieldList(IndexFieldListBase):
             So we get an extra chance to filter the fields by the metadata.
         """
 
+        area = kwargs.pop("area", None)
+        if area is not None:
+            return self.sel(*args, **kwargs)._crop(area)
+
         # TODO: change this!!! Was set to make all tests pass.
         if len(self) < 10000:
             return super().sel(*args, **kwargs)
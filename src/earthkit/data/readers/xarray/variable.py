@@ -179,6 +179,38 @@ class Variable:
 
         return create_xarray_field(self, self.variable.isel(kwargs))
 
+    def read(self, indices: List[int]) -> np.ndarray:
+        """Read the values of multiple 2D fields from the variable at once.
+
+        Parameters
+        ----------
+        indices : List[int]
+            Indices of the fields.
+
+        Returns
+        -------
+        np.ndarray
+            The values with the fields stacked along the first axis. The remaining
+            axes follow the order of the grid dimensions in the variable.
+        """
+        dims = list(self.names)
+        indices = np.asarray(indices, dtype=int)
+
+        if not dims:
+            # the variable contains a single field
+            return self.variable.values[np.newaxis, ...][np.zeros(len(indices), dtype=int)]
+
+        if len(indices) == self.length and np.array_equal(indices, np.arange(self.length)):
+            # the whole variable is read in one go
+            v = self.variable.transpose(*dims, ...)
+            values = v.values
+            return values.reshape(self.length, *values.shape[len(dims) :])
+
+        # a single vectorised selection for all the fields
+        coords = np.unravel_index(indices, self.shape)
+        kwargs = {k: xr.DataArray(v, dims="_field") for k, v in zip(dims, coords)}
+        return self.variable.isel(kwargs).transpose("_field", ...).values
+
     def sel(self, missing: Dict[str, Any], **kwargs: Any) -> Optional["Variable"]:
         """Select a subset of the variable based on the given coordinates.
 
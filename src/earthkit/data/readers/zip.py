@@ -9,9 +9,11 @@
 
 import os
 import stat
-from zipfile import ZipFile
+import struct
+from zipfile import ZIP_STORED, ZipFile
 
 from earthkit.data.sources import _from_source_internal
+from earthkit.data.utils.parts import SimplePart
 
 from .archive import ArchiveReader
 from .csv.reader import CSVReader
@@ -60,11 +62,29 @@ class ZIPReader(ArchiveReader):
             if ".zattrs" in members:
                 return  # Zarr can read zipped files directly
 
-            self.expand(zip, members)
+            self.expand(zip, members, in_place=True)
 
     def check(self, member):
         return super().check(InfoWrapper(member))
 
+    def member_info(self, member):
+        return InfoWrapper(member)
+
+    def member_part(self, archive, member):
+        # only stored (uncompressed) and unencrypted members can be read in place
+        if member.compress_type != ZIP_STORED or member.flag_bits & 0x1:
+            return None
+
+        # the data follows the local file header, whose extra field can differ from
+        # the one in the central directory
+        fp = archive.fp
+        fp.seek(member.header_offset)
+        header = fp.read(30)
+        if len(header) != 30 or header[:4] != b"PK\x03\x04":
+            return None
+        name_len, extra_len = struct.unpack("<HH", header[26:30])
+        return SimplePart(member.header_offset + 30 + name_len + extra_len, member.compress_size)
+
     def mutate(self):
         if self._mutate:
             return self._mutate
@@ -72,6 +92,10 @@ class ZIPReader(ArchiveReader):
         return super().mutate()
 
     def mutate_source(self):
+        source = super().mutate_source()
+        if source is not None:
+            return source
+
         # zarr can read data from a zip file
         if ".zattrs" in self._content:
             return _from_source_internal("zarr", self.path)
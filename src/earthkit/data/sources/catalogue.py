@@ -0,0 +1,335 @@
+# (C) Copyright 2020 ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+#
+
+import glob
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+from . import Source
+
+LOG = logging.getLogger(__name__)
+
+# The GRIB keys stored in the catalogue by default
+DEFAULT_KEYS = (
+    "shortName",
+    "paramId",
+    "typeOfLevel",
+    "level",
+    "dataDate",
+    "dataTime",
+    "step",
+    "number",
+    "dataType",
+    "gridType",
+)
+
+_COLUMN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+def _file_state(path):
+    st = os.stat(path)
+    return st.st_size, st.st_mtime_ns
+
+
+def _expand_paths(paths):
+    """Return the sorted list of the files in the directories, glob patterns and files of ``paths``."""
+    if isinstance(paths, (str, os.PathLike)):
+        paths = [paths]
+
+    result = set()
+    for p in paths:
+        p = os.path.abspath(os.path.expanduser(str(p)))
+        if os.path.isdir(p):
+            for root, _, files in os.walk(p):
+                result.update(os.path.join(root, f) for f in files)
+        elif glob.has_magic(p):
+            result.update(f for f in glob.glob(p, recursive=True) if os.path.isfile(f))
+        elif os.path.isfile(p):
+            result.add(p)
+        else:
+            raise FileNotFoundError(f"No such file or directory: '{p}'")
+    return sorted(result)
+
+
+def _scan_file(path, keys):
+    """Return the (offset, length, *values) of each GRIB message of ``path``."""
+    from earthkit.data.readers.grib import is_grib_file
+    from earthkit.data.readers.grib.file import GribFieldListInFile
+
+    try:
+        if not is_grib_file(path):
+            return []
+
+        fl = GribFieldListInFile(path, grib_field_policy="temporary", grib_handle_policy="temporary")
+        if len(fl) == 0:
+            return []
+
+        md_keys = [f"metadata.{k}" for k in keys]
+        columns = fl.get_columns(md_keys)
+        pos = fl._positions
+    except Exception as e:
+        LOG.warning(f"Cannot index file {path}: {e}")
+        return []
+
+    rows = []
+    for i in range(len(pos)):
+        values = [columns[k][i] for k in md_keys]
+        rows.append((int(pos.offsets[i]), int(pos.lengths[i]), *(None if v is None else str(v) for v in values)))
+    return rows
+
+
+class GribCatalogue:
+    """Persistent index of the GRIB messages of a set of files.
+
+    The position of each message and the values of ``keys`` are stored in an SQLite
+    database together with the size and modification time of each file. On :meth:`update`
+    only the new and modified files are scanned again, in parallel.
+
+    Parameters
+    ----------
+    db: str
+        Path to the SQLite database. Created when it does not exist.
+    keys: list of str
+        The GRIB keys stored for each message. When the database was created with
+        other keys it is rebuilt.
+    """
+
+    def __init__(self, db, keys=DEFAULT_KEYS):
+        for k in keys:
+            if not _COLUMN.match(k):
+                raise ValueError(f"Invalid catalogue key={k}")
+
+        self.db = db
+        self.keys = tuple(keys)
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(db)), exist_ok=True)
+        columns = ", ".join(f'"{k}" TEXT' for k in self.keys)
+        with self._connection() as con:
+            con.execute("CREATE TABLE IF NOT EXISTS info (name TEXT PRIMARY KEY, value TEXT)")
+            r = con.execute("SELECT value FROM info WHERE name='keys'").fetchone()
+            if r is not None and r[0] != ",".join(self.keys):
+                LOG.debug(f"Catalogue {db} keys changed from {r[0]}, rebuilding")
+                con.execute("DROP TABLE IF EXISTS files")
+                con.execute("DROP TABLE IF EXISTS messages")
+            con.execute("INSERT OR REPLACE INTO info (name, value) VALUES ('keys', ?)", (",".join(self.keys),))
+            con.execute("CREATE TABLE IF NOT EXISTS files (path TEXT PRIMARY KEY, size INTEGER, mtime INTEGER)")
+            con.execute(f"CREATE TABLE IF NOT EXISTS messages (path TEXT, offset INTEGER, length INTEGER, {columns})")
+            con.execute("CREATE INDEX IF NOT EXISTS messages_path ON messages (path)")
+
+    @contextmanager
+    def _connection(self):
+        con = sqlite3.connect(self.db, timeout=60)
+        try:
+            with con:
+                yield con
+        finally:
+            con.close()
+
+    def update(self, paths, workers=None):
+        """Bring the catalogue up to date with the files of ``paths``.
+
+        Parameters
+        ----------
+        paths: str, list of str
+            Directories (scanned recursively), glob patterns or files.
+        workers: int, None
+            The number of threads scanning the new and modified files. When None
+            the number of CPUs is used.
+
+        Returns
+        -------
+        int
+            The number of files scanned.
+        """
+        db = os.path.abspath(self.db)
+        files = [f for f in _expand_paths(paths) if not f.startswith(db)]
+
+        with self._lock:
+            with self._connection() as con:
+                known = {p: (s, m) for p, s, m in con.execute("SELECT path, size, mtime FROM files")}
+
+            current = {}
+            for f in files:
+                try:
+                    current[f] = _file_state(f)
+                except OSError:
+                    pass
+
+            changed = [f for f, state in current.items() if known.get(f) != state]
+            removed = [f for f in known if f not in current]
+
+            if not changed and not removed:
+                return 0
+
+            LOG.debug(f"Catalogue {self.db}: scanning {len(changed)} files, removing {len(removed)} files")
+            scanned = self._scan(changed, workers)
+
+            placeholders = ", ".join("?" * (len(self.keys) + 3))
+            with self._connection() as con:
+                for f in removed + changed:
+                    con.execute("DELETE FROM messages WHERE path=?", (f,))
+                    con.execute("DELETE FROM files WHERE path=?", (f,))
+                for f, rows in zip(changed, scanned):
+                    con.executemany(f"INSERT INTO messages VALUES ({placeholders})", [(f, *r) for r in rows])
+                    con.execute("INSERT INTO files (path, size, mtime) VALUES (?, ?, ?)", (f, *current[f]))
+
+            return len(changed)
+
+    def _scan(self, files, workers):
+        if workers is None:
+            workers = os.cpu_count() or 1
+        workers = min(workers, len(files))
+
+        if workers < 2:
+            return [_scan_file(f, self.keys) for f in files]
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda f: _scan_file(f, self.keys), files))
+
+    def lookup(self, selection=None):
+        """Return the (path, offset, length) of the messages matching ``selection``.
+
+        Parameters
+        ----------
+        selection: dict, None
+            Maps catalogue keys to a value or a list of values. The messages
+            are sorted by path and offset.
+
+        Returns
+        -------
+        list of tuple
+        """
+        where = []
+        args = []
+        for k, v in (selection or {}).items():
+            if k not in self.keys:
+                raise KeyError(f"Key={k} not in catalogue")
+            values = [str(x) for x in v] if isinstance(v, (list, tuple, set)) else [str(v)]
+            where.append(f'"{k}" IN ({", ".join("?" * len(values))})')
+            args.extend(values)
+
+        q = "SELECT path, offset, length FROM messages"
+        if where:
+            q += " WHERE " + " AND ".join(where)
+        q += " ORDER BY path, offset"
+
+        with self._connection() as con:
+            return con.execute(q, args).fetchall()
+
+    def __len__(self):
+        with self._connection() as con:
+            return con.execute("SELECT COUNT(*) FROM messages").fetchone()[0]
+
+
+class CatalogueSource(Source):
+    """Source selecting GRIB messages from many files with a persistent catalogue.
+
+    Parameters
+    ----------
+    path: str, list of str
+        Directories (scanned recursively), glob patterns or files.
+    db: str, None
+        Path to the SQLite catalogue database. When None, the catalogue is stored
+        in the cache directory.
+    keys: list of str, None
+        The GRIB keys stored in the catalogue. When None :data:`DEFAULT_KEYS` is used.
+    workers: int, None
+        The number of threads scanning the new and modified files.
+    """
+
+    def __init__(self, path, *, db=None, keys=None, workers=None, **kwargs):
+        super().__init__(**kwargs)
+        self.path = path
+        self.workers = workers
+
+        if db is None:
+            from earthkit.data.core.caching import CACHE
+
+            directory = CACHE.directory()
+            if directory is None:
+                raise ValueError("Catalogue requires either 'db' or a cache directory")
+
+            paths = sorted(os.path.abspath(str(p)) for p in ([path] if isinstance(path, str) else path))
+            m = hashlib.sha256("\n".join(paths).encode("utf-8"))
+            db = os.path.join(directory, f"catalogue-{m.hexdigest()}.db")
+
+        self.catalogue = GribCatalogue(db, keys=DEFAULT_KEYS if keys is None else keys)
+        self._updated = False
+
+    def update(self):
+        """Scan the new and modified files and drop the deleted ones from the catalogue."""
+        self.catalogue.update(self.path, workers=self.workers)
+        self._updated = True
+
+    def to_fieldlist(self, *args, **kwargs):
+        from earthkit.data.core.select import normalise_selection
+
+        if not self._updated:
+            self.update()
+
+        kwargs, remapping = normalise_selection(*args, **kwargs)
+
+        selection = {}
+        rest = {}
+        for k, v in kwargs.items():
+            name = k[len("metadata.") :] if k.startswith("metadata.") else k
+            if name in self.catalogue.keys and remapping is None and self._sql_value(v):
+                selection[name] = v
+            elif v is not None:
+                rest[k] = v
+
+        ds = self._fieldlist(self.catalogue.lookup(selection))
+        if rest or remapping is not None:
+            ds = ds.sel(rest, remapping=remapping)
+        return ds
+
+    @staticmethod
+    def _sql_value(v):
+        scalar = (str, int, float)
+        if isinstance(v, (list, tuple, set)):
+            return len(v) > 0 and all(isinstance(x, scalar) for x in v)
+        return isinstance(v, scalar)
+
+    def _fieldlist(self, messages):
+        from itertools import groupby
+
+        from earthkit.data.readers.grib.file import GribFieldListInFile, MessagePositions
+
+        fls = []
+        for path, rows in groupby(messages, key=lambda r: r[0]):
+            rows = list(rows)
+            positions = MessagePositions([r[1] for r in rows], [r[2] for r in rows])
+            fls.append(GribFieldListInFile(path, positions=positions))
+
+        if not fls:
+            from earthkit.data.indexing.empty import EmptyFieldList
+
+            return EmptyFieldList()
+        elif len(fls) == 1:
+            return fls[0]
+
+        from earthkit.data.indexing.indexed import MultiFieldList
+
+        return MultiFieldList(fls)
+
+    def to_data_object(self):
+        from earthkit.data.data.catalogue import CatalogueData
+
+        return CatalogueData(self)
+
+
+source = CatalogueSource
@@ -18,7 +18,8 @@ except ImportError:
 import yaml
 
 from earthkit.data.decorators import normalise
-from earthkit.data.utils.request import FileRequestRetriever, RequestBuilder
+from earthkit.data.utils.field_store import CDS_FIELD_KEYS
+from earthkit.data.utils.request import RequestBuilder, request_retriever
 
 from .file import FileSource
 from .prompt import APIKeyPrompt
@@ -99,7 +100,7 @@ class CDSRetriever(FileSource):
         self.request = request_builder.requests
 
         # Download each request in parallel when the config allows it
-        retriever = FileRequestRetriever(self, retriever=self._retrieve_one)
+        retriever = request_retriever(self, self._retrieve_one, field_keys=CDS_FIELD_KEYS)
         self.path = retriever.retrieve(self.request, self.dataset)
 
     def _retrieve_one(self, request, dataset):
@@ -10,7 +10,8 @@
 import logging
 
 from earthkit.data.decorators import normalise
-from earthkit.data.utils.request import FileRequestRetriever, RequestBuilder
+from earthkit.data.utils.field_store import MARS_FIELD_KEYS
+from earthkit.data.utils.request import RequestBuilder, request_retriever
 
 from .file import FileSource
 from .prompt import APIKeyPrompt
@@ -73,7 +74,7 @@ class ECMWFAPI(FileSource):
         self.service()  # Trigger password prompt before threading
 
         # Download each request in parallel when the config allows it
-        retriever = FileRequestRetriever(self, retriever=self._retrieve_one)
+        retriever = request_retriever(self, self._retrieve_one, field_keys=MARS_FIELD_KEYS)
         self.path = retriever.retrieve(self.request)
 
     def _retrieve_one(self, request, *args):
@@ -14,6 +14,7 @@ from multiurl import Downloader
 
 from earthkit.data.core.caching import cache_file
 from earthkit.data.core.config import CONFIG
+from earthkit.data.core.diagnostics import timer
 from earthkit.data.core.statistics import record_statistics
 from earthkit.data.utils.parts import PathAndParts
 from earthkit.data.utils.progbar import progress_bar
@@ -97,7 +98,8 @@ def download_and_cache(
         force = out_of_date
 
     def download(target, _):
-        downloader.download(target)
+        with timer("url.download"):
+            downloader.download(target)
         return downloader.cache_data()
 
     path = cache_file(
@@ -145,7 +147,8 @@ def download_to_target(
     if path is not None:
         return
 
-    downloader.download(target)
+    with timer("url.download"):
+        downloader.download(target)
 
     return downloader.cache_data()
 
@@ -322,7 +325,8 @@ class Url(UrlBase):
             self.force = self.out_of_date
 
         def download(target, _):
-            self.downloader.download(target)
+            with timer("url.download"):
+                self.downloader.download(target)
             return self.downloader.cache_data()
 
         self.path = self._cache_file(
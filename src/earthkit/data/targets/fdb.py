@@ -15,9 +15,35 @@ LOG = logging.getLogger(__name__)
 
 
 class FDBTarget(SimpleTarget):
+    """FDB target.
+
+    Parameters
+    ----------
+    fdb: pyfdb.FDB, None
+        The FDB object to archive into. When None, it is created from ``config`` and ``userconfig``.
+    config: dict, str, None
+        The FDB configuration.
+    userconfig: dict, str, None
+        The FDB user configuration.
+    workers: int, None
+        Number of threads used to encode the messages when writing a FieldList. The messages
+        are still archived in their original order. When None, the messages are encoded and
+        archived one by one in the calling thread.
+    max_in_flight: int, None
+        Maximum number of encoded messages held in memory while waiting to be archived.
+        When None, it defaults to twice the number of ``workers``.
+    batch_size: int, None
+        Maximum number of messages concatenated into a single ``archive`` call.
+        When None, each message is archived separately.
+    **kwargs:
+        Additional keyword arguments passed to the parent class.
+    """
+
     _name = "fdb"
 
-    def __init__(self, fdb=None, config=None, userconfig=None, **kwargs):
+    def __init__(
+        self, fdb=None, config=None, userconfig=None, *, workers=None, max_in_flight=None, batch_size=None, **kwargs
+    ):
         super().__init__(**kwargs)
         self._fdb = fdb
         self._fdb_kwargs = {}
@@ -26,6 +52,12 @@ class FDBTarget(SimpleTarget):
         if userconfig is not None:
             self._fdb_kwargs["userconfig"] = userconfig
 
+        self._pipeline = None
+        if workers is not None or max_in_flight is not None or batch_size is not None:
+            from earthkit.data.utils.pipeline import EncodingPipeline
+
+            self._pipeline = EncodingPipeline(workers=workers, max_in_flight=max_in_flight, batch_size=batch_size)
+
     @property
     def fdb(self):
         if self._fdb is None:
@@ -34,6 +66,14 @@ class FDBTarget(SimpleTarget):
             self._fdb = pyfdb.FDB(**self._fdb_kwargs)
         return self._fdb
 
+    @property
+    def stats(self):
+        """PipelineStats: Throughput statistics of the encoding pipeline. None when
+        the target was created without ``workers``, ``max_in_flight`` or ``batch_size``.
+        """
+        if self._pipeline is not None:
+            return self._pipeline.stats
+
     def close(self):
         """Close the target and flush the fdb.
 
@@ -58,8 +98,11 @@ class FDBTarget(SimpleTarget):
     def _write(self, data, **kwargs):
         r = self._encode(data, **kwargs)
         if hasattr(r, "__iter__"):
-            for d in r:
-                self.fdb.archive(d.to_bytes())
+            if self._pipeline is not None:
+                self._pipeline.archive(r, self.fdb)
+            else:
+                for d in r:
+                    self.fdb.archive(d.to_bytes())
         else:
             self.fdb.archive(r.to_bytes())
 
@@ -31,6 +31,16 @@ class FileTarget(SimpleTarget):
         the file object is not closed when the target is closed, even if :obj:`close` is called explicitly.
     append: bool
         If True, the file is opened in append mode. Only used if ``file`` is a path.
+    workers: int, None
+        Number of threads used to encode the messages when writing a FieldList. The messages
+        are still written in their original order. When None, the messages are encoded and
+        written one by one in the calling thread.
+    max_in_flight: int, None
+        Maximum number of encoded messages held in memory while waiting to be written.
+        When None, it defaults to twice the number of ``workers``.
+    batch_size: int, None
+        Maximum number of messages gathered into a single write call.
+        When None, each message is written separately.
     **kwargs:
         Additional keyword arguments passed to the parent class.
 
@@ -41,7 +51,7 @@ class FileTarget(SimpleTarget):
 
     _name = "file"
 
-    def __init__(self, file=None, *, append=False, **kwargs):
+    def __init__(self, file=None, *, append=False, workers=None, max_in_flight=None, batch_size=None, **kwargs):
         super().__init__(**kwargs)
 
         self.fileobj = None
@@ -49,6 +59,12 @@ class FileTarget(SimpleTarget):
         self.filename = None
         self.append = append
         self.ext = None
+        self._pipeline = None
+
+        if workers is not None or max_in_flight is not None or batch_size is not None:
+            from earthkit.data.utils.pipeline import EncodingPipeline
+
+            self._pipeline = EncodingPipeline(workers=workers, max_in_flight=max_in_flight, batch_size=batch_size)
 
         if isinstance(file, IOBase):
             self.fileobj = file
@@ -63,6 +79,14 @@ class FileTarget(SimpleTarget):
             if not self.filename:
                 raise ValueError("Please provide an output filename")
 
+    @property
+    def stats(self):
+        """PipelineStats: Throughput statistics of the encoding pipeline. None when
+        the target was created without ``workers``, ``max_in_flight`` or ``batch_size``.
+        """
+        if self._pipeline is not None:
+            return self._pipeline.stats
+
     def close(self):
         """Close the file if :obj:`FileTarget` was created with a file path.
 
@@ -131,8 +155,11 @@ class FileTarget(SimpleTarget):
         r = self._encode(data, suffix=self.ext, **kwargs)
         if hasattr(r, "__iter__"):
             f = self._f()
-            for d in r:
-                d.to_file(f)
+            if self._pipeline is not None:
+                self._pipeline.write_file(r, f)
+            else:
+                for d in r:
+                    d.to_file(f)
         else:
             if self.filename and r.prefer_file_path:
                 r.to_file(self.filename)
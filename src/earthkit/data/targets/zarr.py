@@ -7,6 +7,7 @@
 # nor does it submit to any jurisdiction.
 #
 
+import itertools
 import logging
 
 from . import SimpleTarget
@@ -15,14 +16,54 @@ LOG = logging.getLogger(__name__)
 
 
 class ZarrTarget(SimpleTarget):
+    """
+    Zarr target.
+
+    Parameters
+    ----------
+    earthkit_to_xarray_kwargs: dict, None
+        Keyword arguments passed to :func:`to_xarray` when the data is converted into an Xarray dataset.
+    xarray_to_zarr_kwargs: dict, None
+        Keyword arguments passed to :py:meth:`xarray.Dataset.to_zarr`. As a bare minimum, the ``store``
+        keyword argument must be provided.
+    streaming: bool
+        When True, the data is written incrementally instead of converting it into a single
+        in-memory Xarray dataset. See :class:`ZarrStreamWriter` for details.
+    batch_size: int, None
+        The number of fields converted and written at once in streaming mode.
+        When None, the fields are written one by one.
+    append_dim: str, None
+        In streaming mode, the dimension along which the store is extended when the data
+        contains coordinate values not present in the store layout.
+    workers: int, None
+        The number of threads used to write the batches in streaming mode. When None or 1
+        the batches are written sequentially.
+    resume: bool
+        In streaming mode, when True and the store contains the progress record of a previous
+        interrupted write, the batches already written are skipped.
+    **kwargs:
+        Additional keyword arguments passed to the parent class.
+    """
+
     _name = "zarr"
 
-    def __init__(self, **kwargs):
+    def __init__(
+        self,
+        *,
+        streaming=False,
+        batch_size=None,
+        append_dim=None,
+        workers=None,
+        resume=False,
+        **kwargs,
+    ):
         super().__init__(**kwargs)
         self._zarr_kwargs = kwargs
         self._ekd_kwargs = kwargs.pop("earthkit_to_xarray_kwargs", {})
         self._xr_kwargs = kwargs.pop("xarray_to_zarr_kwargs", {})
         self._encoder = "zarr"
+        self._streaming = streaming
+        self._stream_kwargs = dict(batch_size=batch_size, append_dim=append_dim, workers=workers, resume=resume)
 
     def close(self):
         """Close the target and flush the fdb.
@@ -45,9 +86,427 @@ class ZarrTarget(SimpleTarget):
         pass
 
     def _write(self, data, **kwargs):
-        r = self._encode(data, earthkit_to_xarray_kwargs=self._ekd_kwargs)
-        ds = r.to_xarray()
-        ds.to_zarr(**self._xr_kwargs)
+        if self._streaming:
+            writer = ZarrStreamWriter(
+                earthkit_to_xarray_kwargs=self._ekd_kwargs,
+                xarray_to_zarr_kwargs=self._xr_kwargs,
+                **self._stream_kwargs,
+            )
+            writer.write(data)
+        else:
+            r = self._encode(data, earthkit_to_xarray_kwargs=self._ekd_kwargs)
+            ds = r.to_xarray()
+            ds.to_zarr(**self._xr_kwargs)
+
+
+class ZarrStreamWriter:
+    """Write a fieldlist into a Zarr store incrementally.
+
+    The layout of the store (dimensions, coordinates and empty data arrays) is created
+    from the field metadata only. When the data is a fieldlist supporting ``len()`` the
+    layout is generated from all the fields, otherwise (e.g. for a stream) it is inferred
+    from the first batch and extended along ``append_dim`` when new coordinate values arrive.
+    The fields are then converted into Xarray in batches and each batch is written into
+    its region of the store. A batch not forming a hypercube is written field by field.
+
+    The data arrays are chunked per field by default, so the regions written by different
+    batches never share a chunk and can be written in parallel. When the ``chunks`` are
+    specified in ``earthkit_to_xarray_kwargs`` they are used for the layout instead. The
+    regions partly covering these chunks are then written one at a time, even when
+    ``workers`` is used.
+
+    The number of batches written is recorded in the store attributes, which allows an
+    interrupted write to be resumed.
+    """
+
+    PROGRESS_ATTR = "earthkit_zarr_stream"
+    _REGION_KWARGS_IGNORED = ("store", "mode", "append_dim", "region", "compute", "encoding", "consolidated")
+
+    def __init__(
+        self,
+        earthkit_to_xarray_kwargs=None,
+        xarray_to_zarr_kwargs=None,
+        batch_size=None,
+        append_dim=None,
+        workers=None,
+        resume=False,
+    ):
+        self.ekd_kwargs = dict(earthkit_to_xarray_kwargs or {})
+        self.xr_kwargs = dict(xarray_to_zarr_kwargs or {})
+        if "store" not in self.xr_kwargs:
+            raise ValueError("xarray_to_zarr_kwargs must contain the 'store'")
+
+        self.store = self.xr_kwargs["store"]
+        self.batch_size = batch_size if batch_size is not None else 1
+        if self.batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+        self.append_dim = append_dim
+        self.workers = workers
+        self.resume = resume
+        self.consolidated = self.xr_kwargs.get("consolidated", None) is not False
+
+        self._region_kwargs = {k: v for k, v in self.xr_kwargs.items() if k not in self._REGION_KWARGS_IGNORED}
+        self._indexes = {}
+        self._sizes = {}
+        self._vars = {}
+        self._before_extend = None
+
+    def write(self, data):
+        data = self._to_fieldlist(data)
+        batches = data.batched(self.batch_size)
+
+        progress = self._read_progress() if self.resume else None
+        if progress is not None:
+            if progress.get("batch_size") != self.batch_size:
+                raise ValueError(
+                    f"Cannot resume writing with batch_size={self.batch_size}, "
+                    f"the store was written with batch_size={progress.get('batch_size')}"
+                )
+            if progress.get("complete", False):
+                LOG.debug(f"Zarr store {self.store} is already complete")
+                return
+            done = progress.get("batches", 0)
+            self._load_layout()
+            batches = itertools.islice(batches, done, None)
+        else:
+            done = 0
+            if self._has_len(data):
+                self._create_layout(data)
+            else:
+                first = next(batches, None)
+                if first is None:
+                    return
+                self._create_layout(first)
+                batches = itertools.chain([first], batches)
+
+        if self.workers is None or self.workers <= 1:
+            for batch in batches:
+                for name, var, region in self._prepare_batch(batch):
+                    self._write_region(name, var, region)
+                done += 1
+                self._write_progress(done)
+        else:
+            done = self._write_parallel(batches, done)
+
+        self._write_progress(done, complete=True)
+        if self.consolidated:
+            import zarr
+
+            zarr.consolidate_metadata(self.store)
+
+    def _write_parallel(self, batches, done):
+        from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+        # the batches are prepared (and the store is extended) in this thread, only
+        # the region writes are done by the workers
+        max_pending = 2 * self.workers
+        pending = {}
+        finished = set()
+        next_id = done
+
+        def _advance():
+            nonlocal done
+            while done in finished:
+                finished.discard(done)
+                done += 1
+            self._write_progress(done)
+
+        def _collect(return_when):
+            r, _ = wait(pending, return_when=return_when)
+            for f in r:
+                f.result()
+                batch_id = pending.pop(f)
+                counts[batch_id] -= 1
+                if counts[batch_id] == 0:
+                    del counts[batch_id]
+                    finished.add(batch_id)
+            _advance()
+
+        def _drain():
+            while pending:
+                _collect(FIRST_COMPLETED)
+
+        counts = {}
+        # the store layout must not change while regions are being written
+        self._before_extend = _drain
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for batch in batches:
+                items = []
+                for name, var, region in self._prepare_batch(batch):
+                    if self._aligned(name, region):
+                        items.append((name, var, region))
+                    else:
+                        # the chunks partly covered by the region can be shared with other
+                        # regions, so it is written here and never concurrently
+                        self._write_region(name, var, region)
+                if items:
+                    counts[next_id] = len(items)
+                    for name, var, region in items:
+                        pending[executor.submit(self._write_region, name, var, region)] = next_id
+                else:
+                    finished.add(next_id)
+                next_id += 1
+
+                while len(pending) >= max_pending:
+                    _collect(FIRST_COMPLETED)
+
+            _drain()
+            _advance()
+        self._before_extend = None
+        return done
+
+    @staticmethod
+    def _to_fieldlist(data):
+        from earthkit.data.core.fieldlist import FieldList
+
+        if not isinstance(data, FieldList) and hasattr(data, "to_fieldlist"):
+            data = data.to_fieldlist()
+        if not hasattr(data, "batched"):
+            raise ValueError(f"Cannot write data of type {type(data)} to Zarr in streaming mode")
+        return data
+
+    @staticmethod
+    def _has_len(data):
+        try:
+            len(data)
+            return True
+        except Exception:
+            return False
+
+    def _to_xarray(self, fieldlist, dims=None, **extra_kwargs):
+        kwargs = dict(self.ekd_kwargs)
+        kwargs.update(extra_kwargs)
+        ensure_dims = kwargs.pop("ensure_dims", None) or []
+        if isinstance(ensure_dims, str):
+            ensure_dims = [ensure_dims]
+        ensure_dims = list(ensure_dims)
+        for d in dims or []:
+            if d not in ensure_dims:
+                ensure_dims.append(d)
+        if ensure_dims:
+            kwargs["ensure_dims"] = ensure_dims
+        return fieldlist.to_xarray(**kwargs)
+
+    def _create_layout(self, fieldlist):
+        import xarray as xr
+
+        dims = [self.append_dim] if self.append_dim else None
+        try:
+            ds = self._to_xarray(fieldlist, dims=dims)
+        except ValueError:
+            # only the coordinates are needed for the layout
+            ds = self._to_xarray(fieldlist, dims=dims, allow_holes=True)
+
+        field_size = self._field_size(fieldlist)
+        data_vars = {name: self._empty_variable(var, field_size) for name, var in ds.data_vars.items()}
+
+        coords = ds.coords
+        encoding = dict(self.xr_kwargs.get("encoding", None) or {})
+        if self.append_dim:
+            # auxiliary coordinates spanning the append dimension cannot be extended
+            drop = [k for k, v in ds.coords.items() if self.append_dim in v.dims and k != self.append_dim]
+            if drop:
+                LOG.warning(f"Zarr streaming: dropping coordinates {drop} spanning append_dim={self.append_dim}")
+                coords = ds.drop_vars(drop).coords
+
+            # the units of a time coordinate are fixed by the first write, so they must be
+            # able to represent the values appended later
+            kind = ds[self.append_dim].dtype.kind
+            if kind in ("m", "M") and self.append_dim not in encoding:
+                units = "seconds" if kind == "m" else "seconds since 1970-01-01"
+                encoding[self.append_dim] = {"units": units, "dtype": "int64"}
+
+        layout = xr.Dataset(data_vars, coords=coords, attrs=ds.attrs)
+        layout.to_zarr(
+            self.store,
+            mode=self.xr_kwargs.get("mode", "w-"),
+            compute=False,
+            consolidated=False,
+            encoding=encoding,
+            **self._region_kwargs,
+        )
+        self._write_progress(0)
+        self._load_layout()
+
+    def _add_variable(self, var, field_size):
+        import xarray as xr
+
+        if self._before_extend is not None:
+            self._before_extend()
+
+        shape = tuple(self._sizes[d] for d in var.dims)
+        empty = self._empty_variable(var, field_size, shape=shape)
+        ds = xr.Dataset({var.name: empty})
+        ds.to_zarr(self.store, mode="a", compute=False, consolidated=False, **self._region_kwargs)
+        self._vars[var.name] = (empty.dims, empty.dtype, tuple(c[0] for c in empty.chunks))
+
+    @staticmethod
+    def _field_size(fieldlist):
+        import numpy as np
+
+        return int(np.prod(fieldlist[0].shape))
+
+    def _empty_variable(self, var, field_size, shape=None):
+        import dask.array as da
+        import xarray as xr
+
+        if shape is None:
+            shape = var.shape
+        if var.chunks is not None:
+            chunks = tuple(min(c[0], s) for c, s in zip(var.chunks, shape))
+        else:
+            chunks = self._field_chunks(shape, field_size)
+        return xr.Variable(var.dims, da.empty(shape, chunks=chunks, dtype=var.dtype), attrs=var.attrs)
+
+    @staticmethod
+    def _field_chunks(shape, field_size):
+        # the trailing dimensions spanning a field are stored in a single chunk,
+        # all the other dimensions are chunked by 1
+        chunks = [1] * len(shape)
+        size = 1
+        for i in range(len(shape) - 1, -1, -1):
+            chunks[i] = shape[i]
+            size *= shape[i]
+            if size >= field_size:
+                break
+        return tuple(chunks)
+
+    def _load_layout(self):
+        import xarray as xr
+
+        ds = xr.open_zarr(self.store, consolidated=False, **self._open_kwargs())
+        self._indexes = {k: v for k, v in ds.indexes.items()}
+        self._sizes = dict(ds.sizes)
+        self._vars = {name: (var.dims, var.dtype, var.encoding.get("chunks")) for name, var in ds.data_vars.items()}
+
+    def _open_kwargs(self):
+        return {k: v for k, v in self._region_kwargs.items() if k in ("storage_options", "zarr_format")}
+
+    def _group(self, mode="r+"):
+        import zarr
+
+        return zarr.open_group(self.store, mode=mode, use_consolidated=False)
+
+    def _read_progress(self):
+        try:
+            return self._group(mode="r").attrs.get(self.PROGRESS_ATTR, None)
+        except Exception:
+            return None
+
+    def _write_progress(self, batches, complete=False):
+        self._group().attrs[self.PROGRESS_ATTR] = {
+            "batch_size": self.batch_size,
+            "batches": batches,
+            "complete": complete,
+        }
+
+    def _prepare_batch(self, batch):
+        """Convert a batch into Xarray and yield the (name, variable, region) items to write."""
+        dims = [d for d in self._sizes]
+        try:
+            datasets = [self._to_xarray(batch, dims=dims)]
+        except ValueError:
+            # not a hypercube, write the fields one by one
+            LOG.debug("Zarr streaming: batch is not a hypercube, writing fields one by one")
+            datasets = (self._to_xarray(batch[i : i + 1], dims=dims) for i in range(len(batch)))
+
+        for ds in datasets:
+            for name, var in ds.data_vars.items():
+                if name not in self._vars:
+                    self._add_variable(var, self._field_size(batch))
+                if var.dims != self._vars[name][0]:
+                    raise ValueError(
+                        f"Zarr streaming: variable {name} has dims={var.dims}, expected {self._vars[name][0]}"
+                    )
+                for indexers, region in self._regions(var):
+                    yield name, var.isel(indexers), region
+
+    def _positions(self, var, dim):
+        import numpy as np
+
+        index = self._indexes.get(dim)
+        if index is None:
+            if var.sizes[dim] != self._sizes[dim]:
+                raise ValueError(
+                    f"Zarr streaming: dimension {dim} has size {var.sizes[dim]}, expected {self._sizes[dim]}"
+                )
+            return np.arange(var.sizes[dim])
+
+        values = var[dim].values
+        pos = index.get_indexer(values)
+        if (pos < 0).any():
+            if dim != self.append_dim:
+                raise ValueError(f"Zarr streaming: values {values[pos < 0]} of dimension {dim} not in the store")
+            self._extend(dim, values[pos < 0])
+            pos = self._indexes[dim].get_indexer(values)
+        return pos
+
+    def _regions(self, var):
+        """Yield the (indexers, region) pairs covering the contiguous runs of ``var`` in the store."""
+        import numpy as np
+
+        runs = []
+        for dim in var.dims:
+            pos = self._positions(var, dim)
+            order = np.argsort(pos, kind="stable")
+            pos = pos[order]
+            breaks = np.flatnonzero(np.diff(pos) != 1) + 1
+            starts = [0, *breaks.tolist()]
+            ends = [*breaks.tolist(), len(pos)]
+            runs.append([(order[s:e], slice(int(pos[s]), int(pos[e - 1]) + 1)) for s, e in zip(starts, ends)])
+
+        for item in itertools.product(*runs):
+            indexers = {d: r[0] for d, r in zip(var.dims, item)}
+            region = {d: r[1] for d, r in zip(var.dims, item)}
+            yield indexers, region
+
+    def _aligned(self, name, region):
+        """Check if the region of a variable only covers whole chunks of the store."""
+        dims, _, chunks = self._vars[name]
+        if chunks is None:
+            return True
+        for d, c in zip(dims, chunks):
+            r = region[d]
+            if r.start % c != 0 or (r.stop % c != 0 and r.stop != self._sizes[d]):
+                return False
+        return True
+
+    def _extend(self, dim, values):
+        import dask.array as da
+        import pandas as pd
+        import xarray as xr
+
+        if self._before_extend is not None:
+            self._before_extend()
+
+        values = pd.unique(values)
+        data_vars = {}
+        for name, (dims, dtype, chunks) in self._vars.items():
+            if dim in dims:
+                shape = tuple(len(values) if d == dim else self._sizes[d] for d in dims)
+                if chunks is not None:
+                    chunks = tuple(min(c, s) for c, s in zip(chunks, shape))
+                else:
+                    chunks = shape
+                data_vars[name] = xr.Variable(dims, da.empty(shape, chunks=chunks, dtype=dtype))
+
+        ds = xr.Dataset(data_vars, coords={dim: values})
+        ds.to_zarr(
+            self.store,
+            append_dim=dim,
+            compute=False,
+            consolidated=False,
+            **self._region_kwargs,
+        )
+        self._indexes[dim] = self._indexes[dim].append(pd.Index(values))
+        self._sizes[dim] += len(values)
+
+    def _write_region(self, name, var, region):
+        ds = var.load().to_dataset(name=name)
+        ds = ds.drop_vars(list(ds.coords))
+        ds[name].attrs = {}
+        ds[name].encoding = {}
+        ds.to_zarr(self.store, region=region, mode="r+", consolidated=False, **self._region_kwargs)
 
 
 target = ZarrTarget
@@ -11,6 +11,26 @@ import math
 
 from earthkit.utils.array import array_namespace
 
+from earthkit.data.core.config import CONFIG
+
+
+def default_array_dtype(dtype=None):
+    """Return ``dtype`` or the ``default-array-dtype`` config option when ``dtype`` is None.
+
+    Parameters
+    ----------
+    dtype: str, array.dtype or None
+        The requested dtype.
+
+    Returns
+    -------
+    str, array.dtype or None
+        The dtype to use. None means the type of the underlying data accessor.
+    """
+    if dtype is None:
+        return CONFIG.get("default-array-dtype")
+    return dtype
+
 
 def flatten_array(array):
     """Flatten the array without copying the data.
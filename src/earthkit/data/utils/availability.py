@@ -176,21 +176,24 @@ class Availability:
         query = kwargs
 
         if not reasons:
-
-            def iterate_request(r):
-                yield from (dict(zip(r.keys(), x)) for x in itertools.product(*r.values()))
-
-            def build(x):
-                # if isinstance(x, (list, tuple)):
-                #    return [None] + list(x)
-                return [None, x]
-
-            r = {k: build(v) for k, v in query.items()}
+            # Each combination selects a subset of the query keys, in the same order as
+            # itertools.product(*[[None, v] for v in query.values()]). Adding keys to an
+            # unavailable combination cannot make it available, so only the combinations
+            # whose subsets are all available need to be counted.
+            names = list(query.keys())
+            masks = list(itertools.product((False, True), repeat=len(names)))
+
+            unavailable = set()
+            for mask in sorted(masks, key=sum):
+                if any(mask[:j] + (False,) + mask[j + 1 :] in unavailable for j in range(len(mask)) if mask[j]):
+                    unavailable.add(mask)
+                elif self.count(self._combination(query, names, mask)) == 0:
+                    unavailable.add(mask)
 
             lst = []
-            for i in iterate_request(r):
-                if self.count(i) == 0:
-                    i = _tidy_dict(i)
+            for mask in masks:
+                if mask in unavailable:
+                    i = self._combination(query, names, mask)
                     lst.append((abs(len(i) - 2), i))
 
             lst = sorted(lst, key=lambda x: x[0])
@@ -203,6 +206,10 @@ class Availability:
 
         raise ValueError(f"{list_to_human(reasons)}.")
 
+    @staticmethod
+    def _combination(query, names, mask):
+        return _tidy_dict({k: query[k] if m else None for k, m in zip(names, mask)})
+
     def __len__(self):
         return self.count()
 
@@ -87,13 +87,13 @@ def apply_ufunc(func, *args):
                     num = n
                     d = a
         if d is not None:
-            return get_method("loop").apply_ufunc(func, d, *x)
+            return get_method().apply_ufunc(func, d, *x)
 
         for a in x:
             if isinstance(a, Field):
                 d = a
                 d = FieldList.from_fields([d])
-                r = get_method("loop").apply_ufunc(func, d, *x)
+                r = get_method().apply_ufunc(func, d, *x)
                 assert len(r) == 1
                 return r
 
@@ -237,10 +237,246 @@ class LoopCompute(Compute):
         return SimpleFieldList.from_fields(r)
 
 
-methods = {"loop": LoopCompute}
+class StackedCompute(Compute):
+    """Compute on the values of all the fields stacked into a single array.
 
+    The operator is applied only once on the stacked array and the rows of the
+    result are wrapped into fields sharing the metadata of the source fields. Fields
+    with different number of values cannot be stacked, in this case the computation
+    falls back to :class:`LoopCompute`.
+    """
+
+    @staticmethod
+    def stack(ref, x, flatten=True):
+        """Return ``x`` as an array with one row per field, broadcastable against the
+        stacked values of ``ref``.
+        """
+        from earthkit.data.core.field import Field
+        from earthkit.data.core.fieldlist import FieldList
+
+        x = from_object(x)
+
+        if isinstance(x, FieldList):
+            return x.values if flatten else x.to_numpy()
+        elif isinstance(x, Field):
+            v = x.values if flatten else x.to_numpy()
+            return v[None, ...]
+        elif hasattr(x, "to_numpy"):
+            from earthkit.utils.array import array_namespace
+
+            x_val = x.to_numpy()
+            xp = array_namespace(x_val)
+            x_val = xp.asarray(x_val)
+
+            ref_field_shape = ref[0].shape
+            ref_size = math.prod(ref_field_shape)
+            x_shape = x_val.shape
+
+            r = None
+            if x_val.size == 1:
+                r = xp.reshape(x_val, (1, 1))
+            elif len(x_shape) > 1 and math.prod(x_shape[1:]) == ref_size:
+                r = xp.reshape(x_val, (x_shape[0], ref_size))
+            elif len(x_shape) == 1 and x_shape[0] == ref_size:
+                r = xp.reshape(x_val, (1, ref_size))
+            elif x_shape[0] == len(ref):
+                r = xp.reshape(x_val, (x_shape[0], 1))
+
+            if r is None:
+                assumed_ref_shape = tuple([len(ref), *ref_field_shape])
+                raise ValueError(f"y shape={x_val.shape} cannot be used with x shape={assumed_ref_shape}")
+
+            if not flatten:
+                shape = ref_field_shape if r.shape[1] > 1 else (1,) * len(ref_field_shape)
+                r = xp.reshape(r, (r.shape[0], *shape))
+            return r
+
+        raise ValueError(f"y type={type(x)} cannot be used with x type={type(ref)}")
+
+    @staticmethod
+    def _stack_ref(x, flatten=True):
+        try:
+            return x.values if flatten else x.to_numpy()
+        except ValueError:
+            # the fields have different shapes
+            return None
+
+    @staticmethod
+    def _wrap(fields, v):
+        from earthkit.data.core.fieldlist import FieldList
+
+        return FieldList.from_fields([f.set(values=row) for f, row in zip(fields, v)])
+
+    @staticmethod
+    def unary_op(oper, x):
+        vx = StackedCompute._stack_ref(x)
+        if vx is None:
+            return LoopCompute.unary_op(oper, x)
+
+        v = oper(vx)
+        return x.from_fields([f._set_values(row) for f, row in zip(x, v)])
+
+    @staticmethod
+    def binary_op(oper, x, y):
+        from itertools import repeat
+
+        from earthkit.data.core.fieldlist import FieldList
+
+        assert isinstance(x, FieldList), f"Expected FieldList for x, got {type(x)}"
+
+        vx = StackedCompute._stack_ref(x)
+        if vx is None:
+            return LoopCompute.binary_op(oper, x, y)
+
+        vy = StackedCompute.stack(x, y)
+        if vy.shape[0] == 0:
+            raise ValueError("FieldList y must not be empty")
+        if vx.shape[0] != vy.shape[0] and vx.shape[0] != 1 and vy.shape[0] != 1:
+            raise ValueError("FieldLists must have the same length or one of them must be 1")
+
+        v = oper(vx, vy)
+        fields = x if len(x) == v.shape[0] else repeat(x[0], v.shape[0])
+        return StackedCompute._wrap(fields, v)
+
+    @staticmethod
+    def apply_ufunc(func, ref, *args, template=None):
+        from earthkit.data.indexing.simple import SimpleFieldList
+
+        vx = StackedCompute._stack_ref(ref, flatten=False)
+        if vx is None:
+            return LoopCompute.apply_ufunc(func, ref, *args, template=template)
+
+        x = [from_object(a) for a in args]
+        ds = []
+        for i, a in enumerate(x):
+            if a is ref:
+                ds.append(vx)
+                continue
+
+            a = StackedCompute.stack(ref, a, flatten=False)
+            if a.shape[0] == 0:
+                raise ValueError(f"FieldList {a} at index={i} must not be empty")
+            if a.shape[0] != len(ref) and a.shape[0] != 1:
+                raise ValueError("FieldLists must have the same length or one of them must be 1")
+            ds.append(a)
+
+        v = func(*ds)
+        return SimpleFieldList.from_fields([f.set(values=row) for f, row in zip(ref, v)])
+
+
+class Expression:
+    """Lazily evaluated arithmetic expression on fieldlists.
+
+    Operators applied on an :class:`Expression` only build an expression tree. When
+    :meth:`compute` is called, the whole tree is evaluated on the stacked field values
+    in a single pass, without creating intermediate fieldlists. The metadata of the
+    resulting fields is taken from the leftmost fieldlist with the largest number of
+    fields.
+
+    Use :meth:`FieldList.lazy` to create an expression.
+
+    >>> import earthkit.data as ekd
+    >>> a, b, c = ...  # fieldlists
+    >>> r = ((a.lazy() - b) * c).compute()
+    """
+
+    def __init__(self, oper=None, *args):
+        self.oper = oper
+        self.args = args
+
+    def _unary_op(self, oper):
+        return Expression(oper, self)
+
+    def _binary_op(self, oper, y):
+        return Expression(oper, self, y)
+
+    def _leaves(self):
+        from earthkit.data.core.fieldlist import FieldList
+
+        for a in self.args:
+            if isinstance(a, Expression):
+                yield from a._leaves()
+            elif isinstance(a, FieldList):
+                yield a
+
+    def _ref(self):
+        ref = None
+        for a in self._leaves():
+            if ref is None or len(a) > len(ref):
+                ref = a
+        if ref is None:
+            raise ValueError("Expression must contain at least one FieldList")
+        return ref
+
+    def __len__(self):
+        return len(self._ref())
+
+    def compute(self, batch_size=None):
+        """Evaluate the expression.
+
+        Parameters
+        ----------
+        batch_size: int, None
+            The number of fields evaluated together. When None, all the fields are
+            evaluated at once. Smaller values reduce the memory needed to evaluate
+            the expression.
+
+        Returns
+        -------
+        FieldList
+        """
+        from earthkit.data.core.fieldlist import FieldList
+
+        ref = self._ref()
+        n = len(ref)
+        if batch_size is None or batch_size < 1:
+            batch_size = max(n, 1)
+
+        # operands that do not vary with the fields are only stacked once
+        cache = {}
+        fields = []
+        for start in range(0, n, batch_size):
+            v = self._eval(ref, slice(start, min(start + batch_size, n)), cache)
+            fields.extend(f.set(values=row) for f, row in zip(ref[start : start + batch_size], v))
+        return FieldList.from_fields(fields)
+
+    def _eval(self, ref, rows, cache):
+        if self.oper is None:
+            return self._eval_arg(self.args[0], ref, rows, cache)
+        return self.oper(*[self._eval_arg(a, ref, rows, cache) for a in self.args])
+
+    @staticmethod
+    def _eval_arg(a, ref, rows, cache):
+        from earthkit.data.core.fieldlist import FieldList
+
+        if isinstance(a, Expression):
+            return a._eval(ref, rows, cache)
+
+        if isinstance(a, FieldList) and len(a) == len(ref) and len(a) > 1:
+            return a[rows].values
+
+        key = id(a)
+        if key not in cache:
+            v = StackedCompute.stack(ref, a)
+            if v.shape[0] != 1 and v.shape[0] != len(ref):
+                raise ValueError("FieldLists must have the same length or one of them must be 1")
+            cache[key] = (a, v)
+        v = cache[key][1]
+        return v if v.shape[0] == 1 else v[rows]
+
+
+wrap_maths(Expression)
+
+
+methods = {"loop": LoopCompute, "stacked": StackedCompute}
+
+
+def get_method(method=None):
+    if method is None:
+        from earthkit.data.core.config import CONFIG
+
+        method = CONFIG.get("fieldlist-compute-method")
 
-def get_method(method):
     m = methods.get(method)
     if m is None:
         raise ValueError(f"Unknown method: {method}")
@@ -351,8 +351,10 @@ class Tree:
 
     def missing(self, **kwargs):
         request = self._kwargs_to_request(**kwargs)
+        # only the part of the tree matching the request can intersect with it
+        selected = self._select(dict(request))
         user = {_to_hashable(x) for x in self._iterate_request(request)}
-        tree = {_to_hashable(x) for x in self.iterate(True)}
+        tree = set() if selected is None else {_to_hashable(x) for x in selected.iterate(True)}
 
         s = [_from_hashable(x) for x in user.difference(user.intersection(tree))]
 
@@ -539,6 +541,8 @@ class Column(object):
         self.values = values
         self.prio = 0
         self.diff = -1
+        # True while the column only contains scalars (i.e. not factorised tuples)
+        self.scalar = not any(isinstance(v, tuple) for v in values)
 
     def __lt__(self, other):
         return (self.prio, self.diff, self.title) < (
@@ -551,6 +555,8 @@ class Column(object):
         return self.values[i]
 
     def set_value(self, i, v):
+        if isinstance(v, tuple):
+            self.scalar = False
         self.values[i] = v
 
     def compute_differences(self, idx):
@@ -613,25 +619,31 @@ class Table(object):
             self.factorise2(len(self.colidx) - i - 1)
 
     def factorise2(self, n):
-        remap = defaultdict(list)
-        gone = []
-
-        for i in range(len(self.rowidx)):
-            v = self.one_less(i, n)
-            s = remap[_as_tuple(v)]
-            if len(s) != 0:
-                gone.append(i)
-            elem = self.get_elem(n, i)
-            if elem not in s:
-                s.append(elem)
-
-        for g in reversed(gone):
-            del self.rowidx[g]
-
-        for i in range(len(self.rowidx)):
-            v = self.one_less(i, n)
-            s = remap[_as_tuple(v)]
-            self.set_elem(n, i, _as_tuple(s))
+        remap = {}
+        kept = []
+        keys = []
+
+        columns = [self.cols[idx].values for idx in self.colidx]
+        others = [c for i, c in enumerate(columns) if i != n]
+        column = columns[n]
+
+        for row in self.rowidx:
+            v = _as_tuple([c[row] for c in others])
+            elem = column[row]
+            s = remap.get(v)
+            if s is None:
+                remap[v] = s = ([], set())
+                kept.append(row)
+                keys.append(v)
+            # the set is only used to speed up the membership test, the list keeps the order
+            if elem not in s[1]:
+                s[0].append(elem)
+                s[1].add(elem)
+
+        self.rowidx = kept
+
+        for i, v in enumerate(keys):
+            self.set_elem(n, i, _as_tuple(remap[v][0]))
 
     def sort_columns(self):
         """Sort the columns on the number of unique values (this column.diff)."""
@@ -675,7 +687,27 @@ class Table(object):
         return 0
 
     def sort_rows(self):
-        self.rowidx.sort(key=cmp_to_key(self.compare_rows))
+        if all(self.cols[idx].scalar for idx in self.colidx):
+            self._sort_scalar_rows()
+        else:
+            self.rowidx.sort(key=cmp_to_key(self.compare_rows))
+
+    def _sort_scalar_rows(self):
+        """Sort the rows using integer ranks per column.
+
+        For scalar values :meth:`compare_values` is a total order on (type name, value), so
+        ranking the distinct values of each column once gives the same (stable) result as
+        sorting with :meth:`compare_rows`, without calling it for each pair of rows.
+        """
+        ranks = []
+        for idx in self.colidx:
+            values = self.cols[idx].values
+            # the type is part of the key so that e.g. 1 and True are ranked separately
+            unique = sorted({(type(values[r]), values[r]) for r in self.rowidx}, key=lambda x: _scalar_sort_key(x[1]))
+            rank = {v: i for i, v in enumerate(unique)}
+            ranks.append((values, rank))
+
+        self.rowidx.sort(key=lambda r: tuple(rank[(type(values[r]), values[r])] for values, rank in ranks))
 
     def pop_singles(self):
         """Take the column with just one unique value and add them to the
@@ -721,6 +753,10 @@ class Table(object):
         return self.tree
 
 
+def _scalar_sort_key(v):
+    return (str(type(v)), v) if v is not None else (str(type(v)),)
+
+
 def _scan(r, cols, name, rest):
     """Generate all possible combinations of values. Each set of values is
     stored in a list and each value is repeated as many times so that if taking
@@ -0,0 +1,171 @@
+# (C) Copyright 2020 ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+#
+
+import datetime
+import json
+import logging
+import os
+import re
+import shutil
+import sqlite3
+import threading
+import uuid
+from contextlib import contextmanager
+
+LOG = logging.getLogger(__name__)
+
+# The request keys identifying a field, in the order used to expand a request
+MARS_FIELD_KEYS = ("param", "date", "time", "step", "levelist", "number", "hdate")
+CDS_FIELD_KEYS = ("variable", "date", "time", "pressure_level", "model_level", "leadtime_hour", "step", "number")
+
+# The GRIB keys whose values can match the value of a request key
+GRIB_ALIASES = {
+    "param": ("shortName", "paramId"),
+    "variable": ("shortName", "paramId", "cfVarName", "name"),
+    "date": ("dataDate",),
+    "time": ("dataTime",),
+    "step": ("step",),
+    "leadtime_hour": ("step",),
+    "levelist": ("level",),
+    "pressure_level": ("level",),
+    "model_level": ("level",),
+    "number": ("number",),
+    "hdate": ("hdate",),
+}
+
+_PARAM_TABLE = re.compile(r"^(\d+)\.128$")
+
+
+def normalise_field_value(key, value):
+    """Normalise a request or GRIB value of ``key`` so that the equal values compare equal."""
+    if isinstance(value, datetime.datetime):
+        value = value.strftime("%Y%m%d") if key in ("date", "hdate") else value.strftime("%H%M")
+    elif isinstance(value, datetime.date):
+        value = value.strftime("%Y%m%d")
+
+    if key in ("date", "hdate"):
+        return str(value).replace("-", "")
+
+    if key == "time":
+        s = str(value)
+        if ":" in s:
+            h, m = s.split(":")[:2]
+            return int(h) * 100 + int(m)
+        try:
+            n = int(s)
+        except ValueError:
+            return s
+        # MARS accepts hours as well as HHMM
+        return n * 100 if len(s) <= 2 else n
+
+    s = str(value).strip().lower()
+    if key in ("param", "variable"):
+        m = _PARAM_TABLE.match(s)
+        if m:
+            s = m.group(1)
+        return s.replace(" ", "_")
+
+    try:
+        return int(s)
+    except ValueError:
+        return s
+
+
+def field_key(context, field):
+    """Return the store key of a field.
+
+    Parameters
+    ----------
+    context: dict
+        The request items not identifying individual fields (e.g. class, area, grid).
+    field: dict
+        The request items identifying the field, with a single value each.
+    """
+    field = {k: normalise_field_value(k, v) for k, v in field.items()}
+    return json.dumps({"context": context, "field": field}, sort_keys=True, default=str)
+
+
+class FieldStore:
+    """Local store of GRIB messages indexed by field key.
+
+    The messages are kept in the data files added to the store and their positions are
+    recorded in an SQLite index.
+
+    Parameters
+    ----------
+    directory: str
+        The directory of the store. Created when it does not exist.
+    """
+
+    INDEX = "index.db"
+
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        with self._connection() as db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS fields (key TEXT PRIMARY KEY, path TEXT, offset INTEGER, length INTEGER)"
+            )
+
+    @contextmanager
+    def _connection(self):
+        db = sqlite3.connect(os.path.join(self.directory, self.INDEX), timeout=60)
+        try:
+            with db:
+                yield db
+        finally:
+            db.close()
+
+    def lookup(self, keys):
+        """Return a dict mapping the keys found in the store to their (path, offset, length)."""
+        result = {}
+        keys = list(keys)
+        with self._lock, self._connection() as db:
+            for i in range(0, len(keys), 500):
+                chunk = keys[i : i + 500]
+                q = "SELECT key, path, offset, length FROM fields WHERE key IN (%s)" % ",".join("?" * len(chunk))
+                for key, path, offset, length in db.execute(q, chunk):
+                    path = os.path.join(self.directory, path)
+                    if os.path.exists(path):
+                        result[key] = (path, offset, length)
+        return result
+
+    def add(self, path, entries):
+        """Add the messages of a data file to the store.
+
+        Parameters
+        ----------
+        path: str
+            The data file. It is linked (or copied) into the store.
+        entries: list of tuple
+            The (key, offset, length) of each message to index.
+
+        Returns
+        -------
+        str
+            The path of the data file in the store.
+        """
+        name = f"{uuid.uuid4().hex}.grib"
+        target = os.path.join(self.directory, name)
+        try:
+            os.link(path, target)
+        except OSError:
+            shutil.copyfile(path, target)
+
+        with self._lock, self._connection() as db:
+            db.executemany(
+                "INSERT OR REPLACE INTO fields (key, path, offset, length) VALUES (?, ?, ?, ?)",
+                [(k, name, int(o), int(n)) for k, o, n in entries],
+            )
+        return target
+
+    def __len__(self):
+        with self._lock, self._connection() as db:
+            return db.execute("SELECT COUNT(*) FROM fields").fetchone()[0]
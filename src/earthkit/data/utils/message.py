@@ -13,17 +13,23 @@ import logging
 import os
 import threading
 import time
+from collections import OrderedDict
 from contextlib import contextmanager
 
 import eccodes
 import numpy as np
 
 from earthkit.data.core.caching import CACHE, auxiliary_cache_file
+from earthkit.data.core.config import CONFIG
+from earthkit.data.core.diagnostics import count, instrumented
 
 LOG = logging.getLogger(__name__)
 
 os.environ["ECCODES_GRIB_SHOW_HOUR_STEPUNIT"] = "1"
 
+# os.pread is not available on Windows
+HAS_PREAD = hasattr(os, "pread")
+
 # For some reason, cffi can get stuck in the GC if that function
 # needs to be called defined for the first time in a GC thread.
 try:
@@ -125,6 +131,7 @@ class CodesMessagePositionIndex:
             signed=False,
         )
 
+    @instrumented("message.index.scan")
     def _build(self):
         offsets = []
         lengths = []
@@ -135,6 +142,7 @@ class CodesMessagePositionIndex:
 
         self.offsets = offsets
         self.lengths = lengths
+        count("message.index.messages", len(offsets))
 
     def _load(self):
         if CACHE.policy.use_message_position_index_cache():
@@ -341,31 +349,51 @@ class CodesHandle(eccodes.Message):
             return False
 
 
-class ReaderLRUCache(dict):
-    def __init__(self, size):
-        self.readers = dict()
+class ReaderLRUCache:
+    """LRU cache of the open :class:`CodesReader` objects.
+
+    When ``size`` is None the size is taken from the ``message-reader-cache-size``
+    config option. A reader is closed when it is evicted and no longer used.
+    """
+
+    def __init__(self, size=None):
+        self.readers = OrderedDict()
         self.lock = threading.Lock()
-        self.size = size
+        self._size = size
+
+    @property
+    def size(self):
+        if self._size is None:
+            return CONFIG.get("message-reader-cache-size")
+        return self._size
 
     def __getitem__(self, path_and_cls):
         path = path_and_cls[0]
         cls = path_and_cls[1]
-        key = (path, os.getpid())
+        # the key contains the pid so that a forked process does not share the open files
+        key = (path, cls, os.getpid())
         with self.lock:
-            try:
-                return super().__getitem__(key)
-            except KeyError:
-                pass
+            c = self.readers.get(key)
+            if c is not None:
+                self.readers.move_to_end(key)
+                return c
 
-            c = self[key] = cls(path)
-            while len(self) >= self.size:
-                _, oldest = min((v.last, k) for k, v in self.items())
-                del self[oldest]
+            c = self.readers[key] = cls(path)
+            size = max(1, self.size)
+            while len(self.readers) > size:
+                self.readers.popitem(last=False)
 
             return c
 
+    def __len__(self):
+        return len(self.readers)
 
-cache = ReaderLRUCache(32)  # TODO: Add to config
+    def clear(self):
+        with self.lock:
+            self.readers.clear()
+
+
+cache = ReaderLRUCache()
 
 
 class CodesReader:
@@ -390,9 +418,18 @@ class CodesReader:
     def from_cache(cls, path):
         return cache[(path, cls)]
 
-    def at_offset(self, offset):
+    def at_offset(self, offset, length=None):
+        self.last = time.time()
+        if length is not None and HAS_PREAD:
+            # a positional read does not use the file cursor, so handles can be
+            # created concurrently from the same file without locking
+            message = os.pread(self.file.fileno(), length, offset)
+            if len(message) != length:
+                raise EOFError(f"Cannot read {length} bytes at offset {offset} from {self.path}")
+            handle = eccodes.codes_new_from_message(message)
+            return self.HANDLE_TYPE(handle, self.path, offset)
+
         with self.lock:
-            self.last = time.time()
             self.file.seek(offset, 0)
             handle = eccodes.codes_new_from_file(
                 self.file,
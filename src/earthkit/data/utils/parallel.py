@@ -0,0 +1,152 @@
+# (C) Copyright 2020 ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+#
+
+import logging
+import os
+
+import numpy as np
+
+LOG = logging.getLogger(__name__)
+
+
+class SharedArray(np.ndarray):
+    """A numpy array backed by a shared memory block.
+
+    The shared memory block is released when the array and all the views
+    created from it are deleted.
+    """
+
+    def __array_finalize__(self, obj):
+        self._shm = getattr(obj, "_shm", None)
+
+
+class _SharedArrayRef:
+    """Picklable reference to a numpy array written into a shared memory block."""
+
+    def __init__(self, name, shape, dtype):
+        self.name = name
+        self.shape = shape
+        self.dtype = dtype
+
+    def attach(self):
+        from multiprocessing.shared_memory import SharedMemory
+
+        shm = SharedMemory(name=self.name)
+        array = np.ndarray(self.shape, dtype=self.dtype, buffer=shm.buf).view(SharedArray)
+        array._shm = shm
+        # the memory stays mapped until the array is deleted
+        shm.unlink()
+        return array
+
+    def release(self):
+        from multiprocessing.shared_memory import SharedMemory
+
+        try:
+            shm = SharedMemory(name=self.name)
+            shm.close()
+            shm.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def _to_shared(result):
+    """Replace the numpy arrays in ``result`` with references to shared memory blocks."""
+    if isinstance(result, np.ndarray) and result.dtype != object and result.nbytes > 0:
+        from multiprocessing.shared_memory import SharedMemory
+
+        shm = SharedMemory(create=True, size=result.nbytes)
+        try:
+            np.ndarray(result.shape, dtype=result.dtype, buffer=shm.buf)[...] = result
+        finally:
+            shm.close()
+        return _SharedArrayRef(shm.name, result.shape, result.dtype.str)
+    elif isinstance(result, (list, tuple)):
+        return type(result)(_to_shared(x) for x in result)
+    elif isinstance(result, dict):
+        return {k: _to_shared(v) for k, v in result.items()}
+    return result
+
+
+def _from_shared(result, attach=True):
+    """Replace the shared memory references in ``result`` with numpy arrays."""
+    if isinstance(result, _SharedArrayRef):
+        if attach:
+            return result.attach()
+        result.release()
+        return None
+    elif isinstance(result, (list, tuple)):
+        return type(result)(_from_shared(x, attach=attach) for x in result)
+    elif isinstance(result, dict):
+        return {k: _from_shared(v, attach=attach) for k, v in result.items()}
+    return result
+
+
+def _run_batch(func, batch, shared_memory):
+    result = func(batch)
+    if shared_memory:
+        result = _to_shared(result)
+    return result
+
+
+def _batches(fieldlist, batch_size=None, group_by=None, workers=None):
+    if group_by is not None:
+        if isinstance(group_by, str):
+            group_by = [group_by]
+        return list(fieldlist.group_by(*group_by))
+
+    if batch_size is None:
+        batch_size = max(1, -(-len(fieldlist) // workers))
+
+    if batch_size <= 0:
+        raise ValueError(f"batch_size={batch_size} must be > 0")
+
+    return list(fieldlist.batched(batch_size))
+
+
+def map_batches(fieldlist, func, batch_size=None, group_by=None, workers=None, shared_memory=True):
+    """Apply ``func`` to the batches of a fieldlist in a process pool.
+
+    See :meth:`earthkit.data.core.fieldlist.FieldList.map_batches` for details.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    batches = _batches(fieldlist, batch_size=batch_size, group_by=group_by, workers=workers)
+
+    if workers <= 1 or len(batches) <= 1:
+        return [func(b) for b in batches]
+
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing import resource_tracker
+
+    # The shared memory blocks are created in the workers and released in the parent process.
+    # Starting the tracker before the workers ensures they all register to the same one.
+    if shared_memory:
+        resource_tracker.ensure_running()
+
+    LOG.debug(f"map_batches: {len(batches)} batches, {workers} workers")
+
+    results = []
+    with ProcessPoolExecutor(max_workers=min(workers, len(batches)), mp_context=multiprocessing.get_context()) as ex:
+        futures = [ex.submit(_run_batch, func, b, shared_memory) for b in batches]
+        try:
+            for f in futures:
+                results.append(f.result())
+        except BaseException:
+            for f in futures:
+                f.cancel()
+            for f in futures:
+                if f.done() and not f.cancelled() and f.exception() is None:
+                    _from_shared(f.result(), attach=False)
+            raise
+
+    if shared_memory:
+        results = [_from_shared(r) for r in results]
+    return results
@@ -0,0 +1,250 @@
+# (C) Copyright 2020 ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+#
+
+import io
+import logging
+import os
+import time
+from collections import deque
+
+LOG = logging.getLogger(__name__)
+
+# Upper limit for the number of buffers passed to a single os.writev call.
+# POSIX only guarantees 16, but every platform we support allows at least 1024.
+try:
+    IOV_MAX = os.sysconf("SC_IOV_MAX")
+except (AttributeError, ValueError, OSError):
+    IOV_MAX = 1024
+
+if IOV_MAX is None or IOV_MAX <= 0:
+    IOV_MAX = 1024
+
+
+class PipelineStats:
+    """Throughput statistics collected by an :class:`EncodingPipeline`.
+
+    Attributes
+    ----------
+    messages: int
+        Number of messages written.
+    bytes: int
+        Number of bytes written.
+    writes: int
+        Number of write (or archive) calls issued.
+    encode_time: float
+        Total time spent encoding messages, summed over all the workers (in seconds).
+    write_time: float
+        Total time spent writing messages (in seconds).
+    elapsed: float
+        Wall-clock time spent in the pipeline (in seconds).
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.messages = 0
+        self.bytes = 0
+        self.writes = 0
+        self.encode_time = 0.0
+        self.write_time = 0.0
+        self.elapsed = 0.0
+
+    @property
+    def messages_per_second(self):
+        return self.messages / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def bytes_per_second(self):
+        return self.bytes / self.elapsed if self.elapsed > 0 else 0.0
+
+    def as_dict(self):
+        return dict(
+            messages=self.messages,
+            bytes=self.bytes,
+            writes=self.writes,
+            encode_time=self.encode_time,
+            write_time=self.write_time,
+            elapsed=self.elapsed,
+            messages_per_second=self.messages_per_second,
+            bytes_per_second=self.bytes_per_second,
+        )
+
+    def __repr__(self):
+        from earthkit.data.utils.humanize import bytes as human_bytes
+
+        return (
+            f"{self.__class__.__name__}(messages={self.messages}, bytes={human_bytes(self.bytes)},"
+            f" writes={self.writes}, elapsed={self.elapsed:.3f}s,"
+            f" messages_per_second={self.messages_per_second:.1f})"
+        )
+
+
+class EncodingPipeline:
+    """Encode messages in a worker pool and hand them in order to a single writer.
+
+    Parameters
+    ----------
+    workers: int, None
+        Number of worker threads used for encoding. When None or less than 2
+        the messages are encoded in the calling thread.
+    max_in_flight: int, None
+        Maximum number of messages being encoded or waiting to be written at any
+        time. This bounds the memory used by the pipeline. When None, it defaults to
+        twice the number of ``workers``.
+    batch_size: int, None
+        Maximum number of messages written in a single write (or archive) call.
+        When None, each message is written separately.
+    batch_bytes: int, None
+        Maximum number of bytes written in a single write (or archive) call. A batch
+        is flushed as soon as either this limit or ``batch_size`` is reached.
+    """
+
+    def __init__(self, workers=None, max_in_flight=None, batch_size=None, batch_bytes=None):
+        self.workers = workers if workers is not None else 1
+        if self.workers < 1:
+            raise ValueError(f"workers must be at least one, got {workers}")
+
+        self.max_in_flight = max_in_flight if max_in_flight is not None else 2 * self.workers
+        if self.max_in_flight < 1:
+            raise ValueError(f"max_in_flight must be at least one, got {max_in_flight}")
+
+        self.batch_size = batch_size if batch_size is not None else 1
+        if self.batch_size < 1:
+            raise ValueError(f"batch_size must be at least one, got {batch_size}")
+
+        self.batch_bytes = batch_bytes
+        self.stats = PipelineStats()
+
+    def map(self, func, iterable):
+        """Apply ``func`` to each item of ``iterable`` and yield the results in order.
+
+        At most ``max_in_flight`` results are pending at any time.
+        """
+        if self.workers < 2:
+            for item in iterable:
+                yield self._timed(func, item)
+            return
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            try:
+                for item in iterable:
+                    pending.append(executor.submit(self._timed_call, func, item))
+                    if len(pending) >= self.max_in_flight:
+                        yield self._result(pending.popleft())
+                while pending:
+                    yield self._result(pending.popleft())
+            finally:
+                for f in pending:
+                    f.cancel()
+
+    def write_file(self, encoded, f):
+        """Write the encoded messages to the file object ``f``."""
+        self._run(encoded, lambda batch: self._writev(f, batch))
+
+    def archive(self, encoded, fdb):
+        """Archive the encoded messages into ``fdb``."""
+        self._run(encoded, lambda batch: fdb.archive(b"".join(batch)))
+
+    def _run(self, encoded, write):
+        start = time.perf_counter()
+        try:
+            for batch in self._batches(encoded):
+                t = time.perf_counter()
+                write(batch)
+                self.stats.write_time += time.perf_counter() - t
+                self.stats.writes += 1
+                self.stats.messages += len(batch)
+                self.stats.bytes += sum(len(b) for b in batch)
+        finally:
+            self.stats.elapsed += time.perf_counter() - start
+
+    def _batches(self, encoded):
+        batch = []
+        size = 0
+        for d in encoded:
+            b = d.to_bytes()
+            batch.append(b)
+            size += len(b)
+            if len(batch) >= self.batch_size or (self.batch_bytes is not None and size >= self.batch_bytes):
+                yield batch
+                batch = []
+                size = 0
+        if batch:
+            yield batch
+
+    @staticmethod
+    def _writev(f, batch):
+        if len(batch) == 1:
+            f.write(batch[0])
+            return
+
+        try:
+            fd = f.fileno()
+        except (AttributeError, io.UnsupportedOperation):
+            fd = None
+
+        if fd is None or not hasattr(os, "writev"):
+            f.writelines(batch)
+            return
+
+        # bypass the buffered file object and gather the batch in as few system calls as possible
+        f.flush()
+        for i in range(0, len(batch), IOV_MAX):
+            bufs = [memoryview(b) for b in batch[i : i + IOV_MAX]]
+            while bufs:
+                n = os.writev(fd, bufs)
+                while bufs and n >= len(bufs[0]):
+                    n -= len(bufs[0])
+                    bufs.pop(0)
+                if bufs and n > 0:
+                    bufs[0] = bufs[0][n:]
+
+        # keep the position of the file object in sync with the file descriptor
+        if f.seekable():
+            f.seek(os.lseek(fd, 0, os.SEEK_CUR))
+
+    def _timed(self, func, item):
+        r, t = self._timed_call(func, item)
+        self.stats.encode_time += t
+        return r
+
+    @staticmethod
+    def _timed_call(func, item):
+        t = time.perf_counter()
+        r = func(item)
+        # materialise the message in the worker so the writer only has to copy bytes
+        if hasattr(r, "to_bytes"):
+            r = _EncodedBytes(r)
+        return r, time.perf_counter() - t
+
+    def _result(self, future):
+        r, t = future.result()
+        self.stats.encode_time += t
+        return r
+
+
+class _EncodedBytes:
+    """Wrap an encoded object and cache its bytes representation."""
+
+    def __init__(self, encoded):
+        self.encoded = encoded
+        self._bytes = encoded.to_bytes()
+
+    def to_bytes(self):
+        return self._bytes
+
+    def to_file(self, f):
+        f.write(self._bytes)
+
+    def __getattr__(self, name):
+        return getattr(self.encoded, name)
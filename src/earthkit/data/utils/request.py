@@ -146,6 +146,19 @@ class FileRequestRetriever:
         return path
 
 
+def request_retriever(owner, retriever, field_keys=None):
+    """Create the retriever used by a source to download its requests.
+
+    When the ``field-level-request-cache`` config option is enabled, a
+    :class:`FieldRequestRetriever` is returned, otherwise a :class:`FileRequestRetriever`.
+    """
+    from earthkit.data.core.config import CONFIG
+
+    if CONFIG.get("field-level-request-cache"):
+        return FieldRequestRetriever(owner, retriever=retriever, field_keys=field_keys)
+    return FileRequestRetriever(owner, retriever=retriever)
+
+
 class RequestMapper(metaclass=ABCMeta):
     metadata_alias = None
 
@@ -165,3 +178,170 @@ class RequestMapper(metaclass=ABCMeta):
 
     def __len__(self):
         return len(self.field_requests)
+
+
+class ExpandedRequestMapper(RequestMapper):
+    """Expand a request into one request per field.
+
+    The field requests are the product of the values of the ``field_keys`` present in
+    the request. The other items form the ``context`` shared by all the fields.
+    """
+
+    def __init__(self, request, field_keys, **kwargs):
+        super().__init__(request, **kwargs)
+        self.field_keys = [k for k in field_keys if k in request]
+        self.context = {k: v for k, v in request.items() if k not in self.field_keys}
+
+    @property
+    def expandable(self):
+        """Return True if the values of the field keys can be enumerated."""
+        for k in self.field_keys:
+            for v in ensure_iterable(self.request[k]):
+                # MARS style ranges e.g. "1/to/10/by/2" are not expanded
+                if isinstance(v, str) and "/" in v:
+                    return False
+        return True
+
+    def _build(self):
+        values = [ensure_iterable(self.request[k]) for k in self.field_keys]
+        return [dict(zip(self.field_keys, x)) for x in itertools.product(*values)]
+
+
+class FieldRequestRetriever(FileRequestRetriever):
+    """Retrieve requests field by field using a local field store.
+
+    Each request is expanded into fields (see :class:`ExpandedRequestMapper`) and the
+    fields already in the store are not retrieved again. The missing fields are
+    factorised into compact sub-requests, which are retrieved with ``retriever`` and
+    added to the store. The GRIB messages are matched to their fields by using their
+    metadata, so when any message of a sub-request cannot be matched the whole retrieved
+    file is used as it is.
+
+    The result is a list of (path, parts) pairs, where parts are the (offset, length) of
+    the messages in the order of the expanded requests.
+    """
+
+    def __init__(self, owner, retriever=None, field_keys=None, store=None):
+        super().__init__(owner, retriever=retriever)
+        from earthkit.data.utils.field_store import MARS_FIELD_KEYS
+
+        self.field_keys = field_keys if field_keys is not None else MARS_FIELD_KEYS
+        if store is None:
+            store = self._default_store()
+        self.store = store
+
+    @staticmethod
+    def _default_store():
+        import os
+
+        from earthkit.data.core.caching import CACHE
+        from earthkit.data.core.config import CONFIG
+        from earthkit.data.utils.field_store import FieldStore
+
+        directory = CONFIG.get("field-level-request-cache-directory")
+        if directory is None:
+            directory = os.path.join(CACHE.directory(), "fields")
+        return FieldStore(directory)
+
+    def retrieve(self, requests, *extra_args):
+        from earthkit.data.utils.factorise import factorise
+        from earthkit.data.utils.field_store import field_key
+
+        plan = []
+        missing = {}
+        for request in requests:
+            mapper = ExpandedRequestMapper(request, self.field_keys)
+            if not mapper.field_keys or not mapper.expandable:
+                plan.append((None, request))
+                continue
+
+            context = self._context(mapper.context, extra_args)
+            keys = [field_key(context, f) for f in mapper.field_requests]
+            found = self.store.lookup(keys)
+            for k, f in zip(keys, mapper.field_requests):
+                plan.append((k, None))
+                if k not in found:
+                    ctx = missing.setdefault(context, (mapper.context, {}))
+                    ctx[1].setdefault(k, f)
+
+        # retrieve the missing fields in compact sub-requests
+        subrequests = []
+        for context, (items, fields) in missing.items():
+            for r in factorise(list(fields.values())).iterate():
+                subrequests.append((context, {**items, **{k: list(v) for k, v in r.items()}}))
+
+        whole = [(None, request) for k, request in plan if k is None]
+        paths = super().retrieve([r for _, r in subrequests] + [r for _, r in whole], *extra_args)
+
+        unmatched = {}
+        for (context, request), path in zip(subrequests, paths):
+            if not self._add(context, request, path):
+                for f in ExpandedRequestMapper(request, self.field_keys).field_requests:
+                    unmatched.setdefault(field_key(context, f), path)
+
+        found = self.store.lookup([k for k, _ in plan if k is not None and k not in unmatched])
+        LOG.debug(f"{self.owner}: fields retrieved={sum(len(m[1]) for m in missing.values())}")
+
+        # assemble the result in the order of the expanded requests
+        result = []
+        whole_paths = iter(paths[len(subrequests) :])
+        used = set()
+        for k, request in plan:
+            if k is None:
+                result.append((next(whole_paths), None))
+            elif k in found:
+                path, offset, length = found[k]
+                if result and result[-1][0] == path and result[-1][1] is not None:
+                    result[-1][1].append((offset, length))
+                else:
+                    result.append((path, [(offset, length)]))
+            elif k in unmatched:
+                if unmatched[k] not in used:
+                    used.add(unmatched[k])
+                    result.append((unmatched[k], None))
+            else:
+                LOG.debug(f"{self.owner}: field {k} was not retrieved")
+        return result
+
+    @staticmethod
+    def _context(items, extra_args):
+        import json
+
+        return json.dumps({"request": items, "args": list(extra_args)}, sort_keys=True, default=str)
+
+    def _add(self, context, request, path):
+        """Add the messages of a retrieved file to the store.
+
+        Returns False when the messages cannot all be matched to the fields of ``request``.
+        """
+        from earthkit.data.utils.field_store import GRIB_ALIASES, field_key, normalise_field_value
+
+        with open(path, "rb") as f:
+            if f.read(4) != b"GRIB":
+                return False
+
+        from earthkit.data import from_source
+        from earthkit.data.readers.grib.scan import GribCodesMessagePositionIndex
+
+        index = GribCodesMessagePositionIndex(path)
+        field_keys = [k for k in self.field_keys if k in request]
+        metadata_keys = sorted({f"metadata.{a}" for k in field_keys for a in GRIB_ALIASES.get(k, (k,))})
+        metadata = from_source("file", path).to_fieldlist().get(metadata_keys, output=dict)
+        if len(metadata) != len(index):
+            return False
+
+        values = {k: {normalise_field_value(k, v): v for v in ensure_iterable(request[k])} for k in field_keys}
+        entries = []
+        for md, offset, length in zip(metadata, index.offsets, index.lengths):
+            field = {}
+            for k in field_keys:
+                candidates = {normalise_field_value(k, md[f"metadata.{a}"]) for a in GRIB_ALIASES.get(k, (k,))}
+                match = [v for n, v in values[k].items() if n in candidates]
+                if len(match) != 1:
+                    LOG.debug(f"{self.owner}: cannot match message at offset={offset} to {k}={request[k]}")
+                    return False
+                field[k] = match[0]
+            entries.append((field_key(context, field), offset, length))
+
+        self.store.add(path, entries)
+        return True
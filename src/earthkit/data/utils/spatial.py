@@ -0,0 +1,388 @@
+# (C) Copyright 2020 ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+#
+
+import hashlib
+import logging
+import threading
+
+import numpy as np
+
+LOG = logging.getLogger(__name__)
+
+# mean Earth radius (km)
+EARTH_RADIUS = 6371.0088
+
+# number of query points processed together by the numpy fallback
+_BRUTE_FORCE_CHUNK = 64
+
+
+def to_xyz(lat, lon):
+    """Convert latitudes and longitudes (in degrees) to ECEF coordinates on the unit sphere.
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of shape (N, 3).
+    """
+    phi = np.deg2rad(np.asarray(lat, dtype=np.float64).ravel())
+    lda = np.deg2rad(np.asarray(lon, dtype=np.float64).ravel())
+    cos_phi = np.cos(phi)
+    return np.column_stack((cos_phi * np.cos(lda), cos_phi * np.sin(lda), np.sin(phi)))
+
+
+def chord_to_distance(chord):
+    """Convert chord lengths on the unit sphere to great-circle distances (in km)."""
+    return 2.0 * EARTH_RADIUS * np.arcsin(np.clip(np.asarray(chord) / 2.0, 0.0, 1.0))
+
+
+def distance_to_chord(distance):
+    """Convert great-circle distances (in km) to chord lengths on the unit sphere."""
+    return 2.0 * np.sin(np.minimum(np.asarray(distance, dtype=np.float64) / (2.0 * EARTH_RADIUS), np.pi / 2))
+
+
+class SpatialIndex:
+    """Spatial index over a set of grid points.
+
+    The points are stored as ECEF coordinates on the unit sphere so that Euclidean
+    (chord) distances preserve the ordering of great-circle distances. The queries use a
+    :class:`scipy.spatial.cKDTree` when scipy is available and fall back to a chunked
+    brute-force search with numpy otherwise.
+
+    Parameters
+    ----------
+    lat: array-like
+        Latitudes of the grid points (in degrees).
+    lon: array-like
+        Longitudes of the grid points (in degrees).
+    """
+
+    def __init__(self, lat, lon):
+        self.xyz = to_xyz(lat, lon)
+        self._tree = None
+        try:
+            from scipy.spatial import cKDTree
+
+            self._tree = cKDTree(self.xyz)
+        except ImportError:
+            LOG.debug("scipy is not available, using brute-force nearest point search")
+
+    def __len__(self):
+        return len(self.xyz)
+
+    def nearest(self, lat, lon, n=1, radius=None):
+        """Find the ``n`` nearest grid points to each query point.
+
+        Parameters
+        ----------
+        lat: array-like
+            Latitudes of the query points (in degrees).
+        lon: array-like
+            Longitudes of the query points (in degrees).
+        n: int
+            Number of grid points returned for each query point.
+        radius: float, None
+            When specified only the grid points within this great-circle distance
+            (in km) are returned, so less than ``n`` points can be found.
+
+        Returns
+        -------
+        tuple
+            The query point indices, the grid point indices and the great-circle distances
+            (in km) as 1D arrays of the same length. The results are ordered by query point
+            then by increasing distance.
+        """
+        q = to_xyz(lat, lon)
+        n = min(int(n), len(self))
+        if n < 1:
+            raise ValueError(f"n must be at least one, got {n}")
+
+        upper = np.inf if radius is None else float(distance_to_chord(radius))
+
+        if self._tree is not None:
+            chord, idx = self._tree.query(q, k=n, distance_upper_bound=upper)
+            chord = chord.reshape(len(q), n)
+            idx = idx.reshape(len(q), n)
+        else:
+            chord, idx = self._brute_force_nearest(q, n)
+
+        point = np.repeat(np.arange(len(q)), n)
+        chord = chord.ravel()
+        idx = idx.ravel()
+        found = np.isfinite(chord) & (chord <= upper)
+        return point[found], idx[found], chord_to_distance(chord[found])
+
+    def within(self, lat, lon, radius):
+        """Find all the grid points within ``radius`` (in km) of each query point.
+
+        Returns
+        -------
+        tuple
+            The query point indices, the grid point indices and the great-circle distances
+            (in km) as 1D arrays of the same length. The results are ordered by query point
+            then by increasing distance.
+        """
+        q = to_xyz(lat, lon)
+        upper = float(distance_to_chord(radius))
+
+        if self._tree is not None:
+            found = self._tree.query_ball_point(q, r=upper)
+        else:
+            found = []
+            for i in range(0, len(q), _BRUTE_FORCE_CHUNK):
+                d = self._chord(q[i : i + _BRUTE_FORCE_CHUNK])
+                found.extend(np.flatnonzero(row <= upper) for row in d)
+
+        points, indices, chords = [], [], []
+        for i, idx in enumerate(found):
+            idx = np.asarray(idx, dtype=np.intp)
+            chord = np.linalg.norm(self.xyz[idx] - q[i], axis=1)
+            order = np.argsort(chord, kind="stable")
+            points.append(np.full(len(idx), i, dtype=np.intp))
+            indices.append(idx[order])
+            chords.append(chord[order])
+
+        if not points:
+            empty = np.array([], dtype=np.intp)
+            return empty, empty, np.array([], dtype=np.float64)
+
+        return np.concatenate(points), np.concatenate(indices), chord_to_distance(np.concatenate(chords))
+
+    def _chord(self, q):
+        # squared chord length is 2 - 2 cos(angle) on the unit sphere
+        d2 = 2.0 - 2.0 * (q @ self.xyz.T)
+        return np.sqrt(np.maximum(d2, 0.0))
+
+    def _brute_force_nearest(self, q, n):
+        chords, indices = [], []
+        for i in range(0, len(q), _BRUTE_FORCE_CHUNK):
+            d = self._chord(q[i : i + _BRUTE_FORCE_CHUNK])
+            if n < d.shape[1]:
+                idx = np.argpartition(d, n - 1, axis=1)[:, :n]
+            else:
+                idx = np.broadcast_to(np.arange(d.shape[1]), d.shape)
+            dist = np.take_along_axis(d, idx, axis=1)
+            order = np.argsort(dist, axis=1, kind="stable")
+            indices.append(np.take_along_axis(idx, order, axis=1))
+            chords.append(np.take_along_axis(dist, order, axis=1))
+        return np.concatenate(chords), np.concatenate(indices)
+
+
+class _SpatialIndexCache:
+    """Cache of spatial indices keyed by the unique grid id."""
+
+    def __init__(self, size=16):
+        from lru import LRU
+
+        self.cache = LRU(size)
+        self.lock = threading.Lock()
+
+    def get(self, grid_id, latlons):
+        if grid_id is None:
+            return SpatialIndex(*latlons())
+
+        with self.lock:
+            index = self.cache.get(grid_id)
+        if index is None:
+            index = SpatialIndex(*latlons())
+            with self.lock:
+                self.cache[grid_id] = index
+        return index
+
+    def clear(self):
+        with self.lock:
+            self.cache.clear()
+
+
+SPATIAL_INDEX_CACHE = _SpatialIndexCache()
+
+
+def grid_key(geography, lat=None, lon=None):
+    """Return a key identifying the grid points of a field geography.
+
+    The unique grid id is only used when the geography derives it from the grid
+    definition (e.g. ``md5GridSection`` in GRIB). Other geographies only return the
+    shape of the grid as their id, so the key is a digest of the coordinates instead.
+    """
+    if geography.HAS_UNIQUE_GRID_ID:
+        grid_id = geography.unique_grid_id()
+        if grid_id is not None:
+            return grid_id
+
+    if lat is None or lon is None:
+        lat, lon = geography.latlons(flatten=True)
+
+    h = hashlib.blake2b(digest_size=16)
+    for v in (lat, lon):
+        v = np.ascontiguousarray(v, dtype=np.float64)
+        h.update(str(v.shape).encode())
+        h.update(v.data)
+    return ("coords", h.hexdigest())
+
+
+def spatial_index(geography, lat=None, lon=None):
+    """Return the (cached) :class:`SpatialIndex` of the given field geography.
+
+    ``lat`` and ``lon`` are the flattened coordinates of the geography when already available.
+    """
+
+    def _latlons():
+        if lat is None or lon is None:
+            return geography.latlons(flatten=True)
+        return lat, lon
+
+    return SPATIAL_INDEX_CACHE.get(grid_key(geography, lat, lon), _latlons)
+
+
+def _area_key(area):
+    """Normalise an area into a hashable key.
+
+    Returns a tuple of ("bbox", north, west, south, east) or ("polygon", (lat, lon), ...).
+    """
+    from earthkit.data.utils.bbox import BoundingBox
+
+    if isinstance(area, BoundingBox):
+        return ("bbox", *area.as_tuple())
+
+    # shapely-like polygon with (x=lon, y=lat) coordinates
+    exterior = getattr(area, "exterior", None)
+    if exterior is not None:
+        return ("polygon", *((float(y), float(x)) for x, y in exterior.coords))
+
+    if isinstance(area, dict):
+        return _area_key(BoundingBox(**area))
+
+    area = list(area)
+    if len(area) == 4 and all(np.ndim(v) == 0 for v in area):
+        north, west, south, east = area
+        return _area_key(BoundingBox(north=north, west=west, south=south, east=east))
+
+    vertices = tuple((float(lat), float(lon)) for lat, lon in area)
+    if len(vertices) < 3:
+        raise ValueError(f"A polygon must have at least 3 vertices, got {len(vertices)}")
+    return ("polygon", *vertices)
+
+
+def _in_bbox(lat, lon, north, west, south, east):
+    r = (lat >= south) & (lat <= north)
+    if east - west < 360:
+        r &= np.mod(lon - west, 360.0) <= east - west
+    return r
+
+
+def _in_polygon(lat, lon, vertices):
+    """Even-odd rule point in polygon test.
+
+    The longitudes are taken modulo 360 relative to the westernmost vertex.
+    """
+    v = np.asarray(vertices, dtype=np.float64)
+    vlat, vlon = v[:, 0], v[:, 1]
+    west = vlon.min()
+    vlon = vlon - west
+    lon = np.mod(lon - west, 360.0)
+
+    inside = np.zeros(lat.shape, dtype=bool)
+    j = len(v) - 1
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for i in range(len(v)):
+            crosses = (vlat[i] > lat) != (vlat[j] > lat)
+            x = (vlon[j] - vlon[i]) * (lat - vlat[i]) / (vlat[j] - vlat[i]) + vlon[i]
+            inside ^= crosses & (lon < x)
+            j = i
+    return inside
+
+
+def points_in_area(lat, lon, area):
+    """Return a boolean mask of the points inside ``area``.
+
+    Parameters
+    ----------
+    lat: array-like
+        Latitudes of the points (in degrees).
+    lon: array-like
+        Longitudes of the points (in degrees).
+    area: :class:`~earthkit.data.utils.bbox.BoundingBox`, list, tuple, dict or polygon
+        The area. It can be a bounding box (a :class:`BoundingBox`, a dict with the
+        "north", "west", "south" and "east" keys or a (north, west, south, east) list/tuple),
+        a list of (lat, lon) polygon vertices, or a shapely-like polygon (with (lon, lat)
+        coordinates). The bounding box includes its edges.
+    """
+    lat = np.asarray(lat, dtype=np.float64).ravel()
+    lon = np.asarray(lon, dtype=np.float64).ravel()
+    key = _area_key(area)
+    if key[0] == "bbox":
+        return _in_bbox(lat, lon, *key[1:])
+    return _in_polygon(lat, lon, key[1:])
+
+
+class AreaSubset:
+    """The grid points of a grid inside an area.
+
+    Attributes
+    ----------
+    index: numpy.ndarray
+        The indices of the grid points in the flattened grid.
+    geography: :class:`~earthkit.data.field.component.geography.LatLonGeography`
+        The geography made up of the grid points in the area.
+    """
+
+    def __init__(self, lat, lon, area):
+        from earthkit.data.field.component.geography import LatLonGeography
+
+        self.index = np.flatnonzero(points_in_area(lat, lon, area))
+        lat = np.asarray(lat).ravel()[self.index]
+        lon = np.asarray(lon).ravel()[self.index]
+        self.geography = LatLonGeography(lat, lon, shape=(len(self.index),))
+
+    def __len__(self):
+        return len(self.index)
+
+
+class _AreaSubsetCache:
+    """Cache of area subsets keyed by the grid and the area."""
+
+    def __init__(self, size=64):
+        from lru import LRU
+
+        self.cache = LRU(size)
+        self.lock = threading.Lock()
+
+    def get(self, key, create):
+        with self.lock:
+            subset = self.cache.get(key)
+        if subset is None:
+            subset = create()
+            with self.lock:
+                self.cache[key] = subset
+        return subset
+
+    def clear(self):
+        with self.lock:
+            self.cache.clear()
+
+
+AREA_SUBSET_CACHE = _AreaSubsetCache()
+
+
+def area_subset(geography, area):
+    """Return the (cached) :class:`AreaSubset` of a field geography inside ``area``.
+
+    The subset is computed only once for each grid (see :func:`grid_key`) and area.
+    """
+    area_key = _area_key(area)
+    if geography.HAS_UNIQUE_GRID_ID and geography.unique_grid_id() is not None:
+        lat = lon = None
+    else:
+        lat, lon = geography.latlons(flatten=True)
+
+    def _create():
+        if lat is None:
+            return AreaSubset(*geography.latlons(flatten=True), area)
+        return AreaSubset(lat, lon, area)
+
+    return AREA_SUBSET_CACHE.get((grid_key(geography, lat, lon), area_key), _create)
@@ -139,10 +139,18 @@ def ls(metadata_proc, n=None, keys=None, extra_keys=None, collections=None, **kw
     # return format_ls(metadata_proc(_keys_lst, n), column_names=_keys)
 
 
-def format_ls(attributes, column_names=None):
+def _to_dataframe(attributes, **kwargs):
+    """Create a DataFrame from a dict of columns or from an iterable of records."""
     import pandas as pd
 
-    df = pd.DataFrame.from_records(attributes)
+    if isinstance(attributes, dict):
+        return pd.DataFrame(attributes, **kwargs).infer_objects()
+    return pd.DataFrame.from_records(attributes, **kwargs)
+
+
+def format_ls(attributes, column_names=None):
+
+    df = _to_dataframe(attributes)
 
     if df is not None and column_names is not None:
         df = df.rename(columns=column_names)
@@ -150,7 +158,77 @@ def format_ls(attributes, column_names=None):
     return df
 
 
-def format_describe(attributes, *args, **kwargs):
+def concat_columns(chunks):
+    """Concatenate an iterable of column chunks into a single dict of columns.
+
+    Each chunk is a dict mapping keys to 1D numpy arrays, as returned by
+    :meth:`FieldList.get_columns`.
+    """
+    import numpy as np
+
+    result = {}
+    for chunk in chunks:
+        for k, v in chunk.items():
+            result.setdefault(k, []).append(v)
+    return {k: v[0] if len(v) == 1 else np.concatenate(v) for k, v in result.items()}
+
+
+class GroupedUniqueValues:
+    """Incrementally collect the unique values of columns per group.
+
+    Parameters
+    ----------
+    group_by: list of str
+        The columns defining the groups. When empty all the rows belong to the same group.
+    """
+
+    def __init__(self, group_by):
+        self.group_by = tuple(group_by)
+        self.keys = None
+        self.groups = {}
+
+    def update(self, columns):
+        """Add a chunk of columns (a dict of 1D arrays of the same length)."""
+        if self.keys is None:
+            self.keys = [k for k in columns if k not in self.group_by]
+
+        num = len(next(iter(columns.values()))) if columns else 0
+        if num == 0:
+            return
+
+        if self.group_by:
+            groups = zip(*[columns[k].tolist() for k in self.group_by])
+        else:
+            groups = [()] * num
+
+        values = [columns[k].tolist() for k in self.keys]
+        for i, g in enumerate(groups):
+            if any(x is None for x in g):
+                continue
+            r = self.groups.get(g)
+            if r is None:
+                r = self.groups[g] = [dict() for _ in self.keys]
+            for d, v in zip(r, values):
+                d[v[i]] = True
+
+    def to_dataframe(self, full=False):
+        """Return a DataFrame with one row per group and the unique values of each column."""
+        import pandas as pd
+
+        groups = sorted(self.groups, key=lambda g: tuple(map(str, g)))
+        data = {k: [make_unique(self.groups[g][i], full=full) for g in groups] for i, k in enumerate(self.keys)}
+        if self.group_by:
+            index = pd.MultiIndex.from_tuples(groups, names=self.group_by)
+            return pd.DataFrame(data, index=index)
+        return pd.DataFrame(data)
+
+
+def format_describe(chunks, *args, group_by=("shortName", "typeOfLevel"), **kwargs):
+    """Generate the describe summary from an iterable of column chunks.
+
+    The unique values are aggregated chunk by chunk, so only one chunk of
+    metadata is kept in memory at a time.
+    """
     # TODO: this is GRIB specific code, should not be here
     import pandas as pd
 
@@ -158,12 +236,8 @@ def format_describe(attributes, *args, **kwargs):
     if param is None:
         param = kwargs.pop("param", None)
 
-    # do_print = kwargs.pop("print", True)
-
-    df = pd.DataFrame.from_records(attributes, **kwargs)
-
-    if df is None or df.empty:
-        return None
+    if kwargs:
+        raise TypeError(f"describe: unsupported arguments={kwargs}")
 
     # these keys are changed in the output
     labels = {"marsClass": "class", "marsStream": "stream", "marsType": "type"}
@@ -171,19 +245,40 @@ def format_describe(attributes, *args, **kwargs):
     no_header = False
     main_axis = 1
     if param is None:
-        df = df.groupby(["shortName", "typeOfLevel"]).agg(make_unique)
+        collector = GroupedUniqueValues(group_by)
+        for columns in chunks:
+            collector.update(columns)
+
+        if not collector.groups:
+            return None
+
+        df = collector.to_dataframe()
         df.rename(labels, axis=1, inplace=True)
     else:
         param_names = {int: "paramId", str: "shortName"}
         param_name = param_names.get(type(param), None)
-        if param_name is not None:
-            df = pd.DataFrame(df[df[param_name] == param].agg(make_unique, full=True).T)
-            df.rename(labels, axis=0, inplace=True)
-            no_header = True
-            main_axis = 0
-        else:
+        if param_name is None:
             return pd.DataFrame()
 
+        collector = GroupedUniqueValues(())
+        num = 0
+        for columns in chunks:
+            if param_name not in columns:
+                return None
+            mask = columns[param_name] == param
+            collector.update({k: v[mask] for k, v in columns.items()})
+            num += len(mask)
+
+        if num == 0:
+            return None
+        if not collector.groups:
+            return pd.DataFrame()
+
+        df = collector.to_dataframe(full=True).T
+        df.rename(labels, axis=0, inplace=True)
+        no_header = True
+        main_axis = 0
+
     drop_unwanted_series(df, key="number", axis=main_axis)
 
     df = df.style.set_properties(**{"text-align": "left"})
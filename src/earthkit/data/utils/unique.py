@@ -183,6 +183,17 @@ class UniqueValuesCollector:
     def _collect(self, iterable, keys, remapping=None, sort=False, drop_none=True, squeeze=False):
         assert isinstance(keys, tuple), keys
 
+        vals = self._unique(iterable, keys, remapping=remapping)
+        self._post_proc(vals, sort=sort, drop_none=drop_none, squeeze=squeeze)
+        return vals
+
+    def _unique(self, iterable, keys, remapping=None):
+        if remapping is None and hasattr(iterable, "get_columns"):
+            columns = iterable.get_columns(keys)
+            if len(iterable) == 0:
+                return {}
+            return {k: tuple(dict.fromkeys(c.tolist())) for k, c in columns.items()}
+
         astype = [None] * len(keys)
         default = [None] * len(keys)
         vals = defaultdict(dict)
@@ -191,9 +202,7 @@ class UniqueValuesCollector:
             for k, v in zip(keys, r):
                 vals[k][v] = True
 
-        vals = {k: tuple(values.keys()) for k, values in vals.items()}
-        self._post_proc(vals, sort=sort, drop_none=drop_none, squeeze=squeeze)
-        return vals
+        return {k: tuple(values.keys()) for k, values in vals.items()}
 
     def _collect_with_cache(self, iterable, keys, cache, remapping=None, sort=False, drop_none=True, squeeze=False):
         assert isinstance(keys, tuple), keys
@@ -204,15 +213,7 @@ class UniqueValuesCollector:
         vals = dict()
 
         if keys:
-            astype = [None] * len(keys)
-            default = [None] * len(keys)
-            vals = defaultdict(dict)
-            for f in iterable:
-                r = f._get_fast(keys, default=default, astype=astype, remapping=remapping, output=list)
-                for k, v in zip(keys, r):
-                    vals[k][v] = True
-
-            vals = {k: tuple(values.keys()) for k, values in vals.items()}
+            vals = self._unique(iterable, tuple(keys), remapping=remapping)
 
         res = dict()
         for k in ori_keys:
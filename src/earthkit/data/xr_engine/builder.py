@@ -16,6 +16,7 @@ import numpy
 import xarray
 import xarray.core.indexing as indexing
 
+from earthkit.data.core.diagnostics import instrumented
 from earthkit.data.utils import ensure_dict, ensure_iterable
 
 from .dim import LevelPerTypeDim
@@ -211,6 +212,7 @@ class TensorBackendArray(xarray.backends.common.BackendArray):
         # bug in xarray here? tries to create a NumpyIndexingAdapter instead of NdArrayLikeIndexingAdapter
         # patched in local copy for now, but could construct this ourself
 
+    @instrumented("xarray.chunk.read")
     def _raw_indexing_method(self, key: tuple):
         with self.lock:
             # LOG.debug(f"TensorBackendArray._raw_indexing_method var={self._var_name}")
@@ -266,7 +268,9 @@ class BackendDataBuilder(metaclass=ABCMeta):
 
         assert self.array_namespace is not None, f"Unsupported array_namespace : {array_namespace}"
 
-        dtype = profile.dtype
+        from earthkit.data.utils.array import default_array_dtype
+
+        dtype = default_array_dtype(profile.dtype)
         if dtype is None:
             dtype = convert_dtype("float64", array_namespace)
         else:
@@ -364,7 +364,8 @@ class EarthkitBackendEntrypoint(BackendEntrypoint):
             If True, perform stricter checks on hypercube consistency. Its default value (None) expands
             to False unless the ``profile`` overwrites it.
         dtype: str, numpy.dtype or None
-            Typecode or data-type of the array data.
+            Typecode or data-type of the array data. When None, the ``default-array-dtype``
+            config option is used or ``float64`` when that is also None.
         array_namespace: str, array namespace, None
             The array namespace to use for array operations. The default value (None) is
             expanded to "numpy".
@@ -0,0 +1,200 @@
+# (C) Copyright 2020 ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+#
+
+import logging
+import os
+
+LOG = logging.getLogger(__name__)
+
+
+class StreamDatasetBuilder:
+    """Build an Xarray dataset from a stream of fields with bounded memory.
+
+    The layout of the dataset (dimensions and coordinates) is inferred from the first
+    batch of fields. The coordinate values of any dimension can also be declared upfront
+    via ``coords``, which is needed when the first batch does not contain all of them.
+    The data variables are added to the layout as they arrive. The output arrays are
+    preallocated (either in memory or as memory-mapped files) and each incoming batch is
+    converted into Xarray and copied into its slots, then released. The peak memory is
+    roughly the size of the output plus the size of a batch.
+
+    Parameters
+    ----------
+    batch_size: int
+        The number of fields converted at once.
+    coords: dict, None
+        The coordinate values of the dimensions, which take precedence over the values
+        inferred from the first batch.
+    store: str, None
+        When specified, the data arrays are memory-mapped ``.npy`` files created in
+        this directory. Otherwise, they are allocated in memory.
+    **kwargs:
+        Keyword arguments passed to :func:`to_xarray` when a batch is converted.
+    """
+
+    def __init__(self, batch_size=100, coords=None, store=None, **kwargs):
+        self.batch_size = batch_size
+        if self.batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+
+        self.coords = dict(coords or {})
+        self.store = store
+        self.kwargs = kwargs
+        for k in ("lazy_load", "chunks"):
+            if kwargs.get(k):
+                LOG.warning(f"Streaming to_xarray: ignoring {k}={kwargs[k]}, the values are loaded eagerly")
+                self.kwargs.pop(k)
+
+        self._arrays = {}
+        self._vars = {}
+        self._indexes = {}
+        self._sizes = {}
+
+    def build(self, fieldlist):
+        import xarray as xr
+
+        batches = iter(fieldlist.batched(self.batch_size))
+        first = next(batches, None)
+        if first is None:
+            raise ValueError("Cannot create Xarray dataset from an empty stream")
+
+        layout = self._create_layout(first)
+        del first
+
+        for batch in batches:
+            self._write(batch)
+
+        data_vars = {
+            name: xr.Variable(var.dims, self._arrays[name], attrs=var.attrs, encoding=var.encoding)
+            for name, var in self._vars.items()
+        }
+        return xr.Dataset(data_vars, coords=layout.coords, attrs=layout.attrs)
+
+    def _to_xarray(self, fieldlist, allow_holes=None):
+        kwargs = dict(self.kwargs)
+        kwargs["lazy_load"] = False
+        if allow_holes is not None:
+            kwargs["allow_holes"] = allow_holes
+
+        # keep all the layout dimensions even when a batch only spans one value
+        ensure_dims = kwargs.pop("ensure_dims", None) or []
+        if isinstance(ensure_dims, str):
+            ensure_dims = [ensure_dims]
+        ensure_dims = list(ensure_dims)
+        for d in list(self.coords) + list(self._sizes):
+            if d not in ensure_dims:
+                ensure_dims.append(d)
+        if ensure_dims:
+            kwargs["ensure_dims"] = ensure_dims
+        return fieldlist.to_xarray(**kwargs)
+
+    def _create_layout(self, fieldlist):
+        import pandas as pd
+        import xarray as xr
+
+        try:
+            ds = self._to_xarray(fieldlist)
+        except ValueError:
+            # nothing is written yet, so the holes of the first batch can be kept
+            ds = self._to_xarray(fieldlist, allow_holes=True)
+
+        unknown = [d for d in self.coords if d not in ds.dims]
+        if unknown:
+            raise ValueError(f"Streaming to_xarray: declared coords {unknown} are not dimensions of the dataset")
+
+        layout = ds
+        declared = list(self.coords)
+        if declared:
+            # auxiliary coordinates spanning a declared dimension cannot be inferred from the first batch
+            drop = [k for k, v in layout.coords.items() if k not in layout.dims and set(v.dims) & set(declared)]
+            if drop:
+                LOG.debug(f"Streaming to_xarray: dropping coordinates {drop} spanning declared dimensions")
+            layout = layout.drop_vars(list(layout.data_vars) + drop + declared)
+            layout = layout.assign_coords({d: pd.Index(self.coords[d], name=d) for d in declared})
+
+        self._sizes = {d: layout.sizes.get(d, ds.sizes[d]) for d in ds.dims}
+        self._indexes = {k: v for k, v in layout.indexes.items()}
+
+        self._write_dataset(ds)
+        return xr.Dataset(coords=layout.coords, attrs=ds.attrs)
+
+    def _allocate(self, name, var):
+        """Allocate the array of a variable in the layout, filled with NaNs."""
+        import numpy as np
+
+        shape = tuple(self._sizes[d] for d in var.dims)
+        dtype = var.dtype
+        if dtype.kind in "iub":
+            dtype = np.dtype("float64")
+        if self.store is None:
+            return np.full(shape, np.nan, dtype=dtype)
+
+        os.makedirs(self.store, exist_ok=True)
+        path = os.path.join(self.store, f"{name}.npy")
+        a = np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=shape)
+        a[...] = np.nan
+        return a
+
+    def _write(self, fieldlist):
+        try:
+            datasets = [self._to_xarray(fieldlist)]
+        except ValueError:
+            # not a hypercube, convert the fields one by one so that no holes overwrite
+            # the values already written
+            LOG.debug("Streaming to_xarray: batch is not a hypercube, converting fields one by one")
+            datasets = (self._to_xarray(fieldlist[i : i + 1]) for i in range(len(fieldlist)))
+
+        for ds in datasets:
+            self._write_dataset(ds)
+
+    def _write_dataset(self, ds):
+        import numpy as np
+
+        for name, var in ds.data_vars.items():
+            target = self._arrays.get(name)
+            if target is None:
+                # a new variable only needs the dimensions of the layout
+                missing = [d for d in var.dims if d not in self._sizes]
+                if missing:
+                    raise ValueError(f"Streaming to_xarray: variable {name} has dims={missing} not in the layout")
+                target = self._arrays[name] = self._allocate(name, var)
+                self._vars[name] = var
+            if target.ndim != var.ndim:
+                raise ValueError(f"Streaming to_xarray: variable {name} has unexpected dims={var.dims}")
+
+            pos = [self._positions(var, d) for d in var.dims]
+            if all(isinstance(p, slice) for p in pos):
+                target[tuple(pos)] = var.values
+            else:
+                # fancy indexing on multiple dimensions must form an open mesh
+                pos = [np.arange(p.start, p.stop) if isinstance(p, slice) else p for p in pos]
+                target[np.ix_(*pos)] = var.values
+
+    def _positions(self, var, dim):
+        """Return the positions of the values of ``dim`` in the layout as a slice when contiguous."""
+        import numpy as np
+
+        index = self._indexes.get(dim)
+        if index is None:
+            if var.sizes[dim] != self._sizes[dim]:
+                raise ValueError(
+                    f"Streaming to_xarray: dimension {dim} has size {var.sizes[dim]}, expected {self._sizes[dim]}"
+                )
+            return slice(0, self._sizes[dim])
+
+        values = var[dim].values
+        pos = index.get_indexer(values)
+        if (pos < 0).any():
+            raise ValueError(
+                f"Streaming to_xarray: values {values[pos < 0]} of dimension {dim} are not in the layout."
+                " Use the coords option to declare all the coordinate values."
+            )
+        if len(pos) > 0 and (np.diff(pos) == 1).all():
+            return slice(int(pos[0]), int(pos[-1]) + 1)
+        return pos
@@ -11,6 +11,7 @@
 
 import os
 
+import numpy as np
 import pytest
 
 from earthkit.data import config
@@ -115,6 +116,31 @@ def test_config_set_numbers(param, set_value, stored_value, raise_error):
                 config.set(param, set_value)
 
 
+@pytest.mark.parametrize(
+    "set_value,stored_value,raise_error",
+    [
+        ("float32", "float32", None),
+        ("f4", "float32", None),
+        (np.float32, "float32", None),
+        (np.dtype("float32"), "float32", None),
+        ("float64", "float64", None),
+        (None, None, None),
+        ("int32", None, ValueError),
+        ("abc", None, ValueError),
+    ],
+)
+def test_config_set_dtype(set_value, stored_value, raise_error):
+    with config.temporary():
+        if raise_error is None:
+            config.set("default-array-dtype", set_value)
+            assert config.get("default-array-dtype") == (np.dtype(stored_value) if stored_value else None)
+            # the name is stored so that the config can be saved as YAML
+            assert config._stack[-1]._config["default-array-dtype"] == stored_value
+        else:
+            with pytest.raises(raise_error):
+                config.set("default-array-dtype", set_value)
+
+
 def test_config_set_cache_numbers():
     with temp_directory() as tmpdir:
         with config.temporary({"cache-policy": "user", "user-cache-directory": tmpdir}):
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+
+# (C) Copyright 2020 ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+#
+
+import pytest
+
+import earthkit.data as ekd
+from earthkit.data import config, from_source
+from earthkit.data.core import diagnostics as diag
+from earthkit.data.core.field import Field
+from earthkit.data.readers.grib.handle import FileGribHandle
+from earthkit.data.utils.testing import earthkit_examples_file
+
+
+@pytest.fixture
+def reset_diagnostics():
+    ekd.diagnostics(reset=True)
+    yield
+    ekd.diagnostics(reset=True)
+
+
+def test_diagnostics_off(reset_diagnostics):
+    with config.temporary("diagnostics", False):
+        # the original methods are used so there is no overhead
+        assert not hasattr(FileGribHandle._create_handle, "__wrapped__")
+        assert not hasattr(Field._get_fast, "__wrapped__")
+        assert diag.timer("a") is diag.timer("b")
+
+        ds = from_source("file", earthkit_examples_file("tuv_pl.grib")).to_fieldlist()
+        ds.to_numpy()
+
+    r = ekd.diagnostics()
+    assert r.counters == {}
+    assert r.timers == {}
+
+
+def test_diagnostics_on(reset_diagnostics):
+    with config.temporary("diagnostics", True):
+        assert hasattr(Field._get_fast, "__wrapped__")
+
+        ds = from_source("file", earthkit_examples_file("tuv_pl.grib")).to_fieldlist()
+        ds.to_numpy()
+        ds.get("parameter.variable")
+
+    assert not hasattr(Field._get_fast, "__wrapped__")
+
+    r = ekd.diagnostics(reset=True)
+    assert r.counters["message.index.messages"] == 18
+    assert r.timers["message.index.scan"]["count"] == 1
+    assert r.timers["grib.values.decode"]["count"] == 18
+    assert r.timers["grib.handle.create"]["count"] >= 18
+    assert r.timers["field.metadata.get"]["count"] >= 18
+
+    t = r.timers["grib.values.decode"]
+    assert t["min"] <= t["mean"] <= t["max"]
+    assert t["total"] > 0
+    assert sum(t["histogram"].values()) == 18
+
+    assert ekd.diagnostics().timers == {}
+
+
+def test_diagnostics_timer_and_counter(reset_diagnostics):
+    with config.temporary("diagnostics", True):
+        with diag.timer("test.block"):
+            pass
+        diag.count("test.counter")
+        diag.count("test.counter", 2)
+
+    diag.count("test.counter")
+
+    r = ekd.diagnostics()
+    assert r.counters == {"test.counter": 3}
+    assert r.timers["test.block"]["count"] == 1
+
+
+def test_diagnostics_to_pandas(reset_diagnostics):
+    with config.temporary("diagnostics", True):
+        with diag.timer("test.block"):
+            pass
+        diag.count("test.counter", 5)
+
+    df = ekd.diagnostics().to_pandas()
+    assert df["name"].tolist() == ["test.counter", "test.block"]
+    assert df["kind"].tolist() == ["counter", "timer"]
+    assert df["count"].tolist() == [5, 1]
+    assert list(df.columns) == ["name", "kind", "count", "total", "mean", "min", "max", "p50", "p90", "p99"]
+
+
+if __name__ == "__main__":
+    from earthkit.data.utils.testing import main
+
+    main()
@@ -522,3 +522,99 @@ def test_grib_cache_metadata_use_kwargs_2(fl_type, patch_metadata_cache):
 
         diag = metadata_cache_diag(ds)
         _check_diag(diag, ref)
+
+
+class _Handle:
+    def __init__(self, offset, length=100):
+        self.path = "test.grib"
+        self.offset = offset
+        self.length = length
+
+
+def test_grib_handle_cache_byte_budget():
+    from earthkit.data.readers.grib.handle import GribHandleCache
+
+    cache = GribHandleCache(cache_size=10, max_bytes=250)
+    for i in range(5):
+        assert cache.get(_Handle(i), lambda i=i: f"h{i}") == f"h{i}"
+
+    # only the 2 most recently used handles fit into the byte budget
+    diag = cache._diag()
+    ref = {
+        "handle_cache_size": 2,
+        "handle_cache_bytes": 200,
+        "handle_create_count": 5,
+        "handle_eviction_count": 3,
+        "handle_cache_hits": 0,
+    }
+    _check_diag(diag, ref)
+
+    assert cache.get(_Handle(4), lambda: "new") == "h4"
+    assert cache.get(_Handle(0), lambda: "new") == "new"
+    _check_diag(cache._diag(), {"handle_cache_hits": 1, "handle_create_count": 6, "handle_eviction_count": 4})
+
+    cache.remove(_Handle(0))
+    _check_diag(cache._diag(), {"handle_cache_size": 1, "handle_cache_bytes": 100})
+
+    cache = pickle.loads(pickle.dumps(cache))
+    _check_diag(cache._diag(), {"handle_cache_size": 0, "grib_handle_cache_max_bytes": 250})
+
+
+def test_grib_handle_cache_sharded():
+    from earthkit.data.readers.grib.handle import GribHandleCache
+
+    cache = GribHandleCache(cache_size=1000)
+    assert len(cache.shards) > 1
+    assert sum(s.max_count for s in cache.shards) == 1000
+
+    for i in range(2000):
+        cache.get(_Handle(i), lambda i=i: i)
+    assert len(cache) <= 1000
+    _check_diag(cache._diag(), {"handle_create_count": 2000, "handle_eviction_count": 2000 - len(cache)})
+
+
+def test_grib_handle_cache_single_flight():
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    from earthkit.data.readers.grib.handle import GribHandleCache
+
+    cache = GribHandleCache(cache_size=5)
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def _create_slow():
+        calls.append(1)
+        started.set()
+        release.wait(10)
+        return "slow"
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(cache.get, _Handle(0), _create_slow) for _ in range(3)]
+        assert started.wait(10)
+
+        # other handles are not blocked by the creation in progress
+        assert cache.get(_Handle(1), lambda: "fast") == "fast"
+
+        release.set()
+        assert [f.result() for f in futures] == ["slow"] * 3
+
+    assert len(calls) == 1
+    _check_diag(cache._diag(), {"handle_create_count": 2, "handle_cache_size": 2})
+
+
+def test_grib_handle_cache_create_error():
+    from earthkit.data.readers.grib.handle import GribHandleCache
+
+    cache = GribHandleCache(cache_size=5)
+
+    def _fail():
+        raise OSError("cannot read")
+
+    with pytest.raises(OSError):
+        cache.get(_Handle(0), _fail)
+
+    # the failed creation is not cached
+    assert cache.get(_Handle(0), lambda: "h0") == "h0"
+    _check_diag(cache._diag(), {"handle_create_count": 1, "handle_cache_size": 1})
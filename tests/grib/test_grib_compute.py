@@ -19,6 +19,7 @@ from grib_fixtures import (
     load_grib_data,  # noqa: E402
 )
 
+from earthkit.data import config
 from earthkit.data.utils.compute import apply_ufunc
 
 
@@ -331,3 +332,72 @@ def test_grib_compute_ufunc(fl_type, operand):
     res = apply_ufunc(func, ds1, ds2)
     ref = func(val_ref, val_ref + 1)
     assert xp.allclose(res.values, ref, equal_nan=True)
+
+
+@pytest.mark.parametrize("fl_type", FL_NUMPY)
+@pytest.mark.parametrize("operand", RIGHT_OPERANDS)
+def test_grib_compute_stacked(fl_type, operand):
+    ds, array_backend = load_grib_data("test.grib", fl_type)
+    xp, device, _ = array_backend
+
+    rval, rval_ref = operand(ds, xp, device).val()
+
+    with config.temporary("fieldlist-compute-method", "stacked"):
+        res = (ds - rval) * 2
+        res_neg = -ds
+
+    ref = (ds.values - rval_ref) * 2
+    assert xp.allclose(res.values, ref, equal_nan=True)
+    assert res.get("parameter.variable") == ds.get("parameter.variable")
+    assert xp.allclose(res_neg.values, -ds.values, equal_nan=True)
+
+
+@pytest.mark.parametrize("fl_type", FL_NUMPY)
+def test_grib_compute_stacked_ufunc(fl_type):
+    ds, array_backend = load_grib_data("test.grib", fl_type)
+    xp, _, _ = array_backend
+
+    def func(x, y):
+        return np.sin(x) + y * 2
+
+    with config.temporary("fieldlist-compute-method", "stacked"):
+        res = apply_ufunc(func, ds, ds[0])
+
+    assert res[0].shape == ds[0].shape
+    ref = func(ds.values, ds[0].values)
+    assert xp.allclose(res.values, ref, equal_nan=True)
+
+
+def test_grib_compute_stacked_mixed_shapes():
+    ds, _ = load_grib_data("test.grib", "file")
+    ds1, _ = load_grib_data("ll_10_20.grib", "file", folder="data")
+    ds = ds.from_fields([ds[0], ds[1], ds1[0]])
+    assert ds[0].shape != ds[2].shape
+
+    with config.temporary("fieldlist-compute-method", "stacked"):
+        res = ds + 1
+
+    assert np.allclose(res[0].values, ds[0].values + 1)
+    assert np.allclose(res[2].values, ds[2].values + 1)
+
+
+@pytest.mark.parametrize("fl_type", FL_NUMPY)
+@pytest.mark.parametrize("batch_size", [None, 1])
+def test_grib_compute_lazy(fl_type, batch_size):
+    ds, array_backend = load_grib_data("test.grib", fl_type)
+    xp, _, _ = array_backend
+
+    a = ds
+    b = ds[0]
+    c = ds.values[:, :] + 1
+
+    expr = -((a.lazy() - b) * c) + 2
+    res = expr.compute(batch_size=batch_size)
+    ref = -((a.values - b.values) * c) + 2
+
+    assert len(res) == len(ds)
+    assert res.get("parameter.variable") == ["2t", "msl"]
+    assert xp.allclose(res.values, ref, equal_nan=True)
+
+    res = (1 - ds[:1] * a.lazy()).compute(batch_size=batch_size)
+    assert xp.allclose(res.values, 1 - ds[:1].values * a.values, equal_nan=True)
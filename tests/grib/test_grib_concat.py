@@ -161,6 +161,45 @@ def test_grib_concat_large():
     assert len(ds_e) == 2000
 
 
+def test_grib_multi_fieldlist_warm():
+    from earthkit.data.indexing.indexed import MultiFieldList
+
+    fs = [
+        from_source("file", earthkit_examples_file(name)).to_fieldlist()
+        for name in ["test.grib", "test6.grib", "tuv_pl.grib"]
+    ]
+    md = sum((f.get("parameter.variable") for f in fs), [])
+
+    ds = MultiFieldList(fs)
+    assert ds.warm(workers=2, keys=["parameter.variable"]) is ds
+    assert len(ds) == 26
+
+    assert [ds[i].get("parameter.variable") for i in range(len(ds))] == md
+    assert ds[2].get("parameter.variable") == "t"
+    assert ds[8].get("parameter.variable") == "t"
+    assert ds[-1].get("parameter.variable") == md[-1]
+    assert ds[-26].get("parameter.variable") == md[0]
+
+    with pytest.raises(IndexError):
+        ds[26]
+
+    with pytest.raises(IndexError):
+        ds[-27]
+
+
+def test_grib_multi_file_warm_config():
+    from earthkit.data import config
+
+    paths = [earthkit_examples_file(name) for name in ["test.grib", "test6.grib", "tuv_pl.grib"]]
+    ref = from_source("file", paths).to_fieldlist()
+
+    with config.temporary({"multi-file-warm-workers": 2, "multi-file-warm-keys": ["metadata.shortName"]}):
+        ds = from_source("file", paths).to_fieldlist()
+
+    assert len(ds) == len(ref) == 26
+    assert ds.get("parameter.variable") == ref.get("parameter.variable")
+
+
 if __name__ == "__main__":
     from earthkit.data.utils.testing import main
 
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+
+# (C) Copyright 2020 ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+#
+
+import numpy as np
+import pytest
+from grib_fixtures import FL_TYPES, load_grib_data
+
+from earthkit.data.utils import spatial
+from earthkit.data.utils.bbox import BoundingBox
+from earthkit.data.utils.spatial import points_in_area
+
+
+def _bbox_mask(f, north, west, south, east):
+    lat, lon = f.geography.latlons(flatten=True)
+    return (lat >= south) & (lat <= north) & (np.mod(lon - west, 360) <= east - west)
+
+
+@pytest.mark.parametrize("fl_type", FL_TYPES)
+@pytest.mark.parametrize(
+    "area",
+    [
+        [60, -10, 40, 20],
+        (60, 350, 40, 20),
+        {"north": 60, "west": -10, "south": 40, "east": 20},
+        BoundingBox(north=60, west=-10, south=40, east=20),
+    ],
+)
+def test_grib_crop_bbox(fl_type, area):
+    ds, _ = load_grib_data("test.grib", fl_type)
+    f = ds[0]
+    mask = _bbox_mask(f, 60, -10, 40, 20)
+
+    r = f.crop(area)
+    assert r.shape == (mask.sum(),)
+    assert np.allclose(r.values, f.values[mask])
+    assert np.allclose(r.to_numpy(), f.to_numpy(flatten=True)[mask])
+    assert r.get("parameter.variable") == f.get("parameter.variable")
+
+    lat, lon, v = r.data()
+    assert np.allclose(lat, f.geography.latitudes().flatten()[mask])
+    assert np.allclose(lon, f.geography.longitudes().flatten()[mask])
+    assert np.allclose(v, f.values[mask])
+
+
+def test_grib_crop_polygon():
+    ds, _ = load_grib_data("test.grib", "file")
+    f = ds[0]
+
+    # a triangle covering the western half of the bounding box [60, -10, 40, 20]
+    polygon = [(39, -11), (61, -11), (39, 5)]
+    r = f.crop(polygon)
+
+    lat, lon = f.geography.latlons(flatten=True)
+    lon = np.where(lon > 180, lon - 360, lon)
+    mask = (lat >= 39) & (lon >= -11) & (lat - 39 <= (5 - lon) * 22 / 16)
+    assert r.shape == (mask.sum(),)
+    assert np.allclose(r.values, f.values[mask])
+
+
+def test_grib_crop_polygon_shapely():
+    shapely = pytest.importorskip("shapely")
+
+    ds, _ = load_grib_data("test.grib", "file")
+    f = ds[0]
+
+    r1 = f.crop(shapely.Polygon([(-11, 39), (-11, 61), (21, 61), (21, 39)]))
+    r2 = f.crop([61, -11, 39, 21])
+    assert r1.shape == r2.shape
+    assert np.allclose(r1.values, r2.values)
+
+
+@pytest.mark.parametrize("fl_type", FL_TYPES)
+def test_grib_sel_area(fl_type):
+    ds, _ = load_grib_data("tuv_pl.grib", fl_type)
+    area = [90, 0, 30, 90]
+
+    r = ds.sel({"parameter.variable": "t"}, area=area)
+    assert len(r) == 6
+    ref = ds.sel({"parameter.variable": "t"})
+    mask = _bbox_mask(ref[0], *area)
+    assert r.to_numpy().shape == (6, mask.sum())
+    assert np.allclose(r.to_numpy(), ref.to_numpy(flatten=True)[:, mask])
+    assert np.allclose(r.values, ref.values[:, mask])
+
+    r = ds.sel(area=area)
+    assert len(r) == 18
+
+
+def test_grib_crop_cache(monkeypatch):
+    ds, _ = load_grib_data("tuv_pl.grib", "file")
+    spatial.AREA_SUBSET_CACHE.clear()
+
+    n = 0
+    create = spatial.AreaSubset.__init__
+
+    def _init(self, *args):
+        nonlocal n
+        n += 1
+        create(self, *args)
+
+    monkeypatch.setattr(spatial.AreaSubset, "__init__", _init)
+
+    r = ds.sel(area=[90, 0, 30, 90])
+    assert np.allclose(r.to_numpy()[3], ds[3].to_numpy(flatten=True)[_bbox_mask(ds[3], 90, 0, 30, 90)])
+    # all the fields share the same grid
+    assert n == 1
+
+    ds.sel(area=(90, 0, 30, 90))
+    assert n == 1
+
+    ds.sel(area=[90, 0, 0, 90])
+    assert n == 2
+
+
+def test_points_in_area():
+    lat = np.array([0, 10, 20, 10, 50])
+    lon = np.array([0, 350, 10, 179, 5])
+
+    assert points_in_area(lat, lon, [20, -10, 0, 10]).tolist() == [True, True, True, False, False]
+    assert points_in_area(lat, lon, [90, 0, -90, 360]).tolist() == [True] * 5
+    assert points_in_area(lat, lon, [(-1, -11), (21, -11), (21, 11), (-1, 11)]).tolist() == [
+        True,
+        True,
+        True,
+        False,
+        False,
+    ]
+
+    with pytest.raises(ValueError):
+        points_in_area(lat, lon, [(0, 0), (1, 1)])
+
+
+if __name__ == "__main__":
+    from earthkit.data.utils.testing import main
+
+    main()
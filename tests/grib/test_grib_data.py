@@ -21,7 +21,7 @@ from grib_fixtures import (
     load_grib_data,  # noqa: E402
 )
 
-from earthkit.data import from_source
+from earthkit.data import config, from_source
 from earthkit.data.utils.testing import check_array, check_array_type, earthkit_examples_file
 
 
@@ -259,6 +259,52 @@ def test_grib_to_numpy_18_dtype(fl_type, dtype):
     assert v.dtype == dtype
 
 
+@pytest.mark.parametrize("fl_type", FL_NUMPY)
+@pytest.mark.parametrize("dtype", ["float32", "f4", np.float32, np.dtype("float32")])
+def test_grib_default_array_dtype(fl_type, dtype):
+    f, _ = load_grib_data("tuv_pl.grib", fl_type)
+    ref = f.to_numpy()
+    lat_ref, lon_ref = f[0].geography.latlons()
+
+    with config.temporary("default-array-dtype", dtype):
+        v = f.to_numpy()
+        assert v.dtype == np.float32
+        assert np.allclose(v, ref)
+        assert f[0].to_numpy().dtype == np.float32
+        assert f[0].to_array().dtype == np.float32
+        assert f.data().dtype == np.float32
+
+        lat, lon = f[0].geography.latlons()
+        assert lat.dtype == lon.dtype == np.float32
+        assert np.allclose(lat, lat_ref)
+        assert np.allclose(lon, lon_ref)
+
+        # an explicit dtype takes precedence
+        assert f.to_numpy(dtype=np.float64).dtype == np.float64
+
+    assert f.to_numpy().dtype == np.float64
+
+
+@pytest.mark.parametrize("path,folder", [("tuv_pl.grib", "example"), ("test.grib", "example"), ("t_pl.grib", "data")])
+def test_grib_float32_latlon_native(path, folder):
+    from earthkit.data.readers.grib.handle import (
+        GribCodesLatitudeAccessor,
+        GribCodesLongitudeAccessor,
+        _regular_grid_axes,
+    )
+
+    f, _ = load_grib_data(path, "file", folder=folder)
+    h = f[0]._components["data"].handle.handle._handle
+    # the coordinates are built from the distinct values
+    assert _regular_grid_axes(h) is not None
+
+    lat = GribCodesLatitudeAccessor().get(h, dtype="float32")
+    lon = GribCodesLongitudeAccessor().get(h, dtype="float32")
+    assert lat.dtype == lon.dtype == np.float32
+    assert np.array_equal(lat, f[0].geography.latitudes(dtype=np.float64).flatten().astype(np.float32))
+    assert np.array_equal(lon, f[0].geography.longitudes(dtype=np.float64).flatten().astype(np.float32))
+
+
 @pytest.mark.parametrize("fl_type", FL_TYPES)
 def test_grib_to_numpy_1_index(fl_type):
     ds, array_backend = load_grib_data("test_single.grib", fl_type, folder="data")
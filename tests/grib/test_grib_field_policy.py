@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+
+# (C) Copyright 2020 ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+#
+
+import pickle
+
+import numpy as np
+import pytest
+
+from earthkit.data import config, from_source
+from earthkit.data.utils.testing import earthkit_examples_file
+
+KEYS = ["parameter.variable", "vertical.level", "time.valid_datetime", "metadata.paramId"]
+
+
+def _load(policy, **kwargs):
+    return from_source("file", earthkit_examples_file("tuv_pl.grib"), grib_field_policy=policy, **kwargs).to_fieldlist()
+
+
+@pytest.mark.parametrize("handle_policy", ["cache", "persistent", "temporary"])
+def test_grib_field_policy_temporary(handle_policy):
+    ref = _load("persistent", grib_handle_policy=handle_policy)
+    ds = _load("temporary", grib_handle_policy=handle_policy)
+
+    assert ds.field_policy == "temporary"
+    assert len(ds) == len(ref) == 18
+    assert "_fields" not in ds.__dict__
+
+    # fields are created on demand and not kept
+    assert ds[0] is not ds[0]
+    assert ds.get(KEYS) == ref.get(KEYS)
+    assert np.allclose(ds.to_numpy(), ref.to_numpy())
+    assert "_fields" not in ds.__dict__
+
+    # selections are fieldlists of the same kind
+    r = ds.sel({"parameter.variable": "t"}).order_by("vertical.level")
+    r_ref = ref.sel({"parameter.variable": "t"}).order_by("vertical.level")
+    assert r.field_policy == "temporary"
+    assert r.get(KEYS) == r_ref.get(KEYS)
+    assert r[1:3].get("vertical.level") == [400, 500]
+    assert "_fields" not in r.__dict__
+
+
+def test_grib_field_policy_config():
+    with config.temporary("grib-field-policy", "temporary"):
+        ds = from_source("file", earthkit_examples_file("tuv_pl.grib")).to_fieldlist()
+        assert ds.field_policy == "temporary"
+
+    ds = from_source("file", earthkit_examples_file("tuv_pl.grib")).to_fieldlist()
+    assert ds.field_policy == "persistent"
+
+
+def test_grib_field_policy_columns_cache():
+    ds = _load("temporary")
+
+    res = ds.get_columns(KEYS)
+    for k, v in zip(KEYS, ds.get(KEYS, group_by_key=True)):
+        assert res[k].tolist() == v
+
+    # the columns are cached and shared with the subsets
+    assert set(ds._column_cache) == set(KEYS)
+    assert ds.get_columns("vertical.level")["vertical.level"] is res["vertical.level"]
+    with pytest.raises(ValueError):
+        res["vertical.level"][0] = 1
+
+    r = ds.sel({"parameter.variable": "u"})[2:4]
+    assert r.get_columns("vertical.level")["vertical.level"].tolist() == [700, 500]
+    assert r._column_cache == {}
+
+    # columns requested with astype are not cached
+    res = ds.get_columns("metadata.level", astype=str)
+    assert res["metadata.level"][0] == "1000"
+    assert "metadata.level" not in ds._column_cache
+
+
+@pytest.mark.parametrize("policy", ["path", "memory"])
+def test_grib_field_policy_serialise(policy):
+    ds = _load("temporary")
+    with config.temporary("grib-file-serialisation-policy", policy):
+        ds2 = pickle.loads(pickle.dumps(ds))
+
+    assert ds2.field_policy == "temporary"
+    assert ds2.get(KEYS) == ds.get(KEYS)
+
+
+if __name__ == "__main__":
+    from earthkit.data.utils.testing import main
+
+    main()
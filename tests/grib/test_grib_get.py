@@ -889,6 +889,42 @@ def test_grib_get_core_fl(fl_type, _kwargs, key, expected_value):
     assert res == expected_value, f"fl_type={fl_type}, _kwargs={_kwargs}, key={key}"
 
 
+@pytest.mark.parametrize("fl_type", FL_TYPES)
+@pytest.mark.parametrize("workers", [None, 4])
+def test_grib_get_columns(fl_type, workers):
+    ds, _ = load_grib_data("tuv_pl.grib", fl_type)
+    keys = ["parameter.variable", "vertical.level", "metadata.level", "time.valid_datetime", "metadata.nokey"]
+
+    res = ds.get_columns(keys, workers=workers)
+    assert list(res.keys()) == keys
+
+    ref = ds.get(keys, group_by_key=True)
+    for k, v in zip(keys, ref):
+        assert res[k].tolist() == v, k
+
+    assert res["vertical.level"].dtype == np.int64
+    assert res["metadata.level"].dtype == np.int64
+    assert res["parameter.variable"].dtype == object
+    assert res["metadata.nokey"].dtype == object
+
+
+@pytest.mark.parametrize("fl_type", FL_TYPES)
+def test_grib_get_columns_astype(fl_type):
+    ds, _ = load_grib_data("tuv_pl.grib", fl_type)
+
+    res = ds.get_columns(["vertical.level", "metadata.nokey"], astype=float, default=[None, 1.5])
+    assert res["vertical.level"].dtype == np.float64
+    assert res["vertical.level"][0] == 1000.0
+    assert res["metadata.nokey"].dtype == np.float64
+    assert np.all(res["metadata.nokey"] == 1.5)
+
+    res = ds.get_columns("metadata.level", astype=str)
+    assert res["metadata.level"].tolist() == repeat_list_items(["1000", "850", "700", "500", "400", "300"], 3)
+
+    with pytest.raises(KeyError):
+        ds.get_columns("metadata.nokey", raise_on_missing=True)
+
+
 if __name__ == "__main__":
     from earthkit.data.utils.testing import main
 
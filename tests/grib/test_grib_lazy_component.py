@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+
+# (C) Copyright 2020 ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+#
+
+import datetime
+
+import pytest
+
+from earthkit.data import config, from_source
+from earthkit.data.field.grib.ensemble import GribEnsemble
+from earthkit.data.field.grib.parameter import GribParameter
+from earthkit.data.field.grib.time import GribTime
+from earthkit.data.field.grib.vertical import GribVertical
+from earthkit.data.utils.testing import earthkit_examples_file, earthkit_test_data_file
+
+LAZY_KEYS = [
+    "time.base_datetime",
+    "time.forecast_reference_time",
+    "time.base_date",
+    "time.base_time",
+    "time.step",
+    "time.forecast_period",
+    "time.valid_datetime",
+    "vertical.level",
+    "vertical.level_type",
+    "ensemble.member",
+    "ensemble.realization",
+    "parameter.variable",
+    "parameter.param",
+]
+
+
+class _RecordingHandle:
+    def __init__(self, handle):
+        self.handle = handle
+        self.keys = []
+
+    def get(self, key, *args, **kwargs):
+        self.keys.append(key)
+        return self.handle.get(key, *args, **kwargs)
+
+    def is_defined(self, key):
+        self.keys.append(key)
+        return self.handle.is_defined(key)
+
+
+def _is_built(handler):
+    return "_c__handler" in handler.__dict__
+
+
+@pytest.mark.parametrize(
+    "handler_cls,key,expected_value,expected_keys",
+    [
+        (GribTime, "step", datetime.timedelta(0), ["endStep"]),
+        (GribTime, "base_datetime", datetime.datetime(2018, 8, 1, 12), ["dataDate", "dataTime"]),
+        (GribTime, "valid_datetime", datetime.datetime(2018, 8, 1, 12), ["dataDate", "dataTime", "endStep"]),
+        (GribVertical, "level", 1000, ["typeOfLevel", "level"]),
+        (GribVertical, "level_type", "pressure", ["typeOfLevel"]),
+        (GribEnsemble, "member", "0", ["number"]),
+        (GribParameter, "variable", "t", ["shortName"]),
+    ],
+)
+def test_grib_lazy_component_key(handler_cls, key, expected_value, expected_keys):
+    ds = from_source("file", earthkit_examples_file("tuv_pl.grib")).to_fieldlist()
+    handle = _RecordingHandle(ds[0]._components["time"].handle)
+
+    handler = handler_cls(handle)
+    assert handler.get(key) == expected_value
+    assert handle.keys == expected_keys
+    assert not _is_built(handler)
+
+    # keys without a lazy builder build the whole component
+    handler.get("no_such_key")
+    assert _is_built(handler)
+    n = len(handle.keys)
+    assert handler.get(key) == expected_value
+    assert len(handle.keys) == n
+
+
+def test_grib_lazy_component_eager_policy():
+    ds = from_source("file", earthkit_examples_file("tuv_pl.grib")).to_fieldlist()
+
+    with config.temporary("grib-component-build-policy", "eager"):
+        handle = _RecordingHandle(ds[0]._components["time"].handle)
+        handler = GribTime(handle)
+        assert handler.get("step") == datetime.timedelta(0)
+        assert _is_built(handler)
+        assert "dataDate" in handle.keys
+
+
+@pytest.mark.parametrize("path", [earthkit_examples_file("tuv_pl.grib"), earthkit_test_data_file("t_time_series.grib")])
+def test_grib_lazy_component_same_as_eager(path):
+    with config.temporary("grib-component-build-policy", "eager"):
+        ds = from_source("file", path).to_fieldlist()
+        ref = ds.get(LAZY_KEYS)
+
+    ds = from_source("file", path).to_fieldlist()
+    assert ds.get(LAZY_KEYS) == ref
+
+    ds = from_source("file", path).to_fieldlist()
+    assert len(ds.sel({"time.step": ref[-1][4]})) > 0
+
+
+def test_grib_lazy_component_astype():
+    ds = from_source("file", earthkit_examples_file("tuv_pl.grib")).to_fieldlist()
+    f = ds[0]
+    assert f.get("vertical.level", astype=str) == "1000"
+    assert f.get("ensemble.member", astype=int) == 0
+    assert f.get("parameter.variable", astype=int, default=-1) == -1
+
+
+if __name__ == "__main__":
+    from earthkit.data.utils.testing import main
+
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+
+# (C) Copyright 2020 ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+#
+
+import numpy as np
+import pytest
+
+from earthkit.data import from_source
+from earthkit.data.utils.parallel import SharedArray
+from earthkit.data.utils.testing import earthkit_examples_file
+
+
+def _values(fl):
+    return fl.to_numpy()
+
+
+def _info(fl):
+    return {"param": fl.get("parameter.variable")[0], "levels": fl.get("vertical.level"), "mean": fl.to_numpy().mean()}
+
+
+def _fail(fl):
+    if "v" in fl.get("parameter.variable"):
+        raise ValueError("failed")
+    return fl.to_numpy()
+
+
+@pytest.fixture
+def ds():
+    return from_source("file", earthkit_examples_file("tuv_pl.grib")).to_fieldlist()
+
+
+@pytest.mark.parametrize(
+    "batch_size,workers,expected_shapes",
+    [(None, 3, [(6, 7, 12)] * 3), (10, 1, [(10, 7, 12), (8, 7, 12)]), (10, 2, [(10, 7, 12), (8, 7, 12)])],
+)
+def test_grib_map_batches_batch_size(ds, batch_size, workers, expected_shapes):
+    r = ds.map_batches(_values, batch_size=batch_size, workers=workers)
+    assert [x.shape for x in r] == expected_shapes
+    assert np.allclose(np.concatenate(r), ds.to_numpy())
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_grib_map_batches_group_by(ds, workers):
+    r = ds.map_batches(_info, group_by="parameter.variable", workers=workers)
+    assert [x["param"] for x in r] == ["t", "u", "v"]
+    for x in r:
+        ref = ds.sel({"parameter.variable": x["param"]})
+        assert x["levels"] == ref.get("vertical.level")
+        assert np.isclose(x["mean"], ref.to_numpy().mean())
+
+
+def test_grib_map_batches_shared_memory(ds):
+    r = ds.map_batches(_values, batch_size=9, workers=2)
+    assert all(isinstance(x, SharedArray) for x in r)
+
+    # views remain valid when the original array is deleted
+    v = r[0][1:3]
+    ref = r[0][1:3].copy()
+    del r
+    assert np.allclose(v, ref)
+
+    r = ds.map_batches(_values, batch_size=9, workers=2, shared_memory=False)
+    assert not any(isinstance(x, SharedArray) for x in r)
+    assert np.allclose(np.concatenate(r), ds.to_numpy())
+
+
+def test_grib_map_batches_error(ds):
+    with pytest.raises(ValueError, match="failed"):
+        ds.map_batches(_fail, group_by="parameter.variable", workers=3)
+
+
+if __name__ == "__main__":
+    from earthkit.data.utils.testing import main
+
+    main()
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+
+# (C) Copyright 2020 ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+#
+
+import datetime
+
+import numpy as np
+import pytest
+from grib_fixtures import (
+    FL_NUMPY,  # noqa: E402
+    load_grib_data,  # noqa: E402
+)
+
+from earthkit.data import from_source
+from earthkit.data.utils.spatial import SpatialIndex
+from earthkit.data.utils.testing import earthkit_examples_file, earthkit_test_data_file
+
+
+@pytest.mark.parametrize("fl_type", FL_NUMPY)
+def test_grib_to_pandas_all_points(fl_type):
+    ds, _ = load_grib_data("test.grib", fl_type)
+
+    df = ds.to_pandas()
+    assert list(df.columns) == ["lat", "lon", "value", "datetime"]
+    assert len(df) == 208
+
+    lat, lon = ds[0].geography.latlons(flatten=True)
+    assert np.allclose(df["lat"].values[:104], lat)
+    assert np.allclose(df["lon"].values[104:], lon)
+    assert np.allclose(df["value"].values[:104], ds[0].to_numpy(flatten=True))
+    assert np.allclose(df["value"].values[104:], ds[1].to_numpy(flatten=True))
+    assert df["datetime"].iloc[0] == datetime.datetime(2020, 5, 13, 12)
+
+
+def test_grib_to_pandas_exact_point():
+    ds = from_source("file", earthkit_examples_file("test.grib")).to_fieldlist()
+
+    df = ds.to_pandas(latitude=50, longitude=0)
+    assert len(df) == 2
+    assert np.allclose(df["lat"], 50)
+    assert np.allclose(df["lon"], 0)
+    assert list(df.columns) == ["lat", "lon", "value", "datetime"]
+
+    df = ds.to_pandas(latitude=[50, 40], longitude=[0, 10])
+    assert len(df) == 4
+
+    df = ds.to_pandas(latitude=50.5, longitude=0.5)
+    assert len(df) == 0
+
+
+def test_grib_to_pandas_nearest():
+    ds = from_source("file", earthkit_examples_file("test.grib")).to_fieldlist()
+
+    df = ds.to_pandas(latitude=[51, 39.2], longitude=[1, 11], nearest=1)
+    assert list(df.columns) == ["lat", "lon", "value", "datetime", "point", "distance"]
+    assert len(df) == 4
+    assert df["point"].tolist() == [0, 1, 0, 1]
+    assert df["lat"].tolist() == [50, 40, 50, 40]
+    assert df["lon"].tolist() == [0, 10, 0, 10]
+    assert np.all(df["distance"] < 200)
+
+    ref = ds.to_pandas(latitude=40, longitude=10)
+    assert np.allclose(df["value"].values[[1, 3]], ref["value"].values)
+
+    df = ds[0].to_pandas(latitude=52.5, longitude=2.5, nearest=4)
+    assert len(df) == 4
+    assert sorted(zip(df["lat"], df["lon"])) == [(50, 0), (50, 5), (55, 0), (55, 5)]
+    assert np.all(np.diff(df["distance"].values) >= 0)
+
+
+def test_grib_to_pandas_radius():
+    ds = from_source("file", earthkit_examples_file("test.grib")).to_fieldlist()
+
+    # the grid spacing is 5 degrees, so only the 4 surrounding points are within 400 km
+    df = ds[0].to_pandas(latitude=52.5, longitude=2.5, radius=400)
+    assert len(df) == 4
+    assert sorted(zip(df["lat"], df["lon"])) == [(50, 0), (50, 5), (55, 0), (55, 5)]
+    assert np.all(df["distance"] <= 400)
+
+    df = ds[0].to_pandas(latitude=52.5, longitude=2.5, radius=400, nearest=2)
+    assert len(df) == 2
+
+    df = ds[0].to_pandas(latitude=0, longitude=0, radius=400)
+    assert len(df) == 0
+
+
+def test_grib_to_pandas_wide():
+    ds = from_source("file", earthkit_examples_file("test.grib")).to_fieldlist()
+
+    df = ds.to_pandas(layout="wide")
+    assert df.shape == (2, 104)
+    assert df.index.name == "datetime"
+    assert df.columns.names == ["lat", "lon"]
+    assert np.allclose(df.values, ds.to_numpy(flatten=True))
+
+    df = ds.to_pandas(latitude=[50, 40], longitude=[0, 10], layout="wide")
+    assert df.shape == (2, 2)
+    assert sorted(df.columns) == [(40, 10), (50, 0)]
+
+
+def test_grib_to_pandas_mixed_grids():
+    ds1 = from_source("file", earthkit_examples_file("test.grib")).to_fieldlist()
+    ds2 = from_source("file", earthkit_test_data_file("ll_10_20.grib")).to_fieldlist()
+    ds = ds1.from_fields([ds1[0], ds2[0], ds1[1]])
+
+    df = ds.to_pandas()
+    n1 = ds1[0].to_numpy().size
+    n2 = ds2[0].to_numpy().size
+    assert len(df) == 2 * n1 + n2
+    assert np.allclose(df["value"].values[n1 : n1 + n2], ds2[0].to_numpy(flatten=True))
+
+    df = ds.to_pandas(latitude=50, longitude=0, nearest=1)
+    assert len(df) == 3
+
+    with pytest.raises(ValueError):
+        ds.to_pandas(layout="wide")
+
+
+def _xarray_fieldlist(lat0, shape=(5, 5)):
+    import xarray as xr
+
+    from earthkit.data import from_object
+
+    ds = xr.Dataset(
+        {"t": (("time", "latitude", "longitude"), np.arange(np.prod(shape), dtype=float).reshape(1, *shape))},
+        coords={
+            "time": [np.datetime64("2020-01-01")],
+            "latitude": np.arange(lat0, lat0 + shape[0], dtype=float),
+            "longitude": np.arange(shape[1], dtype=float),
+        },
+    )
+    return from_object(ds).to_fieldlist()
+
+
+def test_grib_to_pandas_same_shape_grids():
+    from earthkit.data.indexing.simple import SimpleFieldList
+
+    # the grid id of these fields is only their shape, it cannot identify the grid
+    ds1 = _xarray_fieldlist(0)
+    ds2 = _xarray_fieldlist(50)
+    assert ds1[0].geography.unique_grid_id() == ds2[0].geography.unique_grid_id()
+
+    df = ds1.to_pandas(latitude=2, longitude=2, nearest=1)
+    assert df["lat"].tolist() == [2]
+    assert df["distance"].tolist() == [0]
+
+    df = ds2.to_pandas(latitude=52, longitude=2, nearest=1)
+    assert df["lat"].tolist() == [52]
+    assert df["distance"].tolist() == [0]
+
+    ds = SimpleFieldList.from_fields([ds1[0], ds2[0], ds1[0]])
+    df = ds.to_pandas(latitude=52, longitude=2, nearest=1)
+    assert df["lat"].tolist() == [4, 52, 4]
+
+    df = ds.to_pandas()
+    assert np.allclose(df["lat"].values[25:50], np.repeat(np.arange(50, 55), 5))
+
+    with pytest.raises(ValueError):
+        ds.to_pandas(layout="wide")
+
+
+def test_grib_to_pandas_mixed_grid_ids():
+    from earthkit.data.indexing.simple import SimpleFieldList
+
+    ds1 = from_source("file", earthkit_examples_file("test.grib")).to_fieldlist()
+    ds2 = _xarray_fieldlist(50, shape=(2, 3))
+    ds = SimpleFieldList.from_fields([ds1[0], ds1[1], ds2[0]])
+
+    df = ds.to_pandas()
+    assert len(df) == 2 * 104 + 6
+    assert np.allclose(df["lat"].values[208:], [50, 50, 50, 51, 51, 51])
+    assert np.allclose(df["value"].values[104:208], ds1[1].to_numpy(flatten=True))
+    assert np.allclose(df["value"].values[208:], np.arange(6))
+
+
+def test_grib_to_pandas_bad_args():
+    ds = from_source("file", earthkit_examples_file("test.grib")).to_fieldlist()
+
+    with pytest.raises(ValueError):
+        ds.to_pandas(latitude=50)
+
+    with pytest.raises(ValueError):
+        ds.to_pandas(nearest=1)
+
+    with pytest.raises(ValueError):
+        ds.to_pandas(layout="long")
+
+
+@pytest.mark.parametrize("use_scipy", [True, False])
+def test_spatial_index(use_scipy):
+    lat, lon = np.meshgrid(np.arange(90, -91, -10.0), np.arange(0, 360, 10.0), indexing="ij")
+    index = SpatialIndex(lat, lon)
+    if not use_scipy:
+        index._tree = None
+
+    point, idx, dist = index.nearest([0.0, 89.0], [1.0, 181.0], n=1)
+    assert point.tolist() == [0, 1]
+    assert lat.ravel()[idx].tolist() == [0, 90]
+    assert lon.ravel()[idx][0] == 0
+    assert np.isclose(dist[0], 111.19, atol=0.1)
+
+    point, idx, dist = index.nearest([5.0], [5.0], n=4)
+    assert len(idx) == 4
+    assert np.all(np.diff(dist) >= 0)
+
+    point, idx, dist = index.within([5.0], [5.0], radius=800)
+    assert sorted(zip(lat.ravel()[idx], lon.ravel()[idx])) == [(0, 0), (0, 10), (10, 0), (10, 10)]
+    assert np.all(np.diff(dist) >= 0)
+
+    point, idx, dist = index.nearest([5.0], [5.0], n=4, radius=10)
+    assert len(idx) == 0
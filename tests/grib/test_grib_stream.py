@@ -9,11 +9,13 @@
 # nor does it submit to any jurisdiction.
 #
 
+import os
+
 import numpy as np
 import pytest
 
 from earthkit.data import concat, from_source
-from earthkit.data.core.temporary import temp_file
+from earthkit.data.core.temporary import temp_directory, temp_file
 from earthkit.data.sources.stream import StreamFieldList
 from earthkit.data.utils.testing import ARRAY_BACKENDS, earthkit_examples_file, earthkit_remote_examples_file
 
@@ -505,6 +507,50 @@ def test_grib_concat_stream_memory():
     assert ds.get(("parameter.variable", "vertical.level")) == ref
 
 
+@pytest.mark.parametrize("batch_size", [1, 5, 18, 100])
+@pytest.mark.parametrize("use_store", [False, True])
+def test_grib_stream_to_xarray_streaming(batch_size, use_store):
+    path = earthkit_examples_file("tuv_pl.grib")
+    ref = from_source("file", path).to_fieldlist().to_xarray()
+
+    with temp_directory() as tmp:
+        ds = from_source("file", path, stream=True).to_fieldlist()
+        r = ds.to_xarray(
+            streaming=True,
+            batch_size=batch_size,
+            coords={"level": ref["level"].values.tolist()},
+            store=tmp if use_store else None,
+        )
+
+        assert r.sizes == ref.sizes
+        assert sorted(r.data_vars) == ["t", "u", "v"]
+        for name in ref.data_vars:
+            assert np.allclose(r[name].values, ref[name].values)
+            assert r[name].attrs.keys() == ref[name].attrs.keys()
+            assert r[name].attrs["units"] == ref[name].attrs["units"]
+
+        if use_store:
+            assert os.path.exists(os.path.join(tmp, "t.npy"))
+            assert np.allclose(np.load(os.path.join(tmp, "t.npy")), ref["t"].values)
+
+        # the stream is consumed
+        with pytest.raises(StopIteration):
+            next(iter(ds))
+
+
+def test_grib_stream_to_xarray_streaming_undeclared_coords():
+    path = earthkit_examples_file("tuv_pl.grib")
+    ds = from_source("file", path, stream=True).to_fieldlist()
+
+    # the first batch only contains 2 levels
+    with pytest.raises(ValueError, match="coords option"):
+        ds.to_xarray(streaming=True, batch_size=6)
+
+    ds = from_source("file", path, stream=True).to_fieldlist()
+    with pytest.raises(ValueError):
+        ds.to_xarray(streaming=True, coords={"unknown": [1, 2]})
+
+
 if __name__ == "__main__":
     from earthkit.data.utils.testing import main
 
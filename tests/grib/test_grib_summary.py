@@ -777,6 +777,47 @@ def test_grib_tail_num(_args, _kwargs, expected_values, fl_type):
     assert expected_values == df.to_dict()
 
 
+@pytest.mark.parametrize("fl_type", FL_TYPES)
+@pytest.mark.parametrize("n", [None, 5, -7])
+def test_grib_ls_chunked(fl_type, n, monkeypatch):
+    ds, _ = load_grib_data("tuv_pl.grib", fl_type)
+    keys = ["parameter.variable", "vertical.level", "time.valid_datetime"]
+    ref = ds.ls(n=n, keys=keys)
+
+    monkeypatch.setattr("earthkit.data.indexing.indexed.SUMMARY_CHUNK_SIZE", 4)
+    df = ds.ls(n=n, keys=keys)
+    pd.testing.assert_frame_equal(df, ref)
+
+
+@pytest.mark.parametrize("fl_type", FL_TYPES)
+def test_grib_describe_chunked(fl_type, monkeypatch):
+    ds, _ = load_grib_data("tuv_pl.grib", fl_type)
+
+    keys = {
+        "metadata.shortName": "shortName",
+        "metadata.typeOfLevel": "typeOfLevel",
+        "metadata.level": "level",
+        "metadata.paramId": "paramId",
+        "metadata.marsClass": "marsClass",
+        "metadata.number": "number",
+    }
+    monkeypatch.setattr(type(ds), "_describe_keys", property(lambda self: keys))
+    monkeypatch.setattr("earthkit.data.indexing.indexed.SUMMARY_CHUNK_SIZE", 4)
+
+    df = ds.describe().data
+    assert df.index.tolist() == [("t", "isobaricInhPa"), ("u", "isobaricInhPa"), ("v", "isobaricInhPa")]
+    assert df["paramId"].tolist() == ["130", "131", "132"]
+    assert df["class"].tolist() == ["od", "od", "od"]
+    assert "number" not in df.columns
+
+    for param in ["t", 130]:
+        df = ds.describe(param).data
+        r = df[0].to_dict()
+        assert r["shortName"] == "t"
+        assert r["paramId"] == "130"
+        assert sorted(r["level"].split(","), key=int) == ["300", "400", "500", "700", "850", "1000"]
+
+
 @pytest.mark.parametrize("fl_type", FL_FILE)
 def test_grib_describe_field_1(fl_type):
     f, _ = load_grib_data("test6.grib", fl_type)
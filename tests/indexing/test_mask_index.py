@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+
+# (C) Copyright 2020 ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+#
+
+import numpy as np
+import pytest
+
+from earthkit.data import from_source
+from earthkit.data.core.index import as_index_array
+from earthkit.data.indexing.indexed import MaskFieldList, MultiFieldList
+from earthkit.data.utils.testing import earthkit_examples_file
+
+
+@pytest.fixture
+def multi_fl():
+    return MultiFieldList([
+        from_source("file", earthkit_examples_file(name)).to_fieldlist() for name in ["tuv_pl.grib", "test6.grib"]
+    ])
+
+
+@pytest.mark.parametrize(
+    "indices,expected",
+    [
+        (range(1, 7, 2), [1, 3, 5]),
+        ([2, 0], [2, 0]),
+        ((3,), [3]),
+        (np.array([4, 1], dtype=np.int32), [4, 1]),
+        ([True, False, True], [0, 2]),
+        ((i for i in [5, 6]), [5, 6]),
+        ([], []),
+    ],
+)
+def test_as_index_array(indices, expected):
+    r = as_index_array(indices)
+    assert r.dtype == np.int64
+    assert r.tolist() == expected
+
+
+def test_as_index_array_bad():
+    with pytest.raises(TypeError):
+        as_index_array([1.0, 2.0])
+
+
+def test_mask_index_nested_is_flat(multi_fl):
+    ref = multi_fl.get("vertical.level")
+
+    r = multi_fl.order_by("vertical.level")
+    assert isinstance(r, MaskFieldList)
+    assert isinstance(r._indices, np.ndarray)
+    assert r.get("vertical.level") == sorted(ref)
+
+    r1 = r.sel({"vertical.level": [500, 850]}).sel({"parameter.variable": "t"})
+    assert isinstance(r1, MaskFieldList)
+    assert r1._index is multi_fl
+    assert r1.get("parameter.variable") == ["t", "t", "t"]
+    assert r1.get("vertical.level") == [500, 850, 850]
+
+    r2 = r1.order_by({"vertical.level": "descending"})
+    assert r2._index is multi_fl
+    assert r2.get("vertical.level") == [850, 850, 500]
+    assert r2.to_numpy().shape == (3, 7, 12)
+
+
+def test_mask_index_getitem(multi_fl):
+    r = multi_fl.order_by("vertical.level")
+    levels = r.get("vertical.level")
+
+    assert r[1::3].get("vertical.level") == levels[1::3]
+    assert r[::-1].get("vertical.level") == levels[::-1]
+    assert r[[-1, 0]].get("vertical.level") == [levels[-1], levels[0]]
+    assert r[np.array([3, 1])].get("vertical.level") == [levels[3], levels[1]]
+
+    mask = np.arange(len(r)) % 2 == 0
+    assert r[mask].get("vertical.level") == levels[::2]
+
+    for x in [r[1::3], r[[-1, 0]], r[mask]]:
+        assert x._index is multi_fl
+
+    assert r[-1].get("vertical.level") == levels[-1]
+    assert r[np.int64(2)].get("vertical.level") == levels[2]
+
+
+if __name__ == "__main__":
+    from earthkit.data.utils.testing import main
+
+    main(__file__)
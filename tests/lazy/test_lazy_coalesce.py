@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+
+# (C) Copyright 2020 ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+#
+
+import itertools
+import threading
+
+import numpy as np
+import pytest
+
+from earthkit.data import config, from_source
+from earthkit.data.field.grib.virtual import FieldLRUCache, RetrievalCoalescer, VirtualGribFieldList
+from earthkit.data.utils import ensure_iterable
+from earthkit.data.utils.request import RequestMapper
+from earthkit.data.utils.testing import earthkit_examples_file
+
+KEYS = {
+    "param": "metadata.paramId",
+    "levtype": "metadata.levtype",
+    "levelist": "metadata.level",
+    "date": "metadata.dataDate",
+    "time": "metadata.dataTime",
+    "step": "metadata.step",
+}
+
+
+class FakeMapper(RequestMapper):
+    def __init__(self, fields):
+        super().__init__({})
+        self.fields = fields
+
+    def _build(self):
+        return [{k: f.get(v) for k, v in KEYS.items()} for f in self.fields]
+
+
+class FakeRetriever:
+    """Return the fields matching a request from a GRIB file in reverse order."""
+
+    def __init__(self, fields, shuffle=True):
+        self.fields = fields
+        self.shuffle = shuffle
+        self.requests = []
+        self.lock = threading.Lock()
+
+    def get(self, request):
+        with self.lock:
+            self.requests.append(request)
+
+        names = list(request.keys())
+        wanted = {tuple(str(v) for v in x) for x in itertools.product(*[ensure_iterable(request[k]) for k in names])}
+        r = [f for f in self.fields if tuple(str(f.get(KEYS[k])) for k in names) in wanted]
+        return r[::-1] if self.shuffle else r
+
+
+@pytest.fixture
+def fields():
+    return from_source("file", earthkit_examples_file("tuv_pl.grib")).to_fieldlist()
+
+
+def test_lazy_coalesce_to_numpy(fields):
+    retriever = FakeRetriever(fields)
+    ds = VirtualGribFieldList(FakeMapper(fields), retriever)
+    assert len(ds) == 18
+
+    r = ds.to_numpy()
+    assert np.allclose(r, fields.to_numpy())
+
+    # a single factorised request
+    assert len(retriever.requests) == 1
+    assert sorted(retriever.requests[0]["param"]) == [130, 131, 132]
+    assert sorted(retriever.requests[0]["levelist"]) == [300, 400, 500, 700, 850, 1000]
+
+    # the fields are now served from the cache
+    for i, f in enumerate(ds):
+        assert np.allclose(f.to_numpy(), fields[i].to_numpy())
+    assert np.allclose(ds.values, fields.values)
+    assert len(retriever.requests) == 1
+
+
+def test_lazy_coalesce_subset(fields):
+    retriever = FakeRetriever(fields)
+    ds = VirtualGribFieldList(FakeMapper(fields), retriever)
+
+    sub = ds[6:12]
+    assert len(sub) == 6
+    assert np.allclose(sub.to_numpy(), fields[6:12].to_numpy())
+
+    for b, ref in zip(ds.batched(4), fields.batched(4)):
+        assert np.allclose(b.to_numpy(), ref.to_numpy())
+
+    # each field was retrieved only once
+    assert sum(np.prod([len(v) for v in r.values()]) for r in retriever.requests) == 18
+
+
+def test_lazy_coalesce_batch_size(fields):
+    retriever = FakeRetriever(fields)
+    ds = VirtualGribFieldList(FakeMapper(fields), retriever)
+
+    with config.temporary("virtual-field-cache-size", 4):
+        assert np.allclose(ds.to_numpy(), fields.to_numpy())
+        assert len(ds.coalescer.cache) == 4
+
+    # at least one request per batch of 4 fields
+    assert len(retriever.requests) >= 5
+
+
+def test_lazy_coalesce_threads(fields):
+    retriever = FakeRetriever(fields)
+    coalescer = RetrievalCoalescer(retriever)
+    requests = FakeMapper(fields).field_requests
+
+    # requests with two distinct levels sets are factorised into two sub-requests
+    requests = [r for r in requests if r["param"] != 132 or r["levelist"] in (500, 700)]
+    with config.temporary("number-of-download-threads", 4):
+        r = coalescer.get(requests)
+
+    assert len(retriever.requests) == 2
+    for f, req in zip(r, requests):
+        assert f.get("metadata.paramId") == req["param"]
+        assert f.get("metadata.level") == req["levelist"]
+
+
+def test_lazy_coalesce_unmatched(fields):
+    class BadRetriever(FakeRetriever):
+        def get(self, request):
+            r = super().get(request)
+            # messages missing from multi-field retrievals
+            return r[:1] if len(r) > 1 else r
+
+    retriever = BadRetriever(fields)
+    coalescer = RetrievalCoalescer(retriever)
+    requests = FakeMapper(fields).field_requests[:3]
+
+    r = coalescer.get(requests)
+    assert [f.get("metadata.paramId") for f in r] == [130, 131, 132]
+    # one multi-field retrieval and a single field retrieval per field
+    assert len(retriever.requests) == 4
+
+
+def test_lazy_coalesce_cache_lru(fields):
+    f = list(fields)
+    cache = FieldLRUCache(2)
+    cache.put("a", f[0])
+    cache.put("b", f[1])
+    assert cache.get("a") is f[0]
+    cache.put("c", f[2])
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert list(cache.fields) == ["a", "c"]
+
+
+if __name__ == "__main__":
+    from earthkit.data.utils.testing import main
+
+    main()
@@ -260,3 +260,43 @@ if __name__ == "__main__":
     from earthkit.data.utils.testing import main
 
     main()
+
+
+@pytest.mark.parametrize("mode", ["nc", "xr"])
+@pytest.mark.parametrize(
+    "subset",
+    [lambda f: f, lambda f: f[3:11:2], lambda f: f[[5, 0, 17, 9]], lambda f: f.order_by("vertical.level")],
+)
+def test_netcdf_values_bulk_read(mode, subset, monkeypatch):
+    from earthkit.data.readers.xarray.variable import Variable
+
+    f = subset(load_nc_or_xr_source(earthkit_examples_file("tuv_pl.nc"), mode))
+
+    ref_values = np.stack([x.values for x in f])
+    ref_numpy = np.stack([x.to_numpy() for x in f])
+
+    reads = []
+    read = Variable.read
+
+    def _read(self, indices):
+        reads.append(self.name)
+        return read(self, indices)
+
+    monkeypatch.setattr(Variable, "read", _read)
+
+    v = f.values
+    assert v.shape == ref_values.shape
+    assert np.array_equal(v, ref_values)
+    # one read per variable
+    assert sorted(reads) == sorted(set(x.get("parameter.variable") for x in f))
+
+    v = f.to_numpy()
+    assert v.shape == ref_numpy.shape
+    assert np.array_equal(v, ref_numpy)
+
+    v = f.to_numpy(flatten=True, dtype=np.float32)
+    assert v.dtype == np.float32
+    assert np.allclose(v, ref_values)
+
+    v = f.to_array(flatten=True)
+    assert np.array_equal(v, ref_values)
@@ -79,6 +79,41 @@ def test_geotiff_immutable_values():
     assert not np.shares_memory(f.values, f.values)
 
 
+@pytest.mark.skipif(NO_RIOXARRAY, reason="rioxarray not available")
+@pytest.mark.with_proj
+def test_geotiff_window():
+    path = earthkit_test_data_file("dgm50hs_col_32_368_5616_nw.tif")
+    ref = from_source("file", path).to_fieldlist()
+    fl = from_source("file", path).to_fieldlist(window=((10, 60), (20, 100)))
+
+    assert len(fl) == 3
+    assert fl[0].shape == (50, 80)
+    assert np.allclose(fl.to_numpy(), ref.to_numpy()[:, 10:60, 20:100], equal_nan=True)
+    assert np.allclose(fl[1].values, ref[1].to_numpy()[10:60, 20:100].flatten(), equal_nan=True)
+    assert np.allclose(fl[0].geography.x(), ref[0].geography.x()[10:60, 20:100])
+
+    ds = from_source("file", path).to_xarray(window=((10, 60), (20, 100)))
+    assert np.allclose(ds["band_1"].values, ref[0].to_numpy()[10:60, 20:100], equal_nan=True)
+
+
+@pytest.mark.skipif(NO_RIOXARRAY, reason="rioxarray not available")
+@pytest.mark.with_proj
+def test_geotiff_bbox():
+    path = earthkit_test_data_file("dgm50hs_col_32_368_5616_nw.tif")
+    ref = from_source("file", path).to_fieldlist()
+
+    bb = ref.geography.bounding_box()
+    south = (bb.north + bb.south) / 2
+    west = (bb.west + bb.east) / 2
+    fl = from_source("file", path).to_fieldlist(bbox=[bb.north, west, south, bb.east])
+
+    ny, nx = fl[0].shape
+    assert 0 < ny < ref[0].shape[0]
+    assert 0 < nx < ref[0].shape[1]
+    # the north-east corner of the raster
+    assert np.allclose(fl.to_numpy(), ref.to_numpy()[:, :ny, -nx:], equal_nan=True)
+
+
 if __name__ == "__main__":
     from earthkit.data.utils.testing import main
 
@@ -11,10 +11,14 @@
 
 
 import mimetypes
+import os
 
+import numpy as np
 import pytest
 
-from earthkit.data.utils.testing import check_unsafe_archives
+from earthkit.data import from_source
+from earthkit.data.core.temporary import temp_directory
+from earthkit.data.utils.testing import check_unsafe_archives, earthkit_examples_file
 
 
 @pytest.mark.skip
@@ -30,6 +34,54 @@ def test_tar_mimetypes():
     assert mimetypes.guess_type("x.tar.bz2") == ("application/x-tar", "bzip2")
 
 
+def _make_tar(path, files, mode="w"):
+    import tarfile
+
+    with tarfile.open(path, mode) as tar:
+        for name, src in files:
+            tar.add(src, arcname=name)
+
+
+@pytest.mark.parametrize("mode,ext,in_place", [("w", ".tar", True), ("w:gz", ".tar.gz", False)])
+def test_tar_grib_in_place(mode, ext, in_place):
+    files = [("b/tuv_pl.grib", earthkit_examples_file("tuv_pl.grib")), ("a.grib", earthkit_examples_file("test.grib"))]
+    ref = from_source("file", [f[1] for f in sorted(files)]).to_fieldlist()
+
+    with temp_directory() as tmpdir:
+        path = os.path.join(tmpdir, "test" + ext)
+        _make_tar(path, files, mode=mode)
+
+        ds = from_source("file", path)
+        assert all(p == path for p in ds.path) == in_place
+
+        fl = ds.to_fieldlist()
+        assert len(fl) == len(ref)
+        assert fl.get("parameter.variable") == ref.get("parameter.variable")
+        for f, f_ref in zip(fl, ref):
+            assert np.allclose(f.values, f_ref.values)
+
+        fl = from_source("file", path, filter="b/*").to_fieldlist()
+        assert len(fl) == 18
+
+
+def test_tar_grib_in_place_mixed():
+    files = [("test.grib", earthkit_examples_file("test.grib")), ("test.nc", earthkit_examples_file("test.nc"))]
+
+    with temp_directory() as tmpdir:
+        path = os.path.join(tmpdir, "test.tar")
+        _make_tar(path, files)
+
+        ds = from_source("file", path)
+        fl = ds.to_fieldlist()
+        assert len(fl) == 4
+        assert fl.get("parameter.variable") == ["2t", "msl", "t2m", "msl"]
+
+        # only the netcdf member is extracted
+        paths = [s.path for s in ds._source.sources]
+        assert paths[0] == path
+        assert paths[1] != path and os.path.basename(paths[1]) == "test.nc"
+
+
 if __name__ == "__main__":
     from earthkit.data.utils.testing import main
 
@@ -9,9 +9,15 @@
 # nor does it submit to any jurisdiction.
 #
 
+import os
+import zipfile
+
+import numpy as np
 import pytest
 
-from earthkit.data.utils.testing import check_unsafe_archives
+from earthkit.data import from_source
+from earthkit.data.core.temporary import temp_directory
+from earthkit.data.utils.testing import check_unsafe_archives, earthkit_examples_file
 
 
 @pytest.mark.skip
@@ -19,6 +25,27 @@ def test_zip_safety():
     check_unsafe_archives(".zip")
 
 
+@pytest.mark.parametrize("compression,in_place", [(zipfile.ZIP_STORED, True), (zipfile.ZIP_DEFLATED, False)])
+def test_zip_grib_in_place(compression, in_place):
+    files = [("b/tuv_pl.grib", earthkit_examples_file("tuv_pl.grib")), ("a.grib", earthkit_examples_file("test.grib"))]
+    ref = from_source("file", [f[1] for f in sorted(files)]).to_fieldlist()
+
+    with temp_directory() as tmpdir:
+        path = os.path.join(tmpdir, "test.zip")
+        with zipfile.ZipFile(path, "w", compression=compression) as z:
+            for name, src in files:
+                z.write(src, arcname=name)
+
+        ds = from_source("file", path)
+        assert all(p == path for p in ds.path) == in_place
+
+        fl = ds.to_fieldlist()
+        assert len(fl) == len(ref)
+        assert fl.get("parameter.variable") == ref.get("parameter.variable")
+        for f, f_ref in zip(fl, ref):
+            assert np.allclose(f.values, f_ref.values)
+
+
 if __name__ == "__main__":
     from earthkit.data.utils.testing import main
 
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+
+# (C) Copyright 2020 ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+#
+
+import os
+import shutil
+
+import pytest
+
+from earthkit.data import from_source
+from earthkit.data.utils.testing import earthkit_examples_file
+
+
+@pytest.fixture
+def grib_tree(tmp_path):
+    root = tmp_path / "data"
+    (root / "sub").mkdir(parents=True)
+    shutil.copy(earthkit_examples_file("test6.grib"), root / "sub" / "a.grib")
+    shutil.copy(earthkit_examples_file("tuv_pl.grib"), root / "b.grib")
+    (root / "readme.txt").write_text("not a GRIB file")
+    return root
+
+
+def test_catalogue_sel(grib_tree, tmp_path):
+    ds = from_source("catalogue", str(grib_tree), db=str(tmp_path / "cat.db"))
+
+    assert len(ds.to_fieldlist()) == 24
+
+    r = ds.sel(shortName="t", level=[500, 850])
+    assert len(r) == 3
+    # the messages are sorted by path: b.grib first, then sub/a.grib
+    assert r.metadata(["shortName", "level"]) == [["t", 850], ["t", 500], ["t", 850]]
+
+    # keys not in the catalogue are selected on the resulting fieldlist
+    r = ds.sel({"metadata.shortName": "u"}, **{"vertical.level": 500})
+    assert r.metadata(["shortName", "level"]) == [["u", 500]]
+
+    r = ds.sel(shortName="unknown")
+    assert len(r) == 0
+
+
+def test_catalogue_pattern(grib_tree, tmp_path):
+    ds = from_source("catalogue", str(grib_tree / "**" / "a.grib"), db=str(tmp_path / "cat.db"))
+    r = ds.sel(shortName="t")
+    assert len(r) == 2
+    assert r.metadata("level") == [1000, 850]
+
+
+def test_catalogue_update(grib_tree, tmp_path):
+    from earthkit.data.sources.catalogue import GribCatalogue
+
+    cat = GribCatalogue(str(tmp_path / "cat.db"))
+    assert cat.update(str(grib_tree)) == 3
+    assert len(cat) == 24
+
+    # unchanged files are not scanned again, also by a new catalogue object
+    assert cat.update(str(grib_tree)) == 0
+    assert GribCatalogue(str(tmp_path / "cat.db")).update(str(grib_tree)) == 0
+
+    # a modified file is scanned again
+    shutil.copy(earthkit_examples_file("test.grib"), grib_tree / "sub" / "a.grib")
+    assert cat.update(str(grib_tree), workers=2) == 1
+    assert len(cat) == 20
+    paths = [os.path.basename(p) for p, *_ in cat.lookup({"shortName": ["2t", "msl"]})]
+    assert paths == ["a.grib", "a.grib"]
+
+    # a deleted file is removed
+    os.remove(grib_tree / "b.grib")
+    assert cat.update(str(grib_tree)) == 0
+    assert len(cat) == 2
+
+    # changing the keys rebuilds the catalogue
+    cat = GribCatalogue(str(tmp_path / "cat.db"), keys=["shortName"])
+    assert len(cat) == 0
+    assert cat.update(str(grib_tree)) == 2
+    assert len(cat) == 2
+
+    with pytest.raises(KeyError):
+        cat.lookup({"level": 500})
+
+
+def test_catalogue_bad_key(tmp_path):
+    from earthkit.data.sources.catalogue import GribCatalogue
+
+    with pytest.raises(ValueError):
+        GribCatalogue(str(tmp_path / "cat.db"), keys=["shortName; DROP TABLE files"])
+
+
+if __name__ == "__main__":
+    from earthkit.data.utils.testing import main
+
+    main(__file__)
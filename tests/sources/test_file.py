@@ -304,7 +304,8 @@ def test_file_grib_zip_with_single_file():
 
         ds = from_source("file", t_path).to_fieldlist()
         assert len(ds) == 2, len(ds)
-        assert os.path.basename(ds.path) == "a.grib"
+        # the GRIB member is read in place from the zip file
+        assert ds.path == t_path
 
 
 def test_file_netcdf_tar_with_single_file():
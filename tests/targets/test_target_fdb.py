@@ -107,3 +107,25 @@ def test_target_fdb_grib_direct_api(per_field):
         assert len(ds) == len(ds1)
         assert ds1.metadata("shortName") == ["2t", "msl"]
         assert np.allclose(ds1.values[:, :4], vals_ref)
+
+
+@pytest.mark.skipif(NO_FDB, reason="No access to FDB")
+@pytest.mark.parametrize("pipeline_kwargs", [{"workers": 2}, {"workers": 2, "batch_size": 2}])
+def test_target_fdb_grib_pipeline(pipeline_kwargs):
+    ds = from_source("file", earthkit_examples_file("test.grib")).to_fieldlist()
+    vals_ref = ds.values[:, :4]
+
+    with temp_directory() as tmpdir:
+        config = make_fdb_config(os.path.join(tmpdir, "_fdb"))
+
+        target = FDBTarget(config=config, **pipeline_kwargs)
+        target.write(ds)
+        target.flush()
+
+        assert target.stats.messages == 2
+        assert target.stats.writes == 2 // pipeline_kwargs.get("batch_size", 1)
+
+        ds1 = from_source("fdb", TEST_GRIB_REQUEST, config=config, stream=False).to_fieldlist()
+        assert len(ds) == len(ds1)
+        assert ds1.metadata("shortName") == ["2t", "msl"]
+        assert np.allclose(ds1.values[:, :4], vals_ref)
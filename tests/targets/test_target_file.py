@@ -91,6 +91,79 @@ def test_target_file_grib_append():
         assert np.allclose(ds1.values[2:, :4], vals_ref)
 
 
+@pytest.mark.parametrize(
+    "pipeline_kwargs",
+    [
+        {"workers": 1},
+        {"workers": 4},
+        {"workers": 4, "max_in_flight": 1},
+        {"workers": 3, "batch_size": 4},
+        {"batch_size": 16},
+    ],
+)
+@pytest.mark.parametrize("stream", [False, True])
+def test_target_file_grib_pipeline(pipeline_kwargs, stream):
+    ds_ref = from_source("file", earthkit_examples_file("tuv_pl.grib")).to_fieldlist()
+    ds = from_source("file", earthkit_examples_file("tuv_pl.grib"), stream=stream).to_fieldlist()
+
+    with temp_file() as path:
+        target = FileTarget(path, **pipeline_kwargs)
+        target.write(ds, encoder="grib", bitsPerValue=12)
+        target.close()
+
+        ds1 = from_source("file", path).to_fieldlist()
+        assert len(ds1) == len(ds_ref)
+        assert ds1.get("metadata.shortName") == ds_ref.get("metadata.shortName")
+        assert ds1.get("metadata.level") == ds_ref.get("metadata.level")
+        assert ds1.get("metadata.bitsPerValue") == [12] * len(ds_ref)
+        assert np.allclose(ds1.values, ds_ref.values, rtol=1e-3, atol=1e-2)
+
+        stats = target.stats
+        assert stats.messages == len(ds_ref)
+        assert stats.bytes == os.path.getsize(path)
+        batch_size = pipeline_kwargs.get("batch_size", 1)
+        assert stats.writes == -(-len(ds_ref) // batch_size)
+        assert stats.elapsed > 0
+        assert stats.as_dict()["messages_per_second"] > 0
+
+
+def test_target_file_grib_pipeline_append():
+    ds = from_source("file", earthkit_examples_file("test.grib")).to_fieldlist()
+    vals_ref = ds.values[:, :4]
+
+    with temp_file() as path:
+        ds.to_target("file", path, workers=2, batch_size=2)
+        ds.to_target("file", path, append=True, workers=2, batch_size=2)
+
+        ds1 = from_source("file", path).to_fieldlist()
+        assert ds1.get("metadata.shortName") == ["2t", "msl"] * 2
+        assert np.allclose(ds1.values[:2, :4], vals_ref)
+        assert np.allclose(ds1.values[2:, :4], vals_ref)
+
+
+def test_target_file_grib_pipeline_file_object():
+    import io
+
+    ds = from_source("file", earthkit_examples_file("test.grib")).to_fieldlist()
+
+    with temp_file() as path:
+        ds.to_target("file", path)
+        with open(path, "rb") as f:
+            ref = f.read()
+
+    f = io.BytesIO()
+    target = FileTarget(f, workers=2, batch_size=8)
+    target.write(ds)
+    target.close()
+    assert f.getvalue() == ref
+    assert target.stats.writes == 1
+
+
+def test_target_file_grib_pipeline_no_stats():
+    with temp_file() as path:
+        assert FileTarget(path).stats is None
+
+
 def test_target_file_grib_non_append():
     ds = from_source("file", earthkit_examples_file("test.grib")).to_fieldlist()
 
@@ -17,7 +17,7 @@ import pytest
 from earthkit.data import from_source
 from earthkit.data.core.temporary import temp_directory
 from earthkit.data.targets import to_target
-from earthkit.data.utils.testing import NO_ZARR
+from earthkit.data.utils.testing import NO_ZARR, earthkit_examples_file
 
 
 @pytest.mark.skipif(NO_ZARR, reason="Zarr not installed")
@@ -61,3 +61,150 @@ def test_target_zarr_from_grib(direct_call):
         for k in ["t", "r", "forecast_reference_time", "step", "level", "latitude", "longitude"]:
             k in root, f"Key {k} not found in Zarr root"
             assert root[k].shape == shapes[k], f"Shape mismatch for {k}: expected {shapes[k]}, got {root[k].shape}"
+
+
+@pytest.mark.skipif(NO_ZARR, reason="Zarr not installed")
+@pytest.mark.parametrize("batch_size,workers", [(None, None), (4, None), (6, 3), (18, None)])
+def test_target_zarr_streaming_from_grib(batch_size, workers):
+    import numpy as np
+    import xarray as xr
+
+    ds = from_source("file", earthkit_examples_file("tuv_pl.grib")).to_fieldlist()
+    ref = ds.to_xarray()
+
+    with temp_directory() as tmp:
+        path = os.path.join(tmp, "_res.zarr")
+        ds.to_target(
+            "zarr",
+            streaming=True,
+            batch_size=batch_size,
+            workers=workers,
+            xarray_to_zarr_kwargs={"store": path},
+        )
+
+        r = xr.open_zarr(path)
+        assert dict(r.sizes) == dict(ref.sizes)
+        for name in ["t", "u", "v"]:
+            assert np.array_equal(r[name].values, ref[name].values)
+        assert r.attrs["earthkit_zarr_stream"]["complete"]
+
+
+@pytest.mark.skipif(NO_ZARR, reason="Zarr not installed")
+@pytest.mark.parametrize("workers", [None, 3])
+def test_target_zarr_streaming_user_chunks(monkeypatch, workers):
+    import threading
+
+    import numpy as np
+    import xarray as xr
+
+    from earthkit.data.targets.zarr import ZarrStreamWriter
+
+    ds = from_source("file", earthkit_examples_file("tuv_pl.grib")).to_fieldlist()
+    ref = ds.to_xarray()
+
+    ori_write_region = ZarrStreamWriter._write_region
+    written = []
+
+    def _recording_write_region(self, name, var, region):
+        written.append((region["level"], threading.current_thread() is threading.main_thread()))
+        return ori_write_region(self, name, var, region)
+
+    monkeypatch.setattr(ZarrStreamWriter, "_write_region", _recording_write_region)
+
+    with temp_directory() as tmp:
+        path = os.path.join(tmp, "_res.zarr")
+        # the chunks span several batches
+        ds.to_target(
+            "zarr",
+            streaming=True,
+            batch_size=2,
+            workers=workers,
+            earthkit_to_xarray_kwargs={"chunks": {"level": 4}},
+            xarray_to_zarr_kwargs={"store": path},
+        )
+
+        r = xr.open_zarr(path)
+        assert r["t"].encoding["chunks"][0] == 4
+        for name in ["t", "u", "v"]:
+            assert np.array_equal(r[name].values, ref[name].values)
+
+    # the regions partly covering a chunk are never written by the workers
+    assert written
+    for region, main_thread in written:
+        if region.start % 4 != 0 or (region.stop % 4 != 0 and region.stop != 6):
+            assert main_thread
+
+
+@pytest.mark.skipif(NO_ZARR, reason="Zarr not installed")
+@pytest.mark.parametrize("batch_size,workers", [(1, None), (2, 2), (3, None)])
+def test_target_zarr_streaming_append_from_stream(batch_size, workers):
+    import numpy as np
+    import xarray as xr
+
+    path = earthkit_examples_file("time_series.grib")
+    ref = from_source("file", path).to_fieldlist().to_xarray()
+    ds = from_source("file", path, stream=True).to_fieldlist()
+
+    with temp_directory() as tmp:
+        out = os.path.join(tmp, "_res.zarr")
+        ds.to_target(
+            "zarr",
+            streaming=True,
+            batch_size=batch_size,
+            workers=workers,
+            append_dim="step",
+            xarray_to_zarr_kwargs={"store": out},
+        )
+
+        r = xr.open_zarr(out)
+        assert dict(r.sizes) == {"step": 4, "latitude": 7, "longitude": 12}
+        assert np.array_equal(r["step"].values, ref["step"].values)
+        for name in ["t", "z"]:
+            assert np.array_equal(r[name].values, ref[name].values)
+
+
+@pytest.mark.skipif(NO_ZARR, reason="Zarr not installed")
+def test_target_zarr_streaming_resume(monkeypatch):
+    import numpy as np
+    import xarray as xr
+
+    from earthkit.data.targets.zarr import ZarrStreamWriter
+
+    ds = from_source("file", earthkit_examples_file("tuv_pl.grib")).to_fieldlist()
+    ref = ds.to_xarray()
+
+    ori_write_region = ZarrStreamWriter._write_region
+    count = {"n": 0}
+
+    def _failing_write_region(self, *args):
+        if count["n"] == 6:
+            raise RuntimeError("interrupted")
+        count["n"] += 1
+        return ori_write_region(self, *args)
+
+    with temp_directory() as tmp:
+        path = os.path.join(tmp, "_res.zarr")
+        kwargs = dict(streaming=True, batch_size=3, xarray_to_zarr_kwargs={"store": path})
+
+        monkeypatch.setattr(ZarrStreamWriter, "_write_region", _failing_write_region)
+        with pytest.raises(RuntimeError):
+            ds.to_target("zarr", **kwargs)
+        monkeypatch.setattr(ZarrStreamWriter, "_write_region", ori_write_region)
+
+        r = xr.open_zarr(path, consolidated=False)
+        assert r.attrs["earthkit_zarr_stream"] == {"batch_size": 3, "batches": 2, "complete": False}
+
+        written = []
+
+        def _counting_write_region(self, name, var, region):
+            written.append(name)
+            return ori_write_region(self, name, var, region)
+
+        monkeypatch.setattr(ZarrStreamWriter, "_write_region", _counting_write_region)
+        ds.to_target("zarr", resume=True, **kwargs)
+        assert len(written) == 12
+
+        r = xr.open_zarr(path)
+        assert r.attrs["earthkit_zarr_stream"]["complete"]
+        for name in ["t", "u", "v"]:
+            assert np.array_equal(r[name].values, ref[name].values)
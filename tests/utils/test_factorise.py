@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+
+# (C) Copyright 2020 ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+#
+
+import pytest
+
+from earthkit.data.utils.availability import Availability
+from earthkit.data.utils.factorise import factorise
+
+
+def test_factorise_mars_list():
+    req = [
+        dict(date=["20200101", "20200102"], param=["t", "u"]),
+        dict(date="20200103", param="t"),
+        dict(date="20200101", param=1, level=2.5),
+    ]
+
+    r = factorise(req)
+    assert r.as_mars_list() == (
+        "date=20200101,level=2.5,param=1\nlevel=-\n date=20200101/to/20200102,param=t/u\n date=20200103,param=t\n"
+    )
+
+
+def test_factorise_count_select_missing():
+    r = factorise([dict(date=["20200101", "20200102"], param=["t", "u"]), dict(date="20200103", param="t")])
+
+    assert r.count() == 5
+    assert r.count(param="t") == 3
+    assert r.select(param="u").as_mars_list() == "date=20200101/to/20200102,param=u\n"
+    assert r.missing(date=["20200103", "20200104"], param=["t", "u"]).as_mars_list() == (
+        "date=20200103,param=u\ndate=20200104,param=t/u\n"
+    )
+
+
+@pytest.mark.timeout(30)
+def test_factorise_large():
+    # a year of hourly data on several levels with a hole
+    dates = [f"2020{m:02d}{d:02d}" for m in range(1, 13) for d in range(1, 29)]
+    hours = [f"{h:02d}00" for h in range(24)]
+    req = [dict(date=d, time=hours, param=["t", "u", "v"], levelist=[1000, 850, 500]) for d in dates]
+    req[10] = dict(date=dates[10], time=hours, param=["t", "u"], levelist=[1000, 850, 500])
+
+    r = factorise(req)
+    assert r.count() == len(dates) * 24 * 9 - 24 * 3
+    assert r.count(date=dates[10], param="v") == 0
+    assert r.missing(date=dates[9:12], param="v", time="0000", levelist=500).as_mars_list() == (
+        f"date={dates[10]},levelist=500,param=v,time=0000\n"
+    )
+
+
+def test_availability_check_reasons():
+    avail = Availability([dict(param=["t", "u"], level=[500, 850]), dict(param="z", level=1000)])
+
+    avail.check(param="t", level=500)
+
+    with pytest.raises(ValueError, match=r"invalid combination \(level=1000 and param=t\)"):
+        avail.check(param="t", level=1000)
+
+    with pytest.raises(ValueError, match="invalid combination"):
+        avail.check(param="x", level=500, step=6)
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+
+# (C) Copyright 2020 ECMWF.
+#
+# This software is licensed under the terms of the Apache Licence Version 2.0
+# which can be obtained at http://www.apache.org/licenses/LICENSE-2.0.
+# In applying this licence, ECMWF does not waive the privileges and immunities
+# granted to it by virtue of its status as an intergovernmental organisation
+# nor does it submit to any jurisdiction.
+#
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from earthkit.data import config, from_source
+from earthkit.data.readers.bufr.handle import BUFRCodesReader
+from earthkit.data.readers.grib.handle import GribCodesReader
+from earthkit.data.utils import message
+from earthkit.data.utils.message import ReaderLRUCache
+from earthkit.data.utils.testing import earthkit_examples_file
+
+
+@pytest.mark.parametrize("pread", [True, False])
+def test_message_reader_at_offset(monkeypatch, pread):
+    monkeypatch.setattr(message, "HAS_PREAD", pread)
+
+    path = earthkit_examples_file("tuv_pl.grib")
+    ds = from_source("file", path).to_fieldlist()
+    parts = [(f._components["data"].handle.offset, f._components["data"].handle.length) for f in ds]
+
+    reader = GribCodesReader(path)
+    for (offset, length), f in zip(parts, ds):
+        h = reader.at_offset(offset, length)
+        assert h.path == path
+        assert h.offset == offset
+        assert h.get("shortName") == f.get("metadata.shortName")
+        assert np.allclose(h.get_values(), f.to_numpy(flatten=True))
+
+
+def test_message_reader_at_offset_bufr():
+    path = earthkit_examples_file("temp_10.bufr")
+    ds = from_source("file", path).to_featurelist()
+
+    reader = BUFRCodesReader(path)
+    for m in ds:
+        h = reader.at_offset(m._offset, m._length)
+        assert h.get("dataCategory") == m.metadata("dataCategory")
+
+
+def test_message_reader_at_offset_threads():
+    path = earthkit_examples_file("tuv_pl.grib")
+    ds = from_source("file", path, grib_handle_policy="temporary").to_fieldlist()
+    ref = ds.to_numpy()
+
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        res = list(ex.map(lambda f: f.to_numpy(), list(ds) * 10))
+
+    for i, v in enumerate(res):
+        assert np.allclose(v, ref[i % len(ds)])
+
+
+def test_message_reader_cache_lru():
+    paths = [earthkit_examples_file(x) for x in ("tuv_pl.grib", "test.grib", "test6.grib")]
+
+    cache = ReaderLRUCache(2)
+    r0 = cache[(paths[0], GribCodesReader)]
+    cache[(paths[1], GribCodesReader)]
+    assert cache[(paths[0], GribCodesReader)] is r0
+
+    # paths[1] is the least recently used
+    cache[(paths[2], GribCodesReader)]
+    assert len(cache) == 2
+    assert cache[(paths[0], GribCodesReader)] is r0
+    assert [k[0] for k in cache.readers] == [paths[2], paths[0]]
+
+
+def test_message_reader_cache_size_config():
+    paths = [earthkit_examples_file(x) for x in ("tuv_pl.grib", "test.grib", "test6.grib")]
+
+    cache = ReaderLRUCache()
+    with config.temporary("message-reader-cache-size", 1):
+        assert cache.size == 1
+        for p in paths:
+            cache[(p, GribCodesReader)]
+        assert len(cache) == 1
+
+    assert cache.size == 32
+
+
+if __name__ == "__main__":
+    from earthkit.data.utils.testing import main
+
+    main()
@@ -9,9 +9,21 @@
 # nor does it submit to any jurisdiction.
 #
 
+import os
+
 import pytest
 
-from earthkit.data.utils.request import RequestBuilder
+from earthkit.data import config, from_source
+from earthkit.data.core.temporary import temp_directory
+from earthkit.data.utils.field_store import FieldStore, normalise_field_value
+from earthkit.data.utils.request import (
+    ExpandedRequestMapper,
+    FieldRequestRetriever,
+    FileRequestRetriever,
+    RequestBuilder,
+    request_retriever,
+)
+from earthkit.data.utils.testing import earthkit_examples_file
 
 
 def normaliser_func(**r):
@@ -398,3 +410,115 @@ def test_utils_request_multi_1(_args, req, _kwargs):
     retriever = RequestBuilder("A", *_args, request=req, normaliser=normaliser_func, **_kwargs)
 
     assert retriever.requests == [REQ_1, REQ_2]
+
+
+class FakeRetriever:
+    """Retrieve fields from tuv_pl.grib and record the requests."""
+
+    def __init__(self, directory, grib=True):
+        self.directory = directory
+        self.grib = grib
+        self.requests = []
+        self.fl = from_source("file", earthkit_examples_file("tuv_pl.grib")).to_fieldlist()
+
+    def __call__(self, request, *args):
+        self.requests.append(request)
+        path = os.path.join(self.directory, f"retrieved_{len(self.requests)}.grib")
+        if not self.grib:
+            with open(path, "w") as f:
+                f.write("not grib")
+            return path
+
+        r = self.fl.sel({"metadata.shortName": request["param"], "metadata.level": request["levelist"]})
+        r.to_target("file", path)
+        return path
+
+
+def _fields(result):
+    ds = from_source("file", result).to_fieldlist()
+    return sorted(ds.get(("metadata.shortName", "metadata.level")))
+
+
+def test_utils_request_expanded_mapper():
+    r = dict(param=["t", "u"], levelist=[500, 850], date="2018-08-01", area=[50, -50, 20, 50])
+    m = ExpandedRequestMapper(r, ["param", "levelist", "date", "step"])
+    assert m.field_keys == ["param", "levelist", "date"]
+    assert m.context == dict(area=[50, -50, 20, 50])
+    assert m.expandable
+    assert len(m) == 4
+    assert m.request_at(1) == dict(param="t", levelist=850, date="2018-08-01")
+
+    m = ExpandedRequestMapper(dict(param="t", step="0/to/12/by/6"), ["param", "step"])
+    assert not m.expandable
+
+
+@pytest.mark.parametrize(
+    "key,v1,v2",
+    [
+        ("date", "2018-08-01", 20180801),
+        ("time", "12:00", 1200),
+        ("time", 12, 1200),
+        ("time", "0000", 0),
+        ("param", "167.128", 167),
+        ("param", "2T", "2t"),
+        ("levelist", "500", 500),
+    ],
+)
+def test_utils_request_normalise_field_value(key, v1, v2):
+    assert normalise_field_value(key, v1) == normalise_field_value(key, v2)
+
+
+def test_utils_request_field_retriever():
+    with temp_directory() as tmp:
+        store = FieldStore(os.path.join(tmp, "store"))
+        fake = FakeRetriever(tmp)
+        retriever = FieldRequestRetriever("A", retriever=fake, store=store)
+
+        base = dict(date="2018-08-01", time="12:00", area=[90, 0, -90, 330])
+        r = retriever.retrieve([dict(param=["t", "u"], levelist=[500, 850], **base)])
+        assert len(fake.requests) == 1
+        assert len(store) == 4
+        assert _fields(r) == [("t", 500), ("t", 850), ("u", 500), ("u", 850)]
+
+        # only the missing fields are retrieved
+        r = retriever.retrieve([dict(param=["t", "u", "v"], levelist=[500, 850], **base)])
+        assert len(fake.requests) == 2
+        assert fake.requests[-1]["param"] == ["v"]
+        assert sorted(fake.requests[-1]["levelist"]) == [500, 850]
+        assert len(store) == 6
+        assert _fields(r) == [("t", 500), ("t", 850), ("u", 500), ("u", 850), ("v", 500), ("v", 850)]
+
+        # everything is in the store
+        r = retriever.retrieve([dict(param=["v", "t"], levelist=[850], **base)])
+        assert len(fake.requests) == 2
+        assert _fields(r) == [("t", 850), ("v", 850)]
+
+        # a different context is not shared
+        r = retriever.retrieve([dict(param=["t"], levelist=[850], **{**base, "area": [50, 0, 0, 30]})])
+        assert len(fake.requests) == 3
+
+
+def test_utils_request_field_retriever_unmatched():
+    with temp_directory() as tmp:
+        store = FieldStore(os.path.join(tmp, "store"))
+        fake = FakeRetriever(tmp, grib=False)
+        retriever = FieldRequestRetriever("A", retriever=fake, store=store)
+
+        r = retriever.retrieve([dict(param=["t", "u"], levelist=[500])])
+        assert r == [(os.path.join(tmp, "retrieved_1.grib"), None)]
+        assert len(store) == 0
+
+        retriever.retrieve([dict(param=["t", "u"], levelist=[500])])
+        assert len(fake.requests) == 2
+
+
+def test_utils_request_retriever_config():
+    with temp_directory() as tmp:
+        assert isinstance(request_retriever("A", lambda r: r), FileRequestRetriever)
+        assert not isinstance(request_retriever("A", lambda r: r), FieldRequestRetriever)
+
+        with config.temporary():
+            config.set({"field-level-request-cache": True, "field-level-request-cache-directory": tmp})
+            r = request_retriever("A", lambda r: r)
+            assert isinstance(r, FieldRequestRetriever)
+            assert r.store.directory == tmp